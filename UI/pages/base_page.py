@@ -1,30 +1,123 @@
+import functools
+import re
+import warnings
+from selenium.common.exceptions import TimeoutException
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from UI.data import OVERLAY
+from UI.utils import perf
+from UI.utils.smart_wait import wait_until
+from UI.utils.state import inject_state
+
+# Esperas después de las cuales la página ya cargó y se capturan métricas de performance
+PAGE_WAIT = re.compile(r"^wait_for_\w+_(page|loaded)$")
+
+
+def _capture_after(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        result = method(self, *args, **kwargs)
+        self.capture_performance(method.__name__)
+        return result
+    return wrapper
+
 
 class BasePage:
 
     def __init__(self, driver: WebDriver, timeout: int = 10) -> None:
         self.driver = driver
 
-    def visit(self, url: str):
-        self.driver.get(url)
+    def __init_subclass__(cls, **kwargs):
+        # Cada wait_for_*_page / wait_for_*_loaded de las páginas captura métricas al terminar
+        super().__init_subclass__(**kwargs)
+        for name, attribute in list(vars(cls).items()):
+            if callable(attribute) and PAGE_WAIT.match(name):
+                setattr(cls, name, _capture_after(attribute))
+
+    def visit(self, url: str, state: dict = None):
+        """
+        Abre la URL. Con 'state' (ver UI/utils/state.py) la página arranca con esa
+        sesión/carrito ya cargados, sin pasar por los formularios.
+        """
+        if state is None:
+            self.driver.get(url)
+        else:
+            inject_state(self.driver, state, url)
+        self.capture_performance("visit")
+
+    # ======================
+    # PERFORMANCE
+    # ======================
+    def capture_performance(self, step: str = "manual"):
+        """
+        Captura las métricas de performance de la página actual si están activadas
+        (--perf-metrics) y avisa con un warning si alguna supera el presupuesto de la página.
+        Retorna las métricas o None.
+        """
+        recorder = getattr(self.driver, "perf_recorder", None)
+        if recorder is None:
+            return None
+        metrics = recorder.capture(self.driver, step)
+        if metrics is not None:
+            for violation in perf.budget_violations(metrics, perf.PAGE_BUDGETS.get(metrics["page"], {})):
+                recorder.violations.append(violation)
+                warnings.warn(f"⚠️ Presupuesto de performance superado: {violation}")
+        return metrics
+
+    def assert_performance_budget(self, **budget):
+        """
+        Falla si las métricas de la página actual superan el presupuesto indicado,
+        p. ej. category.assert_performance_budget(lcp_ms=2500, cls=0.1).
+        Sin --perf-metrics no hace nada.
+        """
+        recorder = getattr(self.driver, "perf_recorder", None)
+        if recorder is None:
+            return
+        metrics = recorder.capture(self.driver, "assert_performance_budget")
+        violations = perf.budget_violations(metrics or {}, budget)
+        assert not violations, f"❌ Presupuesto de performance superado: {'; '.join(violations)}"
+
+    # ======================
+    # ESPERAS (MutationObserver dentro del navegador, ver UI/utils/smart_wait.py)
+    # ======================
+    def wait_visible(self, locator: tuple[By, str], timeout: float = 10):
+        """Espera a que el elemento esté visible y lo retorna."""
+        return wait_until(self.driver, "visible", locator, timeout=timeout)
+
+    def wait_present(self, locator: tuple[By, str], timeout: float = 10):
+        """Espera a que el elemento exista en el DOM (visible o no) y lo retorna."""
+        return wait_until(self.driver, "present", locator, timeout=timeout)
+
+    def wait_clickable(self, locator: tuple[By, str], timeout: float = 10):
+        """Espera a que el elemento esté visible y habilitado y lo retorna."""
+        return wait_until(self.driver, "clickable", locator, timeout=timeout)
+
+    def wait_text(self, locator: tuple[By, str], text: str, timeout: float = 10):
+        """Espera a que el texto visible del elemento sea exactamente 'text' y lo retorna."""
+        return wait_until(self.driver, "text", locator, value=text, timeout=timeout)
+
+    def wait_gone(self, locator: tuple[By, str], timeout: float = 10):
+        """Espera a que ningún elemento del locator esté visible (o no exista)."""
+        return wait_until(self.driver, "gone", locator, timeout=timeout)
 
-    def click(self, locator: tuple[By, str]):
-        self.driver.find_element(*locator).click()
+    def click(self, locator: tuple[By, str], timeout: float = 10):
+        self.wait_clickable(locator, timeout).click()
 
-    def type(self, locator: tuple[By, str], text: str):
-        element = self.driver.find_element(*locator)
+    def type(self, locator: tuple[By, str], text: str, timeout: float = 10):
+        element = self.wait_visible(locator, timeout)
         element.clear()
         element.send_keys(text)
 
-    def text_of_element(self, locator: tuple[By, str]) -> str:
-        return self.driver.find_element(*locator).text
+    def text_of_element(self, locator: tuple[By, str], timeout: float = 10) -> str:
+        return self.wait_visible(locator, timeout).text
 
-    def element_is_visible(self, locator: tuple[By, str]) -> bool:
-        return self.driver.find_element(*locator).is_displayed()
+    def element_is_visible(self, locator: tuple[By, str], timeout: float = 5) -> bool:
+        """True si el elemento se vuelve visible antes de 'timeout' segundos."""
+        try:
+            self.wait_visible(locator, timeout)
+            return True
+        except TimeoutException:
+            return False
 
     def reload(self):
         self.driver.refresh()
@@ -35,6 +128,4 @@ class BasePage:
 
     def wait_for_overlay_to_disappear(self, timeout: int = 20):
         """Espera a que cualquier overlay desaparezca para poder interactuar con elementos."""
-        WebDriverWait(self.driver, timeout).until(
-            EC.invisibility_of_element_located(OVERLAY)
-        )
+        self.wait_gone(OVERLAY, timeout)
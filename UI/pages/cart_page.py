@@ -31,22 +31,16 @@ UI_CHECKOUT_URL = os.getenv("UI_CHECKOUT_URL")
 
 class CartPage(BasePage):
 
-    def load_cart(self):
+    def load_cart(self, state: dict = None):
         base_url = os.getenv("UI_CART_URL")
-        self.visit(base_url)
+        self.visit(base_url, state=state)
 
     def wait_for_cart_loaded(self, with_products: bool = True):
         if with_products:
-            WebDriverWait(self.driver, 15).until(
-                EC.visibility_of_element_located(CART_TITLE)
-            )
-            WebDriverWait(self.driver, 15).until(
-                EC.visibility_of_element_located(CART_ORDER_SUMMARY_TITLE)
-            )
+            self.wait_visible(CART_TITLE, 15)
+            self.wait_visible(CART_ORDER_SUMMARY_TITLE, 15)
         else:
-            WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located(CART_TITLE_EMPTY)
-            )
+            self.wait_visible(CART_TITLE_EMPTY, 10)
 
     # ======================
     # VALIDACIONES DE CARRITO
@@ -77,9 +71,7 @@ class CartPage(BasePage):
     def get_product_quantity(self, product_name: str) -> int:
         self.wait_for_overlay_to_disappear()
         locator = CART_PRODUCT_QUANTITY(product_name)
-        element = WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(locator)
-        )
+        element = self.wait_present(locator, 10)
         return int(element.text)
 
     def get_product_price(self, product_name: str) -> float:
@@ -101,15 +93,13 @@ class CartPage(BasePage):
         """Incrementa la cantidad de un producto, esperando overlay si existe."""
         self.wait_for_overlay_to_disappear()
         locator = CART_PRODUCT_INCREMENT(product_name)
-        WebDriverWait(self.driver, 15).until(EC.element_to_be_clickable(locator))
-        self.click(locator)
+        self.click(locator, timeout=15)
 
     def decrement_product_quantity(self, product_name: str):
         """Decrementa la cantidad de un producto, esperando overlay si existe."""
         self.wait_for_overlay_to_disappear()
         locator = CART_PRODUCT_DECREMENT(product_name)
-        WebDriverWait(self.driver, 15).until(EC.element_to_be_clickable(locator))
-        self.click(locator)
+        self.click(locator, timeout=15)
 
     def remove_product(self, product_name: str):
         self.click(CART_PRODUCT_REMOVE(product_name))
@@ -125,5 +115,5 @@ class CartPage(BasePage):
         self.wait_for_overlay_to_disappear()
         self.click(CART_BUTTON_CHECKOUT)
         WebDriverWait(self.driver, timeout).until(EC.url_to_be(UI_CHECKOUT_URL))
-        WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(CHECKOUT_TITLE))
+        self.wait_present(CHECKOUT_TITLE, timeout)
         return self.driver.current_url == UI_CHECKOUT_URL and self.driver.find_element(*CHECKOUT_TITLE).is_displayed()
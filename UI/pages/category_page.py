@@ -1,7 +1,6 @@
 import os
 import re
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
 from UI.data import (
     CATEGORY_TITLE_MEN_CLOTHES,
@@ -24,6 +23,103 @@ from UI.pages.cart_page import CartPage
 
 load_dotenv()
 
+# Lee todos los productos de la página en una sola llamada a chromedriver.
+# arguments[0]: selector de los contenedores; arguments[1]: prefijo del id de cada elemento.
+PRODUCTS_SNAPSHOT_SCRIPT = """
+const [containerSelector, prefixes] = arguments;
+const isVisible = (el) => {
+    if (!el || el.getClientRects().length === 0) return false;
+    if (el.checkVisibility) {
+        return el.checkVisibility({opacityProperty: true, visibilityProperty: true});
+    }
+    const style = window.getComputedStyle(el);
+    return style.display !== "none" && style.visibility !== "hidden" && style.opacity !== "0";
+};
+const textOf = (el) => (el ? el.innerText.trim() : null);
+const products = [];
+for (const container of document.querySelectorAll(containerSelector)) {
+    const match = /product-content-(\\d+)/.exec(container.id);
+    if (!match) continue;
+    const elements = {};
+    for (const [key, prefix] of Object.entries(prefixes)) {
+        elements[key] = document.getElementById(prefix + match[1]);
+    }
+    const visible = {};
+    for (const [key, el] of Object.entries(elements)) {
+        visible[key] = isVisible(el);
+    }
+    products.push({
+        id: Number(match[1]),
+        name: textOf(elements.name),
+        price: textOf(elements.price),
+        description: textOf(elements.description),
+        visible: visible,
+    });
+}
+return products;
+"""
+
+# Prefijo del id de cada elemento del producto (los mismos locators de UI/data.py)
+PRODUCT_ELEMENT_PREFIXES = {
+    "image": product_image("")[1],
+    "name": product_name("")[1],
+    "description": product_desc("")[1],
+    "price": product_price("")[1],
+    "view_details": product_view_details("")[1],
+    "add_to_cart": product_add_to_cart("")[1],
+}
+
+
+# ======================
+# VALIDACIONES PURAS (sobre el texto de la descripción, sin navegador);
+# las usan CategoryPage y el crawler del catálogo (UI/utils/catalog_crawler.py)
+# ======================
+def parse_products_count(text: str) -> tuple[int, int]:
+    """(mostrados, total) a partir de 'Showing X of Y products'."""
+    match = re.search(r"Showing (\d+) of (\d+) products", text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    raise ValueError(f"No se pudo leer los productos en: {text}")
+
+
+def parse_pagination_info(text: str) -> tuple[int, int]:
+    """(pagina_actual, total_paginas) a partir de '(Page Z of W)'."""
+    match = re.search(r"Page (\d+) of (\d+)", text)
+    if match:
+        return int(match.group(1)), int(match.group(2))
+    raise ValueError(f"No se pudo leer la paginación en: {text}")
+
+
+def check_products_consistency(showing: int, total: int) -> bool:
+    """Lanza AssertionError si se muestran más productos que el total o 'X of 0' con X > 0."""
+    if total == 0 and showing > 0:
+        raise AssertionError("❌ Bug: Se muestran productos pero el total es 0")
+    if showing > total:
+        raise AssertionError(
+            f"❌ Bug: Productos mostrados ({showing}) mayor al total ({total})"
+        )
+    return True
+
+
+def check_pagination_consistency(total: int, current_page: int, total_pages: int) -> bool:
+    """Lanza AssertionError si la paginación no tiene sentido para ese total de productos."""
+    if total == 0:
+        if current_page != 0 or total_pages != 0:
+            raise AssertionError(
+                f"❌ Bug: Si no hay productos, la paginación debería ser Page 0 of 0. "
+                f"Actual: Page {current_page} of {total_pages}"
+            )
+    else:
+        if current_page < 1 or current_page > total_pages:
+            raise AssertionError(
+                f"❌ Bug: Página actual ({current_page}) fuera de rango (1..{total_pages})"
+            )
+        if total_pages < 1:
+            raise AssertionError(
+                f"❌ Bug: Total de páginas inválido ({total_pages})"
+            )
+    return True
+
 
 class CategoryPage(BasePage):
 
@@ -49,150 +145,96 @@ class CategoryPage(BasePage):
     # WAITS
     # ======================
     def wait_for_men_clothes_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_TITLE_MEN_CLOTHES)
-        )
+        self.wait_visible(CATEGORY_TITLE_MEN_CLOTHES, 10)
 
     def wait_for_women_clothes_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_TITLE_WOMEN_CLOTHES)
-        )
+        self.wait_visible(CATEGORY_TITLE_WOMEN_CLOTHES, 10)
 
     def wait_for_electronics_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_TITLE_ELECTRONICS)
-        )
+        self.wait_visible(CATEGORY_TITLE_ELECTRONICS, 10)
 
     def wait_for_books_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_TITLE_BOOKS)
-        )
+        self.wait_visible(CATEGORY_TITLE_BOOKS, 10)
 
     def wait_for_groceries_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_TITLE_GROCERIES)
-        )
+        self.wait_visible(CATEGORY_TITLE_GROCERIES, 10)
 
     # ======================
     # VALIDACIONES DE PÁGINA
     # ======================
     def wait_for_products_loaded(self):
         """Valida que la categoría haya cargado (aunque pueda tener 0 productos)."""
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_DESCRIPTION)
-        )
+        self.wait_visible(CATEGORY_DESCRIPTION, 10)
         # Solo esperar productos si efectivamente hay mostrados > 0
         showing, total = self.get_products_count()
         if showing > 0:
-            WebDriverWait(self.driver, 10).until(
-                EC.visibility_of_element_located(CATEGORY_PRODUCT_CONTAINER)
-            )
+            self.wait_visible(CATEGORY_PRODUCT_CONTAINER, 10)
 
     # ---------- Métodos dinámicos ----------
     def get_products_count(self) -> tuple[int, int]:
         """
         Devuelve (mostrados, total) a partir de 'Showing X of Y products'.
         """
-        text = self.text_of_element(CATEGORY_DESCRIPTION)
-        match = re.search(r"Showing (\d+) of (\d+) products", text)
-        if match:
-            showing = int(match.group(1))
-            total = int(match.group(2))
-            return showing, total
-        raise ValueError(f"No se pudo leer los productos en: {text}")
+        return parse_products_count(self.text_of_element(CATEGORY_DESCRIPTION))
 
     def get_pagination_info(self) -> tuple[int, int]:
         """
         Devuelve (pagina_actual, total_paginas) a partir de '(Page Z of W)'.
         """
-        text = self.text_of_element(CATEGORY_DESCRIPTION)
-        match = re.search(r"Page (\d+) of (\d+)", text)
-        if match:
-            current_page = int(match.group(1))
-            total_pages = int(match.group(2))
-            return current_page, total_pages
-        raise ValueError(f"No se pudo leer la paginación en: {text}")
+        return parse_pagination_info(self.text_of_element(CATEGORY_DESCRIPTION))
 
     def validate_products_consistency(self) -> bool:
         """
         Valida que la cantidad mostrada no sea mayor al total
         y que nunca aparezca 'X of 0' con X > 0.
         """
-        showing, total = self.get_products_count()
-        if total == 0 and showing > 0:
-            raise AssertionError("❌ Bug: Se muestran productos pero el total es 0")
-        if showing > total:
-            raise AssertionError(
-                f"❌ Bug: Productos mostrados ({showing}) mayor al total ({total})"
-            )
-        return True
+        return check_products_consistency(*self.get_products_count())
 
     def validate_pagination_consistency(self) -> bool:
         """
         Valida que la paginación tenga sentido.
         """
-        showing, total = self.get_products_count()
-        current_page, total_pages = self.get_pagination_info()
-
-        if total == 0:
-            if current_page != 0 or total_pages != 0:
-                raise AssertionError(
-                    f"❌ Bug: Si no hay productos, la paginación debería ser Page 0 of 0. "
-                    f"Actual: Page {current_page} of {total_pages}"
-                )
-        else:
-            if current_page < 1 or current_page > total_pages:
-                raise AssertionError(
-                    f"❌ Bug: Página actual ({current_page}) fuera de rango (1..{total_pages})"
-                )
-            if total_pages < 1:
-                raise AssertionError(
-                    f"❌ Bug: Total de páginas inválido ({total_pages})"
-                )
-        return True
+        text = self.text_of_element(CATEGORY_DESCRIPTION)
+        return check_pagination_consistency(parse_products_count(text)[1], *parse_pagination_info(text))
+
+    def get_products_snapshot(self) -> list[dict]:
+        """
+        Devuelve todos los productos de la página en una sola llamada JS:
+        [{"id", "name", "price", "description", "visible": {"image", "name",
+        "description", "price", "view_details", "add_to_cart"}}, ...]
+        en vez de un find_element/is_displayed por cada elemento de cada producto.
+        """
+        return self.driver.execute_script(
+            PRODUCTS_SNAPSHOT_SCRIPT, CATEGORY_PRODUCT_CONTAINER[1], PRODUCT_ELEMENT_PREFIXES
+        )
 
     def get_product_ids_in_page(self) -> list[int]:
         """
         Devuelve todos los IDs de productos visibles en la página actual.
         Se basa en el atributo id="product-content-<n>".
         """
-        elements = self.driver.find_elements(*CATEGORY_PRODUCT_CONTAINER)
-        product_ids = []
-        for el in elements:
-            attr_id = el.get_attribute("id")  # ejemplo: product-content-11
-            match = re.search(r"product-content-(\d+)", attr_id)
-            if match:
-                product_ids.append(int(match.group(1)))
-        return product_ids
+        return [product["id"] for product in self.get_products_snapshot()]
 
-    def validate_product_elements(self, product_id: int) -> bool:
+    def validate_product_elements(self, product_id: int, snapshot: list[dict] = None) -> bool:
         """
         Valida que el producto con cierto ID tenga:
         imagen, nombre, descripción, precio, view details y carrito.
+        Si se pasa un snapshot (get_products_snapshot) se valida sobre él sin volver al navegador.
         """
-        product_locators = [
-            product_image(product_id),
-            product_name(product_id),
-            product_desc(product_id),
-            product_price(product_id),
-            product_view_details(product_id),
-            product_add_to_cart(product_id),
-        ]
-
-        for locator in product_locators:
-            if not self.element_is_visible(locator):
-                return False
-        return True
+        products = snapshot if snapshot is not None else self.get_products_snapshot()
+        product = next((product for product in products if product["id"] == product_id), None)
+        return product is not None and all(product["visible"].values())
 
     # ======================
     # CARRITO
     # ======================
     def get_cart_badge_count(self) -> int:
         """Devuelve el número actual de productos en el carrito (0 si no existe badge)."""
+        # Lectura inmediata: sin productos el badge no existe y no hay nada que esperar
+        badges = self.find_all(CART_BADGE)
         try:
-            text = self.text_of_element(CART_BADGE)
-            return int(text)
-        except Exception:
+            return int(badges[0].text) if badges else 0
+        except ValueError:
             return 0
 
     def add_product_by_id(self, product_id: int):
@@ -210,11 +252,10 @@ class CategoryPage(BasePage):
         self.click(product_add_to_cart(product_id))
 
         try:
-            WebDriverWait(self.driver, 5).until(
-                lambda d: self.get_cart_badge_count() == before + 1
-            )
+            # El navegador avisa apenas cambia el badge (MutationObserver), sin polling
+            self.wait_text(CART_BADGE, str(before + 1), 5)
             return True
-        except Exception:
+        except TimeoutException:
             return False
 
     #Convierte id a name
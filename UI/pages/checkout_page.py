@@ -22,7 +22,10 @@ class CheckoutPage(BasePage):
 
     def is_loaded(self) -> bool:
         """Valida que la página de Checkout se cargó correctamente."""
-        return self.element_is_visible(CHECKOUT_TITLE)
+        loaded = self.element_is_visible(CHECKOUT_TITLE)
+        # A Checkout se llega desde el carrito (sin visit): se capturan aquí sus métricas
+        self.capture_performance("is_loaded")
+        return loaded
 
     def is_customer_info_loaded(self) -> bool:
         """Valida que la sección Customer Info esté visible."""
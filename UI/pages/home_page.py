@@ -112,49 +112,31 @@ class HomePage(BasePage):
 
     # -------- ESPERAS EXPLÍCITAS --------
     def wait_for_signup_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(SIGNUP_PAGE_TITLE)
-        )
+        self.wait_visible(SIGNUP_PAGE_TITLE, 10)
 
     def wait_for_login_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(LOGIN_PAGE_TITLE)
-        )
+        self.wait_visible(LOGIN_PAGE_TITLE, 10)
 
     def wait_for_cart_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CART_TITLE_EMPTY)
-        )
+        self.wait_present(self.CART_TITLE_EMPTY, 10)
 
     def wait_for_men_clothes_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CATEGORY_TITLE_MEN_CLOTHES)
-        )
+        self.wait_present(self.CATEGORY_TITLE_MEN_CLOTHES, 10)
 
     def wait_for_women_clothes_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CATEGORY_TITLE_WOMEN_CLOTHES)
-        )
+        self.wait_present(self.CATEGORY_TITLE_WOMEN_CLOTHES, 10)
 
     def wait_for_electronics_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CATEGORY_TITLE_ELECTRONICS)
-        )
+        self.wait_present(self.CATEGORY_TITLE_ELECTRONICS, 10)
 
     def wait_for_books_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CATEGORY_TITLE_BOOKS)
-        )
+        self.wait_present(self.CATEGORY_TITLE_BOOKS, 10)
 
     def wait_for_groceries_page(self):
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(self.CATEGORY_TITLE_GROCERIES)
-        )
+        self.wait_present(self.CATEGORY_TITLE_GROCERIES, 10)
 
     def wait_for_special_deals_page(self):
         WebDriverWait(self.driver, 10).until(
             EC.url_to_be(os.getenv("UI_SPECIAL_DEALS_URL"))
         )
-        WebDriverWait(self.driver, 10).until(
-            EC.presence_of_element_located(SPECIAL_DEALS_TITLE)
-        )
\ No newline at end of file
+        self.wait_present(SPECIAL_DEALS_TITLE, 10)
\ No newline at end of file
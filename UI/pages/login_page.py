@@ -5,8 +5,6 @@ from UI.data import (
     LOGIN_SUCCESS_MESSAGE,
     LOGIN_PAGE_TITLE,
 )
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import os
 from dotenv import load_dotenv
 from .base_page import BasePage
@@ -33,16 +31,12 @@ class LoginPage(BasePage):
     def wait_for_login_success(self, timeout=5):
         """Espera explícita hasta que aparezca el mensaje Logged In"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self.SUCCESS_MESSAGE)
-            )
+            self.wait_visible(self.SUCCESS_MESSAGE, timeout)
             return True
         except:
             return False
 
     def assert_login_title(self, timeout=5):
         """Valida que estemos en la página de Login (su título)"""
-        WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(self.PAGE_TITLE)
-        )
+        self.wait_visible(self.PAGE_TITLE, timeout)
         assert self.driver.find_element(*self.PAGE_TITLE).text == "Login"
@@ -1,7 +1,6 @@
 import os
 import warnings
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from .base_page import BasePage
 from UI.data import (
     product_image_product_detail,
@@ -34,12 +33,8 @@ class ProductDetailPage(BasePage):
 
     def wait_for_product_loaded(self, product_id: int = 1):
         """Espera a que los elementos principales del producto estén visibles."""
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(product_title_product_detail(product_id))
-        )
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(add_to_cart_button_product_detail(product_id))
-        )
+        self.wait_visible(product_title_product_detail(product_id), 10)
+        self.wait_visible(add_to_cart_button_product_detail(product_id), 10)
 
     def validate_product_elements(self, product_id: int = 1) -> bool:
         """Valida que todos los elementos del product detail estén visibles."""
@@ -69,10 +64,11 @@ class ProductDetailPage(BasePage):
     # CARRITO
     # ======================
     def get_cart_badge_count(self) -> int:
+        # Lectura inmediata: sin productos el badge no existe y no hay nada que esperar
+        badges = self.find_all(CART_BADGE)
         try:
-            text = self.text_of_element(CART_BADGE)
-            return int(text)
-        except Exception:
+            return int(badges[0].text) if badges else 0
+        except ValueError:
             return 0
 
     def add_product_and_validate_badge(self, product_id: int = 1) -> bool:
@@ -80,11 +76,10 @@ class ProductDetailPage(BasePage):
         before = self.get_cart_badge_count()
         self.click(add_to_cart_button_product_detail(product_id))
         try:
-            WebDriverWait(self.driver, 5).until(
-                lambda d: self.get_cart_badge_count() == before + 1
-            )
+            # El navegador avisa apenas cambia el badge (MutationObserver), sin polling
+            self.wait_text(CART_BADGE, str(before + 1), 5)
             return True
-        except Exception:
+        except TimeoutException:
             warnings.warn(f"⚠️ Producto {product_id} NO se pudo agregar al carrito")
             return False
 
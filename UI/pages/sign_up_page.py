@@ -9,8 +9,6 @@ from UI.data import (
     SIGNUP_SUCCESS_MESSAGE,
     SIGNUP_PAGE_TITLE
 )
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import os
 from dotenv import load_dotenv
 
@@ -42,16 +40,12 @@ class SignUpPage(BasePage):
     def wait_for_signup_success(self, timeout=5):
         """Espera explícita hasta que aparezca el mensaje de Signup Successful"""
         try:
-            WebDriverWait(self.driver, timeout).until(
-                EC.visibility_of_element_located(self.SUCCESS_MESSAGE)
-            )
+            self.wait_visible(self.SUCCESS_MESSAGE, timeout)
             return True
         except:
             return False
 
     def assert_signup_title(self, timeout=5):
         """Valida que estemos en la página de Sign Up (título)"""
-        WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(self.PAGE_TITLE)
-        )
+        self.wait_visible(self.PAGE_TITLE, timeout)
         assert self.driver.find_element(*self.PAGE_TITLE).text == "Sign Up"
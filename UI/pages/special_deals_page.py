@@ -1,7 +1,5 @@
 import os
 import re
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from .base_page import BasePage
 from UI.data import CATEGORY_DESCRIPTION
 from dotenv import load_dotenv
@@ -16,9 +14,7 @@ class SpecialDealsPage(BasePage):
 
     def wait_for_page_loaded(self):
         """Espera a que la página cargue su descripción."""
-        WebDriverWait(self.driver, 10).until(
-            EC.visibility_of_element_located(CATEGORY_DESCRIPTION)
-        )
+        self.wait_visible(CATEGORY_DESCRIPTION, 10)
 
     def get_products_count(self) -> tuple[int, int]:
         """
@@ -1,6 +1,15 @@
-from time import sleep
+import os
 import pytest
-from UI.utils.driver_factory import create_driver
+from UI.utils.driver_factory import BLOCKABLE_RESOURCES, block_resources, create_driver
+from UI.utils.driver_pool import DriverPool
+from UI.utils.perf import PerfRecorder
+from UI.utils.state import StateCache, merge_states
+from UI.pages.sign_up_page import SignUpPage
+from UI.pages.login_page import LoginPage
+from UI.pages.home_page import HomePage
+from UI.pages.category_page import CategoryPage
+from UI.pages.cart_page import CartPage
+from UI.utils.faker_data import random_first_name, random_last_name, random_email, random_password, random_zip_code
 
 
 def pytest_addoption(parser):
@@ -9,16 +18,181 @@ def pytest_addoption(parser):
         action="store_true",
         help="Ejecutar pruebas en modo headless (sin interfaz de usuario)"
     )
+    parser.addoption(
+        "--block-resources",
+        default=os.getenv("UI_BLOCK_RESOURCES", ""),
+        help=f"Recursos a bloquear en el navegador, separados por coma: {', '.join(BLOCKABLE_RESOURCES)}"
+    )
+    parser.addoption(
+        "--perf-metrics",
+        action="store_true",
+        default=os.getenv("UI_PERF_METRICS", "").lower() in ("1", "true", "yes"),
+        help="Capturar métricas de performance (LCP, CLS, long tasks, bytes...) de cada página en UI_PERF_PATH"
+    )
 
 
-@pytest.fixture
-def driver(request):
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "allow_resources(*categorias): el test necesita esos recursos aunque se bloqueen con --block-resources"
+    )
+    blocked = [category.strip() for category in config.getoption("--block-resources").split(",") if category.strip()]
+    unknown = set(blocked) - set(BLOCKABLE_RESOURCES)
+    if unknown:
+        raise pytest.UsageError(f"--block-resources: categorías desconocidas {sorted(unknown)}")
+    config._ui_blocked_resources = tuple(blocked)
+    config._ui_perf_recorder = PerfRecorder() if config.getoption("--perf-metrics") else None
+
+
+@pytest.fixture(scope="session")
+def driver_pool(request):
+    """
+    Pool de navegadores de la sesión: Chrome se abre una vez y se resetea
+    entre tests (ver UI/utils/driver_pool.py).
+    """
     headless = request.config.getoption("--headless")
+    blocked = request.config._ui_blocked_resources
+    perf_metrics = request.config._ui_perf_recorder is not None
+    pool = DriverPool(
+        lambda: create_driver(headless=headless, blocked_resources=blocked, perf_metrics=perf_metrics)
+    )
+    request.config._ui_driver_pool = pool
 
-    driver = create_driver(headless=headless)
+    yield pool
+
+    pool.close_all()
+
+
+@pytest.fixture
+def driver(request, driver_pool):
+    driver = driver_pool.acquire()
+
+    # Recursos bloqueados para este test: los de --block-resources menos los de allow_resources
+    allowed = set()
+    for marker in request.node.iter_markers("allow_resources"):
+        allowed.update(marker.args)
+    blocked = tuple(category for category in request.config._ui_blocked_resources if category not in allowed)
+    if blocked != driver.blocked_resources:
+        block_resources(driver, blocked)
+
+    recorder = request.config._ui_perf_recorder
+    if recorder is not None:
+        recorder.test = request.node.nodeid
+        driver.perf_recorder = recorder
 
     yield driver
 
-    # Espera breve antes de cerrar (para que se guarden logs/screenshots si aplica)
-    sleep(2)
-    driver.quit()
+    # Limpia cookies, storage y pestañas y lo deja listo para el siguiente test
+    driver_pool.release(driver)
+
+
+@pytest.fixture(scope="session")
+def ui_states(driver_pool):
+    """Estados de navegador (login, carrito) construidos una vez por sesión (ver UI/utils/state.py)."""
+    return StateCache(driver_pool)
+
+
+def _sign_up_and_login(driver):
+    """Registra un usuario nuevo y hace login por los formularios de la UI."""
+    signup_page = SignUpPage(driver)
+    login_page = LoginPage(driver)
+    email = random_email()
+    password = random_password()
+
+    signup_page.load()
+    signup_page.register_user(
+        first_name=random_first_name(),
+        last_name=random_last_name(),
+        email=email,
+        zip_code=random_zip_code(),
+        password=password,
+    )
+    assert signup_page.wait_for_signup_success(), "❌ El registro no se completó correctamente"
+
+    login_page.load()
+    login_page.login_as_user(email, password)
+    assert login_page.wait_for_login_success(), "❌ No se pudo hacer login"
+    return {"email": email, "password": password}
+
+
+def _add_women_clothes_to_cart(count):
+    """
+    Agrega al carrito los primeros 'count' productos de Women Clothes desde Category.
+    El mismo carrito se inyecta en todos los tests que lo piden y varios lo vacían o
+    compran, así que tiene que vivir solo en el storage del navegador: se verifica que
+    siga ahí sin cookies y se guarda sin ellas.
+    """
+    def build(driver):
+        home_page = HomePage(driver)
+        category_page = CategoryPage(driver)
+        cart_page = CartPage(driver)
+        home_page.load()
+        home_page.go_to_women_clothes()
+        category_page.wait_for_women_clothes_page()
+        category_page.wait_for_products_loaded()
+
+        products = category_page.get_products_snapshot()[:count]
+        assert len(products) == count, f"❌ No hay al menos {count} productos en la categoría"
+        for product in products:
+            assert category_page.add_product_and_validate_badge(product["id"]), (
+                f"❌ No se pudo agregar al carrito el producto id={product['id']}"
+            )
+
+        # Si el carrito dependiera de una sesión del servidor, los tests se pisarían entre sí
+        driver.delete_all_cookies()
+        cart_page.load_cart()
+        cart_page.wait_for_cart_loaded(with_products=True)
+        for product in products:
+            assert cart_page.is_product_in_cart(product["name"]), (
+                f"❌ El carrito no vive solo en el storage del navegador ('{product['name']}' no aparece sin cookies): "
+                "no se puede compartir entre tests"
+            )
+        return {"products": [{"id": product["id"], "name": product["name"]} for product in products]}
+    return build
+
+
+@pytest.fixture
+def logged_in_user(ui_states):
+    """
+    Usuario registrado y logueado una sola vez por sesión: {"state", "email", "password"}.
+    El estado lleva el token de la sesión (cookies y storage) y se abre con
+    page.visit(url, state=user["state"]) sin volver a pasar por el login.
+    """
+    return ui_states.get("logged_in", _sign_up_and_login)
+
+
+@pytest.fixture
+def seeded_cart(ui_states):
+    """
+    Factory: seeded_cart(count, user=None) retorna {"state", "products"} con 'count'
+    productos de Women Clothes en el carrito. El carrito se arma por la UI una vez por
+    cantidad y se guarda sin cookies; con 'user' (ver logged_in_user) se inyecta junto
+    con la sesión de ese usuario.
+    """
+    def seed(count=1, user=None):
+        cart = ui_states.get(f"cart:{count}", _add_women_clothes_to_cart(count), cookies=False)
+        if user is None:
+            return cart
+        return {**cart, "state": merge_states(user["state"], cart["state"])}
+    return seed
+
+
+def pytest_terminal_summary(terminalreporter):
+    recorder = getattr(terminalreporter.config, "_ui_perf_recorder", None)
+    if recorder is not None and recorder.captures:
+        terminalreporter.write_sep("-", "UI performance")
+        terminalreporter.write_line(
+            f"📈 {recorder.captures} capturas en {recorder.path}, {len(recorder.violations)} presupuestos superados"
+        )
+        for violation in recorder.violations[:10]:
+            terminalreporter.write_line(f"   {violation}")
+
+    pool = getattr(terminalreporter.config, "_ui_driver_pool", None)
+    if pool is None or not pool.acquired:
+        return
+    stats = pool.stats()
+    terminalreporter.write_sep("-", "UI driver pool")
+    terminalreporter.write_line(
+        f"🌐 {stats['tests_served']} tests con {stats['browsers_started']} navegadores "
+        f"({stats['quarantined']} en cuarentena)"
+    )
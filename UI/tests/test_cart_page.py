@@ -236,145 +236,104 @@ class TestCartPage:
 
         print(f"✅ Se agregaron correctamente 4 productos desde Category Page al carrito: {selected_products}")
 
-    def test_add_and_remove_from_category_page(self, driver):
+    def test_remove_product_from_seeded_cart(self, driver, seeded_cart):
         """
-        Escenario: agregar un producto desde Category Page,
-        validar en Cart Page, esperar que desaparezca overlay,
-        remover el producto y comprobar carrito vacío.
+        Escenario: abrir Cart Page con un producto ya en el carrito (estado inyectado por
+        seeded_cart, sin pasar por Category Page), esperar que desaparezca overlay,
+        remover el producto y comprobar carrito vacío. Agregar desde Category Page lo
+        cubren test_add_from_category_page y test_add_multiple_from_category_page.
         """
-        home_page = HomePage(driver)
-        category_page = CategoryPage(driver)
         cart_page = CartPage(driver)
 
-        # 1) Ir a Home -> Women Clothes -> esperar categoría y productos
-        home_page.load()
-        home_page.go_to_women_clothes()
-        category_page.wait_for_women_clothes_page()
-        category_page.wait_for_products_loaded()
+        # 1) Carrito con el primer producto de Women Clothes (estado inyectado)
+        cart = seeded_cart(1)
+        product_id = cart["products"][0]["id"]
+        product_name = cart["products"][0]["name"]
 
-        # 2) Obtener primer product_id visible y su nombre
-        product_ids = category_page.get_product_ids_in_page()
-        assert product_ids, "❌ No se encontraron productos en la categoría"
-        product_id = product_ids[0]
-        product_name = category_page.get_product_name(product_id)
-
-        # 3) Agregar al carrito DIRECTAMENTE desde Category
-        assert category_page.add_product_and_validate_badge(product_id), (
-            f"❌ No se pudo agregar al carrito el producto id={product_id} desde Category"
-        )
-
-        # 4) Ir al carrito y esperar que cargue con productos
-        home_page.go_to_cart()
+        # 2) Abrir el carrito y esperar que cargue con productos
+        cart_page.load_cart(state=cart["state"])
         cart_page.wait_for_cart_loaded(with_products=True)
 
-        # 5) Validar que el producto esté en el carrito
+        # 3) Validar que el producto esté en el carrito
         assert cart_page.is_product_in_cart(product_name), (
             f"❌ El producto '{product_name}' (id={product_id}) no está en el carrito"
         )
 
-        # 6) Esperar que desaparezca overlay antes de eliminar
+        # 4) Esperar que desaparezca overlay antes de eliminar
         cart_page.wait_for_overlay_to_disappear()
 
-        # 7) Eliminar producto
+        # 5) Eliminar producto
         cart_page.remove_product(product_name)
 
         cart_page.wait_for_overlay_to_disappear()
 
-        # 8) Validar que el carrito está vacío
+        # 6) Validar que el carrito está vacío
         assert cart_page.is_cart_empty(), (
             f"❌ El carrito no está vacío después de eliminar '{product_name}'"
         )
 
-        print(f"✅ Producto '{product_name}' (id={product_id}) agregado y eliminado correctamente -> carrito vacío")
+        print(f"✅ Producto '{product_name}' (id={product_id}) eliminado correctamente -> carrito vacío")
 
-    def test_add_product_and_proceed_to_checkout(self, driver):
+    def test_proceed_to_checkout_from_seeded_cart(self, driver, logged_in_user, seeded_cart):
         """
-        Escenario: agregar un producto desde Category Page y navegar al Checkout,
-        validando URL y título.
+        Escenario: abrir Cart Page logueado y con un producto ya en el carrito (estado
+        inyectado), navegar al Checkout, validando URL y título.
         """
-        home_page = HomePage(driver)
-        category_page = CategoryPage(driver)
         cart_page = CartPage(driver)
 
-        # 1) Ir a Home -> Women Clothes -> esperar categoría y productos
-        home_page.load()
-        home_page.go_to_women_clothes()
-        category_page.wait_for_women_clothes_page()
-        category_page.wait_for_products_loaded()
+        # 1) Usuario logueado con el primer producto de Women Clothes en el carrito (estado inyectado)
+        cart = seeded_cart(1, user=logged_in_user)
+        product_id = cart["products"][0]["id"]
+        product_name = cart["products"][0]["name"]
 
-        # 2) Obtener primer product_id visible y su nombre
-        product_ids = category_page.get_product_ids_in_page()
-        assert product_ids, "❌ No se encontraron productos en la categoría"
-        product_id = product_ids[0]
-        product_name = category_page.get_product_name(product_id)
-
-        # 3) Agregar producto al carrito desde Category Page (valida badge)
-        assert category_page.add_product_and_validate_badge(product_id), (
-            f"❌ No se pudo agregar al carrito el producto id={product_id} desde Category"
-        )
-
-        # 4) Ir al carrito y esperar que cargue con productos
-        home_page.go_to_cart()
+        # 2) Abrir el carrito y esperar que cargue con productos
+        cart_page.load_cart(state=cart["state"])
         cart_page.wait_for_cart_loaded(with_products=True)
 
-        # 5) Validar que el producto esté en el carrito
+        # 3) Validar que el producto esté en el carrito
         assert cart_page.is_product_in_cart(product_name), (
             f"❌ El producto '{product_name}' (id={product_id}) no está en el carrito"
         )
 
         cart_page.wait_for_overlay_to_disappear()
 
-        # 6) Hacer click en Checkout y validar URL + título
+        # 4) Hacer click en Checkout y validar URL + título
         assert cart_page.proceed_to_checkout_and_validate(), (
             f"❌ Checkout no se abrió correctamente para el producto id={product_id}"
         )
 
-        print(f"✅ Producto id={product_id} agregado y Checkout abierto correctamente")
+        print(f"✅ Checkout abierto correctamente con el producto id={product_id}")
 
-    def test_add_product_and_continue_shopping(self, driver):
+    def test_continue_shopping_from_seeded_cart(self, driver, seeded_cart):
         """
-        Escenario: agregar un producto desde Category Page y luego hacer clic en
-        'Continue Shopping', validando que regrese al Home.
+        Escenario: abrir Cart Page con un producto ya en el carrito (estado inyectado),
+        hacer clic en 'Continue Shopping', validando que regrese al Home.
         """
-        home_page = HomePage(driver)
-        category_page = CategoryPage(driver)
         cart_page = CartPage(driver)
 
-        # 1) Ir a Home -> Women Clothes
-        home_page.load()
-        home_page.go_to_women_clothes()
-        category_page.wait_for_women_clothes_page()
-        category_page.wait_for_products_loaded()
-
-        # 2) Obtener primer producto
-        product_ids = category_page.get_product_ids_in_page()
-        assert product_ids, "❌ No se encontraron productos en la categoría"
-        product_id = product_ids[0]
-        product_name = category_page.get_product_name(product_id)
-
-        # 3) Agregar producto al carrito
-        assert category_page.add_product_and_validate_badge(product_id), (
-            f"❌ No se pudo agregar al carrito id={product_id}"
-        )
+        # 1) Carrito con el primer producto de Women Clothes (estado inyectado)
+        cart = seeded_cart(1)
+        product_id = cart["products"][0]["id"]
+        product_name = cart["products"][0]["name"]
 
-        # 4) Ir al carrito y esperar productos
-        home_page.go_to_cart()
+        # 2) Abrir el carrito y esperar productos
+        cart_page.load_cart(state=cart["state"])
         cart_page.wait_for_cart_loaded(with_products=True)
 
-        # 5) Validar producto en carrito
+        # 3) Validar producto en carrito
         assert cart_page.is_product_in_cart(product_name), (
             f"❌ El producto '{product_name}' no está en el carrito"
         )
 
-        # 6) Ahora esperar a que desaparezca el overlay
+        # 4) Ahora esperar a que desaparezca el overlay
         cart_page.wait_for_overlay_to_disappear()
 
-        # 7) Click en Continue Shopping
+        # 5) Click en Continue Shopping
         cart_page.continue_shopping()
 
-        # 8) Validar que regresamos al Home
+        # 6) Validar que regresamos al Home
         assert driver.current_url == UI_BASE_URL, (
             f"❌ No regresó al Home. URL actual: {driver.current_url}"
         )
 
-        print(f"✅ Producto id={product_id} agregado y regreso al Home correctamente")
+        print(f"✅ Regreso al Home correctamente con el producto id={product_id} en el carrito")
@@ -1,9 +1,18 @@
 import os
 import pytest
 import warnings
-from UI.pages.category_page import CategoryPage
-
-
+from UI.pages.category_page import (
+    CategoryPage,
+    check_pagination_consistency,
+    check_products_consistency,
+    parse_pagination_info,
+    parse_products_count,
+)
+from UI.utils.catalog_crawler import CATEGORIES, crawl_catalog
+
+
+# Valida que la imagen de cada producto sea visible: necesita cargar imágenes
+@pytest.mark.allow_resources("images")
 class TestCategoryPage:
 
     def test_men_clothes_category(self, driver):
@@ -26,11 +35,13 @@ class TestCategoryPage:
         assert total >= 0, "❌ El total de productos no puede ser negativo"
 
         # Validar elementos de cada producto visible en la página
-        product_ids = category.get_product_ids_in_page()
+        # (un solo snapshot: una llamada JS con todos los productos y sus elementos)
+        snapshot = category.get_products_snapshot()
+        product_ids = [product["id"] for product in snapshot]
         assert product_ids, "❌ No se encontraron productos visibles en la página"
 
         for pid in product_ids:
-            assert category.validate_product_elements(pid), (
+            assert category.validate_product_elements(pid, snapshot), (
                 f"❌ El producto con ID {pid} no tiene todos los elementos visibles"
             )
 
@@ -61,11 +72,13 @@ class TestCategoryPage:
         showing, total = category.get_products_count()
         assert total >= 0, "❌ El total de productos no puede ser negativo"
 
-        product_ids = category.get_product_ids_in_page()
+        # Un solo snapshot (una llamada JS) con todos los productos y sus elementos
+        snapshot = category.get_products_snapshot()
+        product_ids = [product["id"] for product in snapshot]
         assert product_ids, "❌ No se encontraron productos visibles en la página"
 
         for pid in product_ids:
-            assert category.validate_product_elements(pid), (
+            assert category.validate_product_elements(pid, snapshot), (
                 f"❌ Women Clothes - producto {pid} no tiene todos los elementos visibles"
             )
 
@@ -95,11 +108,13 @@ class TestCategoryPage:
         showing, total = category.get_products_count()
         assert total >= 0, "❌ El total de productos no puede ser negativo"
 
-        product_ids = category.get_product_ids_in_page()
+        # Un solo snapshot (una llamada JS) con todos los productos y sus elementos
+        snapshot = category.get_products_snapshot()
+        product_ids = [product["id"] for product in snapshot]
         assert product_ids, "❌ No se encontraron productos visibles en la página"
 
         for pid in product_ids:
-            assert category.validate_product_elements(pid), (
+            assert category.validate_product_elements(pid, snapshot), (
                 f"❌ Electronics - producto {pid} no tiene todos los elementos visibles"
             )
 
@@ -129,11 +144,13 @@ class TestCategoryPage:
         showing, total = category.get_products_count()
         assert total >= 0, "❌ El total de productos no puede ser negativo"
 
-        product_ids = category.get_product_ids_in_page()
+        # Un solo snapshot (una llamada JS) con todos los productos y sus elementos
+        snapshot = category.get_products_snapshot()
+        product_ids = [product["id"] for product in snapshot]
         assert product_ids, "❌ No se encontraron productos visibles en la página"
 
         for pid in product_ids:
-            assert category.validate_product_elements(pid), (
+            assert category.validate_product_elements(pid, snapshot), (
                 f"❌ Books - producto {pid} no tiene todos los elementos visibles"
             )
 
@@ -163,11 +180,13 @@ class TestCategoryPage:
         showing, total = category.get_products_count()
         assert total >= 0, "❌ El total de productos no puede ser negativo"
 
-        product_ids = category.get_product_ids_in_page()
+        # Un solo snapshot (una llamada JS) con todos los productos y sus elementos
+        snapshot = category.get_products_snapshot()
+        product_ids = [product["id"] for product in snapshot]
         assert product_ids, "❌ No se encontraron productos visibles en la página"
 
         for pid in product_ids:
-            assert category.validate_product_elements(pid), (
+            assert category.validate_product_elements(pid, snapshot), (
                 f"❌ Groceries - producto {pid} no tiene todos los elementos visibles"
             )
 
@@ -181,4 +200,47 @@ class TestCategoryPage:
                 bugs.append(pid)
 
         if bugs:
-            warnings.warn(f"⚠️ Total de productos que no se agregaron al carrito: {bugs}")
\ No newline at end of file
+            warnings.warn(f"⚠️ Total de productos que no se agregaron al carrito: {bugs}")
+
+    def test_catalog_crawl_all_categories(self, driver):
+        """
+        Recorre las cinco categorías y todas sus páginas en pestañas concurrentes de un
+        mismo navegador y valida cada página apenas llega (consistencia de productos y
+        paginación, título, número de página y elementos de cada producto).
+        """
+        errors = []
+        pages = {}
+        for result in crawl_catalog(driver):
+            where = f"{result['category']} (página {result['page']})"
+            pages.setdefault(result["category"], []).append(result["page"])
+            if result["error"]:
+                errors.append(f"{where}: {result['error']}")
+                continue
+            try:
+                showing, total = parse_products_count(result["description"])
+                current_page, total_pages = parse_pagination_info(result["description"])
+                check_products_consistency(showing, total)
+                check_pagination_consistency(total, current_page, total_pages)
+
+                expected_title = CATEGORIES[result["category"]][1]
+                assert result["title"] == expected_title, (
+                    f"❌ Título incorrecto: esperado '{expected_title}', encontrado '{result['title']}'"
+                )
+                if total:
+                    assert current_page == result["page"], (
+                        f"❌ La URL pidió la página {result['page']} pero se muestra la {current_page}"
+                    )
+                assert len(result["products"]) == showing, (
+                    f"❌ Dice 'Showing {showing}' pero hay {len(result['products'])} productos"
+                )
+                for product in result["products"]:
+                    assert all(product["visible"].values()), (
+                        f"❌ El producto con ID {product['id']} no tiene todos los elementos visibles"
+                    )
+            except (AssertionError, ValueError) as err:
+                errors.append(f"{where}: {err}")
+            else:
+                print(f"✅ {where}: {len(result['products'])} productos en {result['elapsed_ms']} ms")
+
+        assert set(pages) == set(CATEGORIES), f"❌ No se recorrieron todas las categorías: {sorted(pages)}"
+        assert not errors, "❌ Errores en el catálogo:\n" + "\n".join(errors)
@@ -1,8 +1,6 @@
 import os
 import pytest
 from UI.utils.faker_data import random_first_name, random_last_name, random_email, random_zip_code,random_city, random_address, random_phone, random_country
-from UI.pages.home_page import HomePage
-from UI.pages.category_page import CategoryPage
 from UI.pages.cart_page import CartPage
 from UI.pages.checkout_page import CheckoutPage
 
@@ -25,23 +23,12 @@ checkout_cases = [
 ]
 
 @pytest.mark.parametrize("case", checkout_cases)
-def test_checkout_fields(driver, case):
-    home_page = HomePage(driver)
-    category_page = CategoryPage(driver)
+def test_checkout_fields(driver, logged_in_user, seeded_cart, case):
     cart_page = CartPage(driver)
     checkout_page = CheckoutPage(driver)
 
-    # Flujo rápido hasta Checkout
-    home_page.load()
-    home_page.go_to_women_clothes()
-    category_page.wait_for_women_clothes_page()
-    category_page.wait_for_products_loaded()
-
-    product_id = category_page.get_product_ids_in_page()[0]
-    product_name = category_page.get_product_name(product_id)
-    category_page.add_product_and_validate_badge(product_id)
-
-    home_page.go_to_cart()
+    # Flujo rápido hasta Checkout: usuario logueado con un producto en el carrito (estado inyectado)
+    cart_page.load_cart(state=seeded_cart(1, user=logged_in_user)["state"])
     cart_page.wait_for_cart_loaded(with_products=True)
     cart_page.proceed_to_checkout_and_validate()
     assert checkout_page.is_loaded()
@@ -87,23 +74,12 @@ def test_checkout_fields(driver, case):
 # -----------------------------------
 # Caso especial: email inválido
 # -----------------------------------
-def test_checkout_invalid_email_format(driver):
-    home_page = HomePage(driver)
-    category_page = CategoryPage(driver)
+def test_checkout_invalid_email_format(driver, logged_in_user, seeded_cart):
     cart_page = CartPage(driver)
     checkout_page = CheckoutPage(driver)
 
-    # Flujo rápido hasta Checkout
-    home_page.load()
-    home_page.go_to_women_clothes()
-    category_page.wait_for_women_clothes_page()
-    category_page.wait_for_products_loaded()
-
-    product_id = category_page.get_product_ids_in_page()[0]
-    product_name = category_page.get_product_name(product_id)
-    category_page.add_product_and_validate_badge(product_id)
-
-    home_page.go_to_cart()
+    # Flujo rápido hasta Checkout: usuario logueado con un producto en el carrito (estado inyectado)
+    cart_page.load_cart(state=seeded_cart(1, user=logged_in_user)["state"])
     cart_page.wait_for_cart_loaded(with_products=True)
     cart_page.proceed_to_checkout_and_validate()
     assert checkout_page.is_loaded()
@@ -2,6 +2,7 @@ import pytest
 import warnings
 from UI.pages.product_detail_page import ProductDetailPage
 
+@pytest.mark.allow_resources("images")
 @pytest.mark.parametrize("product_id", [2, 4])
 def test_product_detail_page(driver, product_id):
     """
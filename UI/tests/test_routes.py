@@ -0,0 +1,52 @@
+import pytest
+from UI import data
+from UI.utils.route_checker import ROUTES, check_routes, has_element, locator_element, locator_hrefs, page_elements
+
+
+# Sin navegador: las rutas se piden por HTTP, todas en paralelo y una sola vez por módulo
+@pytest.fixture(scope="module")
+def route_results():
+    return check_routes()
+
+
+@pytest.mark.parametrize("name", list(ROUTES))
+def test_route_is_served(route_results, name):
+    url, _markers = ROUTES[name]
+    if not url:
+        pytest.skip(f"⚠️ La URL de '{name}' no está configurada en el .env")
+
+    result = route_results[name]
+    assert result["error"] is None, f"❌ No se pudo pedir {url}: {result['error']}"
+    assert result["status"] == 200, f"❌ {url} respondió {result['status']}"
+    assert not result["missing"], f"❌ {url} no contiene los títulos esperados: {result['missing']}"
+
+
+def test_home_links_to_every_route(route_results):
+    home = route_results.get("home")
+    if home is None:
+        pytest.skip("⚠️ UI_BASE_URL no está configurada en el .env")
+    assert home["error"] is None, f"❌ No se pudo pedir el Home: {home['error']}"
+
+    # Cada href que usan los locators (navbar y categorías) tiene que estar enlazado en el Home
+    missing = sorted(locator_hrefs() - home["links"])
+    assert not missing, f"❌ El Home no enlaza a: {missing}"
+
+
+def test_title_marker_does_not_match_navbar_text():
+    # "Sign Up" y "Special Deals" están en el navbar de todas las páginas: no alcanza con el texto
+    navbar = page_elements('<nav><a href="/signup">Sign Up</a><a href="/deals">Special Deals</a></nav>')
+    assert not has_element(navbar, locator_element(data.SIGNUP_PAGE_TITLE))
+    assert not has_element(navbar, locator_element(data.SPECIAL_DEALS_TITLE))
+
+
+def test_title_marker_matches_tag_attributes_and_text():
+    page = page_elements(
+        '<nav><a href="/deals">Special Deals</a></nav>'
+        '<main><h1 id="category-title">Special Deals<br></h1><div>Sign Up</div></main>'
+    )
+    assert has_element(page, locator_element(data.SPECIAL_DEALS_TITLE))
+    assert has_element(page, locator_element(data.SIGNUP_PAGE_TITLE))
+    assert not has_element(page, locator_element(data.CATEGORY_TITLE_BOOKS))
+
+    other_title = page_elements('<h1 class="category-title">Special Deals</h1>')
+    assert not has_element(other_title, locator_element(data.SPECIAL_DEALS_TITLE))
@@ -0,0 +1,129 @@
+"""
+Crawler del catálogo: recorre las cinco categorías, y cada página de su paginación,
+en pestañas concurrentes de un mismo navegador.
+
+Las cargas se lanzan sin esperar (location.href en cada pestaña) y luego se revisan
+las pestañas en ronda con un chequeo instantáneo; cada página se entrega apenas está
+lista, así el tiempo total queda acotado por la página más lenta y no por la suma.
+La primera página de cada categoría dice cuántas hay ("Page 1 of W") y ahí se
+encolan las demás.
+"""
+import os
+import time
+from urllib.parse import urlencode, urlsplit, urlunsplit, parse_qsl
+
+from dotenv import load_dotenv
+from selenium.common.exceptions import WebDriverException
+
+from UI.data import CATEGORY_DESCRIPTION, CATEGORY_PRODUCT_CONTAINER
+from UI.pages.category_page import (
+    PRODUCTS_SNAPSHOT_SCRIPT,
+    PRODUCT_ELEMENT_PREFIXES,
+    parse_pagination_info,
+)
+
+load_dotenv()
+
+# Categoría -> (URL, título esperado en h1#category-title)
+CATEGORIES = {
+    "men_clothes": (os.getenv("UI_MEN_CLOTHES_URL"), "Men's Clothes"),
+    "women_clothes": (os.getenv("UI_WOMEN_CLOTHES_URL"), "Women's Clothes"),
+    "electronics": (os.getenv("UI_ELECTRONICS_URL"), "Electronics"),
+    "books": (os.getenv("UI_BOOKS_URL"), "Books"),
+    "groceries": (os.getenv("UI_GROCERIES_URL"), "Groceries"),
+}
+# Parámetro de la URL con el número de página (?page=N)
+UI_CATEGORY_PAGE_PARAM = os.getenv("UI_CATEGORY_PAGE_PARAM", "page")
+# Pestañas abiertas a la vez
+UI_CRAWLER_TABS = int(os.getenv("UI_CRAWLER_TABS", "6"))
+
+# Chequeo instantáneo (no espera): retorna null si la página todavía no está lista
+READY_SCRIPT = """
+const [descriptionId, containerSelector] = arguments;
+if (document.readyState === "loading") return null;
+const description = document.getElementById(descriptionId);
+const text = description ? description.innerText.trim() : "";
+if (!text) return null;
+const showing = /Showing (\\d+) of/.exec(text);
+if (showing && Number(showing[1]) > 0 && !document.querySelector(containerSelector)) return null;
+const title = document.getElementById("category-title");
+return {url: location.href, description: text, title: title ? title.innerText.trim() : null};
+"""
+
+
+def page_url(url: str, page: int) -> str:
+    """URL de la página 'page' de una categoría (la 1 es la URL base)."""
+    if page == 1:
+        return url
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query))
+    query[UI_CATEGORY_PAGE_PARAM] = str(page)
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+def crawl_catalog(driver, categories=CATEGORIES, tabs: int = UI_CRAWLER_TABS, timeout: float = 30):
+    """
+    Generador: entrega un dict por cada página del catálogo apenas termina de cargar:
+    {"category", "page", "url", "title", "description", "products", "elapsed_ms", "error"}.
+    'products' es el snapshot de CategoryPage.get_products_snapshot(); si la página no
+    cargó en 'timeout' segundos, 'error' explica por qué y 'products' queda vacío.
+    """
+    queue = [(name, url, 1) for name, (url, _title) in categories.items() if url]
+    active = {}  # handle de la pestaña -> (categoría, url base, página, inicio)
+    original = driver.current_window_handle
+    started = time.perf_counter()
+
+    try:
+        while queue or active:
+            # Abrir pestañas hasta el límite; la carga arranca sin esperar a que termine
+            while queue and len(active) < max(1, tabs):
+                name, url, page = queue.pop(0)
+                driver.switch_to.new_window("tab")
+                driver.execute_script("window.location.href = arguments[0];", page_url(url, page))
+                active[driver.current_window_handle] = (name, url, page, time.perf_counter())
+
+            ready_in_round = False
+            for handle, (name, url, page, opened) in list(active.items()):
+                result = {
+                    "category": name, "page": page, "url": page_url(url, page), "title": None,
+                    "description": None, "products": [], "elapsed_ms": None, "error": None,
+                }
+                driver.switch_to.window(handle)
+                try:
+                    state = driver.execute_script(READY_SCRIPT, CATEGORY_DESCRIPTION[1], CATEGORY_PRODUCT_CONTAINER[1])
+                except WebDriverException:
+                    # La pestaña todavía está cambiando de documento
+                    state = None
+                if state is None and time.perf_counter() - opened < timeout:
+                    continue
+
+                if state is None:
+                    result["error"] = f"la página no cargó en {timeout}s"
+                else:
+                    result.update(url=state["url"], title=state["title"], description=state["description"])
+                    result["products"] = driver.execute_script(
+                        PRODUCTS_SNAPSHOT_SCRIPT, CATEGORY_PRODUCT_CONTAINER[1], PRODUCT_ELEMENT_PREFIXES
+                    )
+                    if page == 1:
+                        try:
+                            _current, total_pages = parse_pagination_info(state["description"])
+                        except ValueError:
+                            total_pages = 1
+                        queue.extend((name, url, next_page) for next_page in range(2, total_pages + 1))
+                result["elapsed_ms"] = round((time.perf_counter() - opened) * 1000, 1)
+
+                del active[handle]
+                driver.close()
+                # Volver a una pestaña abierta: new_window falla si la actual se cerró
+                driver.switch_to.window(original)
+                ready_in_round = True
+                yield result
+
+            if active and not ready_in_round:
+                time.sleep(0.05)
+    finally:
+        for handle in list(active):
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(original)
+        print(f"🕷️ Catálogo recorrido en {time.perf_counter() - started:.1f}s")
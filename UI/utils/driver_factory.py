@@ -1,9 +1,42 @@
 import tempfile
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service as ChromeService
-from webdriver_manager.chrome import ChromeDriverManager
+from UI.utils import perf, smart_wait
+from UI.utils.driver_resolver import resolve_chromedriver
 
-def create_driver(headless: bool = False):
+# Recursos que se pueden bloquear con CDP (Network.setBlockedURLs) para acelerar las cargas.
+# Los tests funcionales no miran imágenes, fuentes ni analítica; la página carga igual sin ellos.
+BLOCKABLE_RESOURCES = {
+    "images": [
+        "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico",
+        "*/_next/image*",
+    ],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*fonts.googleapis.com*", "*fonts.gstatic.com*"],
+    # Scripts de terceros conocidos (analítica, tags, monitoreo)
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+        "*/_vercel/insights/*", "*/_vercel/speed-insights/*", "*vitals.vercel-insights.com*",
+        "*hotjar.com*", "*segment.io*", "*segment.com*", "*sentry.io*", "*facebook.net*",
+    ],
+}
+
+
+def block_resources(driver, categories=()):
+    """
+    Bloquea en el navegador las categorías de recursos indicadas (ver BLOCKABLE_RESOURCES).
+    Con una lista vacía se desbloquea todo. Se puede llamar en cualquier momento:
+    aplica a las peticiones siguientes.
+    """
+    unknown = set(categories) - set(BLOCKABLE_RESOURCES)
+    if unknown:
+        raise ValueError(f"Categorías de recursos desconocidas: {sorted(unknown)}")
+    patterns = [pattern for category in categories for pattern in BLOCKABLE_RESOURCES[category]]
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
+    driver.blocked_resources = tuple(categories)
+
+
+def create_driver(headless: bool = False, blocked_resources=(), perf_metrics: bool = False):
     options = webdriver.ChromeOptions()
 
     # Configs necesarias en Linux CI
@@ -12,6 +45,11 @@ def create_driver(headless: bool = False):
     options.add_argument("--disable-gpu")  
     options.add_argument("--disable-software-rasterizer")
 
+    # Las pestañas en segundo plano (crawler del catálogo) cargan y ejecutan JS sin frenos
+    options.add_argument("--disable-background-timer-throttling")
+    options.add_argument("--disable-renderer-backgrounding")
+    options.add_argument("--disable-backgrounding-occluded-windows")
+
     # Forzar tamaño de ventana
     options.add_argument("--window-size=1920,1080")
 
@@ -24,9 +62,21 @@ def create_driver(headless: bool = False):
         options.add_argument("--headless=new")
 
     driver = webdriver.Chrome(
-        service=ChromeService(ChromeDriverManager().install()),
+        # Ruta cacheada por máquina (ver UI/utils/driver_resolver.py)
+        service=ChromeService(resolve_chromedriver()),
         options=options,
     )
 
-    driver.implicitly_wait(5)
+    # Perfil temporal: se borra al cerrar el navegador (ver UI/utils/driver_pool.py)
+    driver.user_data_dir = user_data_dir
+    driver.blocked_resources = ()
+    if blocked_resources:
+        block_resources(driver, blocked_resources)
+    # Métricas de performance por página (ver UI/utils/perf.py); el recorder lo asigna el fixture
+    driver.perf_recorder = None
+    if perf_metrics:
+        perf.install(driver)
+    # Sin implicit wait: cada espera es explícita y acotada (ver UI/utils/smart_wait.py)
+    driver.implicitly_wait(0)
+    driver.set_script_timeout(smart_wait.SCRIPT_TIMEOUT)
     return driver
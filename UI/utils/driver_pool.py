@@ -0,0 +1,143 @@
+import os
+import shutil
+import threading
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+load_dotenv()
+
+# Tamaño máximo del pool de cada proceso (los navegadores se crean recién cuando se piden).
+# Por defecto 1: los tests de un proceso corren de a uno, y con pytest-xdist cada worker
+# tiene su propio pool.
+UI_DRIVER_POOL_SIZE = int(os.getenv("UI_DRIVER_POOL_SIZE", "0")) or 1
+UI_BASE_URL = os.getenv("UI_BASE_URL")
+
+
+def reset_driver(driver, origins=()):
+    """
+    Deja el navegador como recién abierto: una sola pestaña, sin alertas,
+    sin cookies ni localStorage/sessionStorage, y en about:blank.
+    """
+    # Cerrar las pestañas extra y volver a la primera
+    handles = driver.window_handles
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    try:
+        driver.switch_to.alert.dismiss()
+    except NoAlertPresentException:
+        pass
+
+    # El storage es por origen: se limpia el de la página actual y el de la app
+    driver.execute_script("try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}")
+    driver.delete_all_cookies()
+    for origin in origins:
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+    driver.get("about:blank")
+    driver.implicitly_wait(0)
+
+
+def is_healthy(driver) -> bool:
+    """Un navegador sano responde a un script trivial; uno caído lanza WebDriverException."""
+    try:
+        return driver.execute_script("return 1") == 1
+    except WebDriverException:
+        return False
+
+
+class DriverPool:
+    """
+    Pool de navegadores Chrome de larga vida para toda la sesión.
+
+    Cada test toma un navegador con acquire() y lo devuelve con release(), que lo
+    resetea (pestañas, cookies y storage) en vez de cerrarlo. Así abrir y cerrar
+    Chrome se paga una vez por navegador y no una vez por test. Los navegadores
+    que no pasan el chequeo de salud o no se pueden resetear se ponen en
+    cuarentena: se cierran y se reemplazan por uno nuevo.
+    """
+
+    def __init__(self, factory, size: int = UI_DRIVER_POOL_SIZE, base_url: str = UI_BASE_URL):
+        self.factory = factory
+        self.size = max(1, size)
+        self.origins = []
+        if base_url:
+            url = urlsplit(base_url)
+            self.origins.append(f"{url.scheme}://{url.netloc}")
+        self._idle = []
+        self._created = 0
+        self._available = threading.Semaphore(self.size)
+        self._lock = threading.Lock()
+        self.quarantined = []
+        self.acquired = 0
+
+    def acquire(self, blocking: bool = True):
+        """
+        Retorna un navegador sano del pool (o uno nuevo si no hay libres).
+        Con blocking=False retorna None en vez de esperar si el pool está lleno.
+        """
+        if not self._available.acquire(blocking):
+            return None
+        try:
+            while True:
+                with self._lock:
+                    driver = self._idle.pop() if self._idle else None
+                if driver is None:
+                    driver = self.factory()
+                    with self._lock:
+                        self._created += 1
+                if is_healthy(driver):
+                    with self._lock:
+                        self.acquired += 1
+                    return driver
+                self._quarantine(driver, "no pasó el chequeo de salud")
+        except BaseException:
+            self._available.release()
+            raise
+
+    def release(self, driver):
+        """Resetea el navegador y lo devuelve al pool (o lo pone en cuarentena si falla)."""
+        try:
+            reset_driver(driver, self.origins)
+        except WebDriverException as err:
+            self._quarantine(driver, f"no se pudo resetear: {err.msg or type(err).__name__}")
+        else:
+            with self._lock:
+                self._idle.append(driver)
+        finally:
+            self._available.release()
+
+    def _quarantine(self, driver, reason):
+        print(f"⚠️ Navegador en cuarentena ({reason}); se reemplaza por uno nuevo")
+        with self._lock:
+            self.quarantined.append(reason)
+        quit_driver(driver)
+
+    def close_all(self):
+        with self._lock:
+            drivers, self._idle = self._idle, []
+        for driver in drivers:
+            quit_driver(driver)
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "browsers_started": self._created,
+            "tests_served": self.acquired,
+            "quarantined": len(self.quarantined),
+        }
+
+
+def quit_driver(driver):
+    """Cierra el navegador (aunque ya esté caído) y borra su perfil temporal."""
+    try:
+        driver.quit()
+    except WebDriverException:
+        pass
+    user_data_dir = getattr(driver, "user_data_dir", None)
+    if user_data_dir:
+        shutil.rmtree(user_data_dir, ignore_errors=True)
@@ -0,0 +1,137 @@
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+from dotenv import load_dotenv
+from filelock import FileLock
+
+load_dotenv()
+
+# Ruta fija de chromedriver (se usa tal cual, sin validar ni descargar nada)
+CHROMEDRIVER_PATH = os.getenv("CHROMEDRIVER_PATH")
+# Caché por máquina con la ruta del chromedriver que corresponde al Chrome instalado
+UI_DRIVER_CACHE_PATH = os.getenv(
+    "UI_DRIVER_CACHE_PATH", str(Path.home() / ".cache" / "project-automation-qa" / "chromedriver.json")
+)
+
+CHROME_BINARIES = [
+    os.getenv("CHROME_BINARY"),
+    "google-chrome",
+    "google-chrome-stable",
+    "chromium",
+    "chromium-browser",
+    "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+]
+
+_VERSION = re.compile(r"(\d+)\.\d+\.\d+")
+
+# Ruta ya resuelta en este proceso: los siguientes drivers no tocan disco ni red
+_resolved = None
+
+
+def _major_version(command):
+    """Retorna la versión mayor que imprime '<command> --version', o None."""
+    try:
+        output = subprocess.run(
+            [command, "--version"], capture_output=True, text=True, timeout=10
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = _VERSION.search(output)
+    return int(match.group(1)) if match else None
+
+
+def local_chrome_major():
+    """Versión mayor del Chrome instalado (sin red), o None si no se encuentra."""
+    for binary in CHROME_BINARIES:
+        if not binary:
+            continue
+        path = binary if os.path.isabs(binary) else shutil.which(binary)
+        if path and os.path.exists(path):
+            major = _major_version(path)
+            if major:
+                return major
+    if sys.platform == "win32":
+        # En Windows 'chrome --version' no imprime nada: se lee del registro
+        try:
+            import winreg
+            with winreg.OpenKey(winreg.HKEY_CURRENT_USER, r"Software\Google\Chrome\BLBeacon") as key:
+                return int(winreg.QueryValueEx(key, "version")[0].split(".")[0])
+        except (OSError, ValueError):
+            return None
+    return None
+
+
+def _read_cache(path):
+    try:
+        with open(path, encoding="utf-8") as cache_file:
+            return json.load(cache_file)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def _write_cache(path, data):
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".chromedriver-", suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+        json.dump(data, tmp_file)
+    os.replace(tmp_path, path)
+
+
+def _find_chromedriver(chrome_major):
+    """
+    Busca un chromedriver compatible con 'chrome_major': primero el del PATH
+    (sin red) y si no hay, lo descarga una vez con webdriver-manager.
+    """
+    on_path = shutil.which("chromedriver")
+    if on_path and (chrome_major is None or _major_version(on_path) == chrome_major):
+        return on_path
+
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_chromedriver(cache_path=UI_DRIVER_CACHE_PATH):
+    """
+    Retorna la ruta del chromedriver para el Chrome local.
+
+    La primera vez en la máquina se busca (o descarga) y se guarda en un caché
+    protegido por file lock, así todos los workers y corridas reutilizan la misma
+    ruta. En cada proceso se valida una sola vez que la versión mayor del chromedriver
+    guardado sea la del Chrome instalado (sin red); si Chrome se actualizó, se vuelve
+    a resolver.
+    """
+    global _resolved
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+    if _resolved is not None:
+        return _resolved
+
+    cache_path = Path(cache_path)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    chrome_major = local_chrome_major()
+
+    with FileLock(f"{cache_path}.lock"):
+        entry = _read_cache(cache_path)
+        path = entry.get("path")
+        cached_is_valid = (
+            path
+            and os.path.exists(path)
+            # Si no se pudo leer la versión de Chrome se confía en el caché; si no, el
+            # chromedriver guardado tiene que ser de la misma versión mayor que Chrome
+            and (chrome_major is None or entry.get("driver_major") == chrome_major)
+        )
+        if not cached_is_valid:
+            path = _find_chromedriver(chrome_major)
+            _write_cache(cache_path, {
+                "path": path,
+                "chrome_major": chrome_major,
+                "driver_major": _major_version(path),
+            })
+
+    _resolved = path
+    return path
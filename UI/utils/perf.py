@@ -0,0 +1,182 @@
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from dotenv import load_dotenv
+from filelock import FileLock
+from selenium.common.exceptions import WebDriverException
+
+load_dotenv()
+
+# Serie de tiempo con las métricas de cada página (una línea JSON por captura)
+UI_PERF_PATH = os.getenv(
+    "UI_PERF_PATH", str(Path(__file__).resolve().parents[2] / "reports" / "ui_perf.jsonl")
+)
+
+# Presupuestos por página (umbrales "buenos" de Web Vitals). Se pueden cambiar con
+# UI_PERF_BUDGETS='{"Category": {"lcp_ms": 2000}}'; las claves son métricas de collect().
+DEFAULT_BUDGET = {"lcp_ms": 2500, "cls": 0.1}
+PAGE_BUDGETS = {
+    page: dict(DEFAULT_BUDGET) for page in ("Home", "Category", "PDP", "Cart", "Checkout", "SpecialDeals")
+}
+for _page, _budget in json.loads(os.getenv("UI_PERF_BUDGETS", "{}")).items():
+    PAGE_BUDGETS.setdefault(_page, {}).update(_budget)
+
+# Páginas conocidas a partir de las URLs del .env (la más específica primero)
+PAGE_URLS = [
+    ("Checkout", os.getenv("UI_CHECKOUT_URL")),
+    ("Cart", os.getenv("UI_CART_URL")),
+    ("PDP", os.getenv("UI_PRODUCT_URL")),
+    ("SpecialDeals", os.getenv("UI_SPECIAL_DEALS_URL")),
+    ("Login", os.getenv("UI_LOGIN_URL")),
+    ("SignUp", os.getenv("UI_SIGNUP_URL")),
+    *[("Category", os.getenv(name)) for name in (
+        "UI_MEN_CLOTHES_URL", "UI_WOMEN_CLOTHES_URL", "UI_ELECTRONICS_URL", "UI_BOOKS_URL", "UI_GROCERIES_URL",
+    )],
+]
+
+# Se instala en cada documento nuevo (CDP Page.addScriptToEvaluateOnNewDocument)
+# para observar LCP, CLS y long tasks desde el inicio de la carga.
+OBSERVER_SCRIPT = """
+(() => {
+    const perf = window.__qaPerf = {lcp: null, cls: 0, longTasks: 0, longTaskMs: 0};
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(callback))
+                .observe({type: type, buffered: true});
+        } catch (e) {}
+    };
+    observe("largest-contentful-paint", (entry) => { perf.lcp = entry.startTime; });
+    observe("layout-shift", (entry) => { if (!entry.hadRecentInput) perf.cls += entry.value; });
+    observe("longtask", (entry) => { perf.longTasks += 1; perf.longTaskMs += entry.duration; });
+})();
+"""
+
+COLLECT_SCRIPT = """
+const nav = performance.getEntriesByType("navigation")[0] || {};
+const resources = performance.getEntriesByType("resource");
+const observed = window.__qaPerf || {};
+const round = (value) => (typeof value === "number" ? Math.round(value * 10) / 10 : null);
+return {
+    url: location.href,
+    time_origin: performance.timeOrigin,
+    ttfb_ms: round(nav.responseStart),
+    dom_content_loaded_ms: round(nav.domContentLoadedEventEnd),
+    load_ms: round(nav.loadEventEnd),
+    lcp_ms: round(observed.lcp),
+    cls: Math.round((observed.cls || 0) * 10000) / 10000,
+    long_tasks: observed.longTasks || 0,
+    long_task_ms: round(observed.longTaskMs || 0),
+    resources: resources.length,
+    transfer_bytes: (nav.transferSize || 0) + resources.reduce((sum, r) => sum + (r.transferSize || 0), 0),
+};
+"""
+
+# Métricas de CDP Performance.getMetrics que se guardan (en segundos o unidades de Chrome)
+CDP_METRICS = ("TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration", "JSHeapUsedSize", "Nodes")
+
+
+def install(driver):
+    """Activa la captura de métricas en el navegador (observers + dominio Performance de CDP)."""
+    driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": OBSERVER_SCRIPT})
+    driver.execute_cdp_cmd("Performance.enable", {})
+
+
+def page_name(url):
+    """Nombre de la página (Home, Category, PDP, Cart, Checkout...) según las URLs del .env."""
+    path = urlsplit(url).path.rstrip("/")
+    for name, page_url in PAGE_URLS:
+        page_path = urlsplit(page_url).path.rstrip("/") if page_url else ""
+        if page_path and path.startswith(page_path):
+            return name
+    return "Home" if path == "" else path
+
+
+def collect(driver):
+    """Métricas de la página actual: Navigation Timing, LCP, CLS, long tasks, bytes y CDP."""
+    metrics = driver.execute_script(COLLECT_SCRIPT)
+    cdp = driver.execute_cdp_cmd("Performance.getMetrics", {})
+    metrics["cdp"] = {
+        metric["name"]: metric["value"] for metric in cdp.get("metrics", []) if metric["name"] in CDP_METRICS
+    }
+    metrics["page"] = page_name(metrics["url"])
+    return metrics
+
+
+# Métricas que pertenecen a la carga del documento: en una navegación del lado del
+# cliente (pushState, sin documento nuevo) siguen siendo las de la primera página
+DOCUMENT_METRICS = ("ttfb_ms", "dom_content_loaded_ms", "load_ms", "lcp_ms")
+# Métricas acumuladas en el documento: en una navegación del lado del cliente se
+# guarda solo lo que sumaron desde la captura anterior
+CUMULATIVE_METRICS = ("cls", "long_tasks", "long_task_ms", "resources", "transfer_bytes")
+
+
+def soft_navigation(metrics, previous):
+    """
+    Métricas de una navegación del lado del cliente (mismo time_origin que la
+    captura anterior, otra URL): sin las de carga del documento y con los
+    acumulados como diferencia respecto de 'previous'.
+    """
+    soft = {**metrics, "navigation": "soft"}
+    for name in DOCUMENT_METRICS:
+        soft[name] = None
+    for name in CUMULATIVE_METRICS:
+        if metrics.get(name) is not None and previous.get(name) is not None:
+            soft[name] = round(metrics[name] - previous[name], 4)
+    return soft
+
+
+def budget_violations(metrics, budget):
+    """Lista de mensajes por cada métrica que supera su presupuesto."""
+    violations = []
+    for name, limit in budget.items():
+        value = metrics.get(name)
+        if value is not None and value > limit:
+            violations.append(f"{metrics.get('page')}: {name} = {value} (presupuesto {limit})")
+    return violations
+
+
+class PerfRecorder:
+    """Agrega capturas al archivo JSONL (con file lock, por si corren varios workers)."""
+
+    def __init__(self, path=UI_PERF_PATH):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = FileLock(f"{self.path}.lock")
+        self.captures = 0
+        self.violations = []
+        # nodeid del test en curso (lo actualiza el fixture driver)
+        self.test = None
+        # Por navegador: (time_origin, URL con la que se cargó el documento, última captura)
+        self._documents = {}
+
+    def capture(self, driver, step):
+        """Captura las métricas de la página actual, las guarda y retorna (o None si falla)."""
+        try:
+            metrics = collect(driver)
+        except WebDriverException as err:
+            print(f"⚠️ No se pudieron capturar métricas de performance: {err.msg}")
+            return None
+        metrics = self._classify(driver.session_id, metrics)
+        entry = {"ts": time.time(), "test": self.test, "step": step, **metrics}
+        with self._lock, open(self.path, "a", encoding="utf-8") as perf_file:
+            perf_file.write(json.dumps(entry) + "\n")
+        self.captures += 1
+        return metrics
+
+    def _classify(self, session_id, metrics):
+        """
+        Marca la captura como 'hard' (documento nuevo) o 'soft' (la SPA cambió la URL
+        sin recargar: el time_origin es el mismo pero la URL no es la del documento).
+        """
+        document = self._documents.get(session_id)
+        if document is None or document[0] != metrics["time_origin"]:
+            self._documents[session_id] = (metrics["time_origin"], metrics["url"], metrics)
+            return {**metrics, "navigation": "hard"}
+        time_origin, url, previous = document
+        self._documents[session_id] = (time_origin, url, metrics)
+        if metrics["url"] == url:
+            return {**metrics, "navigation": "hard"}
+        return soft_navigation(metrics, previous)
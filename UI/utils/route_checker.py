@@ -0,0 +1,190 @@
+"""
+Chequeo de rutas por HTTP, sin navegador.
+
+Las rutas UI_*_URL son estáticas: basta pedir cada una por HTTP (en paralelo, sobre
+una sesión con pool de conexiones) y validar el status y los títulos clave del HTML
+que sirve el servidor: cada locator XPath de título (//h1[@id='category-title' and
+text()='Books']) se busca como elemento (tag, atributos y texto propio), no como
+texto suelto, porque textos como "Sign Up" o "Special Deals" están en el navbar de
+todas las páginas. También se revisa que el Home enlace a cada ruta que usan
+los locators de UI/data.py. La navegación con Selenium queda para los casos que
+dependen del enrutamiento del lado del cliente.
+"""
+import os
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from html.parser import HTMLParser
+from urllib.parse import urljoin, urlsplit
+
+import requests
+from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+
+from UI import data
+
+load_dotenv()
+
+UI_BASE_URL = os.getenv("UI_BASE_URL")
+UI_ROUTE_TIMEOUT = float(os.getenv("UI_ROUTE_TIMEOUT", "10"))
+
+# Ruta -> locators cuyo texto tiene que venir en el HTML de esa página
+ROUTES = {
+    "home": (UI_BASE_URL, [data.HOME_SHOP_BY_CATEGORY_TITLE, data.HOME_SPECIAL_DEALS_TITLE]),
+    "signup": (os.getenv("UI_SIGNUP_URL"), [data.SIGNUP_PAGE_TITLE]),
+    "login": (os.getenv("UI_LOGIN_URL"), [data.LOGIN_PAGE_TITLE]),
+    # Sin storage el carrito de un visitante nuevo está vacío
+    "cart": (os.getenv("UI_CART_URL"), [data.CART_TITLE_EMPTY]),
+    "men_clothes": (os.getenv("UI_MEN_CLOTHES_URL"), [data.CATEGORY_TITLE_MEN_CLOTHES]),
+    "women_clothes": (os.getenv("UI_WOMEN_CLOTHES_URL"), [data.CATEGORY_TITLE_WOMEN_CLOTHES]),
+    "electronics": (os.getenv("UI_ELECTRONICS_URL"), [data.CATEGORY_TITLE_ELECTRONICS]),
+    "books": (os.getenv("UI_BOOKS_URL"), [data.CATEGORY_TITLE_BOOKS]),
+    "groceries": (os.getenv("UI_GROCERIES_URL"), [data.CATEGORY_TITLE_GROCERIES]),
+    "special_deals": (os.getenv("UI_SPECIAL_DEALS_URL"), [data.SPECIAL_DEALS_TITLE]),
+}
+
+_HREF = re.compile(r"""a\[href=['"](/[^'"]*)['"]\]""")
+_TEXT = re.compile(r"""text\(\)=(?:'([^']*)'|"([^"]*)")""")
+_TAG = re.compile(r"^//(\w+)")
+_ATTRIBUTE = re.compile(r"""@([\w-]+)=(?:'([^']*)'|"([^"]*)")""")
+# Elementos HTML sin etiqueta de cierre
+_VOID_TAGS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+
+def locator_hrefs(module=data) -> set:
+    """Rutas internas (href="/...") que aparecen en los locators CSS de UI/data.py."""
+    hrefs = set()
+    for value in vars(module).values():
+        if isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], str):
+            hrefs.update(_HREF.findall(value[1]))
+    return hrefs
+
+
+def locator_text(locator) -> str:
+    """Texto exacto que busca un locator XPath con text()='...' (o None)."""
+    match = _TEXT.search(locator[1])
+    return (match.group(1) or match.group(2)) if match else None
+
+
+def locator_element(locator) -> dict:
+    """
+    Tag, atributos y texto que busca un locator XPath simple como
+    //h1[@id='category-title' and text()='Books'] (o None si no es de ese tipo).
+    """
+    tag = _TAG.match(locator[1])
+    text = locator_text(locator)
+    if tag is None or text is None:
+        return None
+    attributes = {name: first or second for name, first, second in _ATTRIBUTE.findall(locator[1])}
+    return {"tag": tag.group(1), "attributes": attributes, "text": text}
+
+
+class _ElementParser(HTMLParser):
+    """Junta (tag, atributos, textos propios) de cada elemento de la página."""
+
+    def __init__(self):
+        super().__init__()
+        self.elements = []
+        self._open = []
+
+    def handle_starttag(self, tag, attrs):
+        element = (tag, {name: value or "" for name, value in attrs}, [])
+        self.elements.append(element)
+        if tag not in _VOID_TAGS:
+            self._open.append(element)
+
+    def handle_endtag(self, tag):
+        # HTML tolerante: cierra también los elementos que quedaron sin cerrar adentro
+        for index in range(len(self._open) - 1, -1, -1):
+            if self._open[index][0] == tag:
+                del self._open[index:]
+                break
+
+    def handle_data(self, data):
+        if self._open and data.strip():
+            self._open[-1][2].append(data.strip())
+
+
+def page_elements(page_html: str) -> list:
+    parser = _ElementParser()
+    parser.feed(page_html)
+    return parser.elements
+
+
+def has_element(elements, marker) -> bool:
+    """True si algún elemento tiene el tag, los atributos y un texto propio igual al del marker."""
+    return any(
+        tag == marker["tag"]
+        and marker["text"] in texts
+        and all(attributes.get(name) == value for name, value in marker["attributes"].items())
+        for tag, attributes, texts in elements
+    )
+
+
+class _LinkParser(HTMLParser):
+    def __init__(self):
+        super().__init__()
+        self.hrefs = set()
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "a":
+            href = dict(attrs).get("href")
+            if href:
+                self.hrefs.add(href)
+
+
+def page_links(page_html: str, base_url: str) -> set:
+    """Paths de todos los <a href> de la página que apuntan al mismo host."""
+    parser = _LinkParser()
+    parser.feed(page_html)
+    host = urlsplit(base_url).netloc
+    links = set()
+    for href in parser.hrefs:
+        url = urlsplit(urljoin(base_url, href))
+        if url.netloc == host:
+            links.add(url.path or "/")
+    return links
+
+
+def _session(workers):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=workers)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def check_routes(routes=ROUTES, timeout: float = UI_ROUTE_TIMEOUT) -> dict:
+    """
+    Pide todas las rutas en paralelo y retorna {nombre: resultado} con
+    {"url", "status", "elapsed_ms", "missing" (locators que no vinieron), "links", "error"}.
+    """
+    routes = {name: route for name, route in routes.items() if route[0]}
+    workers = max(1, len(routes))
+    session = _session(workers)
+
+    def fetch(item):
+        name, (url, markers) = item
+        result = {"url": url, "status": None, "elapsed_ms": None, "missing": [], "links": set(), "error": None}
+        started = time.perf_counter()
+        try:
+            response = session.get(url, timeout=timeout, headers={"Accept": "text/html"})
+        except requests.RequestException as err:
+            result["error"] = f"{type(err).__name__}: {err}"
+            return name, result
+        result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        result["status"] = response.status_code
+        page_html = response.text
+        elements = page_elements(page_html)
+        result["missing"] = [
+            marker[1] for marker in markers
+            if locator_element(marker) is None or not has_element(elements, locator_element(marker))
+        ]
+        result["links"] = page_links(page_html, url)
+        return name, result
+
+    try:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ui-routes") as executor:
+            return dict(executor.map(fetch, routes.items()))
+    finally:
+        session.close()
@@ -0,0 +1,141 @@
+import os
+import time
+
+from dotenv import load_dotenv
+from selenium.common.exceptions import JavascriptException, TimeoutException
+from selenium.webdriver.common.by import By
+
+load_dotenv()
+
+# Cada cuánto se re-evalúa la condición aunque no haya mutaciones en el DOM
+# (visibilidad que cambia solo por transiciones/animaciones CSS)
+UI_WAIT_POLL_MS = int(os.getenv("UI_WAIT_POLL_MS", "250"))
+# Tope de execute_async_script (se fija en create_driver); ninguna espera puede superarlo
+SCRIPT_TIMEOUT = 60
+
+# Se ejecuta con execute_async_script: evalúa la condición una vez y, si todavía no se
+# cumple, la re-evalúa en cada mutación del DOM (MutationObserver) hasta que se cumpla
+# o se acabe el tiempo. Todo en una sola llamada al navegador, sin polling desde Python.
+WAIT_SCRIPT = """
+const spec = arguments[0];
+const done = arguments[arguments.length - 1];
+
+const findAll = () => {
+    switch (spec.by) {
+        case "id": {
+            const el = document.getElementById(spec.selector);
+            return el ? [el] : [];
+        }
+        case "xpath": {
+            const result = document.evaluate(spec.selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            return Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+        }
+        case "link text":
+            return Array.from(document.querySelectorAll("a")).filter((a) => a.innerText.trim() === spec.selector);
+        default:
+            return Array.from(document.querySelectorAll(spec.selector));
+    }
+};
+
+const isVisible = (el) => {
+    if (!el.isConnected || !el.getClientRects().length) return false;
+    const style = getComputedStyle(el);
+    return style.visibility !== "hidden" && style.opacity !== "0";
+};
+
+const evaluate = () => {
+    const elements = findAll();
+    const first = elements[0] || null;
+    switch (spec.condition) {
+        case "present":
+            return first;
+        case "visible":
+            return first && isVisible(first) ? first : null;
+        case "clickable":
+            return first && isVisible(first) && !first.disabled ? first : null;
+        case "text":
+            return first && isVisible(first) && first.innerText.trim() === spec.value ? first : null;
+        case "gone":
+            return elements.some(isVisible) ? null : true;
+    }
+};
+
+const check = () => {
+    try {
+        return evaluate();
+    } catch (e) {
+        return null;
+    }
+};
+
+let result = check();
+if (result !== null) {
+    done({ok: true, value: result});
+} else {
+    let finished = false;
+    const finish = (payload) => {
+        if (finished) return;
+        finished = true;
+        observer.disconnect();
+        clearInterval(poll);
+        clearTimeout(timer);
+        done(payload);
+    };
+    const recheck = () => {
+        const value = check();
+        if (value !== null) finish({ok: true, value: value});
+    };
+    const observer = new MutationObserver(recheck);
+    observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+    const poll = setInterval(recheck, spec.poll_ms);
+    const timer = setTimeout(() => {
+        const last = findAll()[0];
+        finish({ok: false, found: !!last, text: last ? last.innerText.trim() : null});
+    }, spec.timeout_ms);
+}
+"""
+
+CONDITIONS = ("present", "visible", "clickable", "text", "gone")
+
+BY_NAMES = {
+    By.ID: "id",
+    By.CSS_SELECTOR: "css selector",
+    By.XPATH: "xpath",
+    By.LINK_TEXT: "link text",
+}
+
+
+def wait_until(driver, condition: str, locator, value: str = None, timeout: float = 10):
+    """
+    Espera dentro del navegador a que 'locator' cumpla 'condition':
+    present, visible, clickable, text (texto visible == value) o gone (ningún elemento visible).
+
+    Retorna el WebElement (o True para 'gone'). Si no se cumple en 'timeout'
+    segundos lanza TimeoutException, igual que WebDriverWait.
+    """
+    by, selector = locator
+    if condition not in CONDITIONS:
+        raise ValueError(f"❌ Condición desconocida: {condition} (opciones: {', '.join(CONDITIONS)})")
+    if by not in BY_NAMES:
+        raise ValueError(f"❌ Locator no soportado por smart_wait: {locator}")
+    spec = {"by": BY_NAMES[by], "selector": selector, "condition": condition, "value": value,
+            "poll_ms": UI_WAIT_POLL_MS}
+
+    deadline = time.monotonic() + min(timeout, SCRIPT_TIMEOUT - 1)
+    while True:
+        spec["timeout_ms"] = max(int((deadline - time.monotonic()) * 1000), 0)
+        try:
+            result = driver.execute_async_script(WAIT_SCRIPT, spec)
+        except JavascriptException:
+            # La página navegó mientras se esperaba: se vuelve a esperar en el documento nuevo
+            if time.monotonic() >= deadline:
+                raise TimeoutException(f"Timeout esperando '{condition}' de {locator}: la página seguía navegando")
+            continue
+        if result["ok"]:
+            return result["value"]
+        if condition == "gone":
+            detail = "sigue visible"
+        else:
+            detail = f"texto actual '{result['text']}'" if result["found"] else "el elemento no existe"
+        expected = f" == '{value}'" if condition == "text" else ""
+        raise TimeoutException(f"Timeout ({timeout}s) esperando '{condition}'{expected} de {locator} ({detail})")
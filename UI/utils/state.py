@@ -0,0 +1,146 @@
+import json
+import os
+import threading
+
+from dotenv import load_dotenv
+
+from UI.utils.driver_pool import quit_driver
+
+load_dotenv()
+
+# Claves de localStorage/sessionStorage que forman la sesión y el carrito de la app,
+# separadas por coma. Vacío: se guardan todas las claves del origen.
+UI_STATE_STORAGE_KEYS = [key.strip() for key in os.getenv("UI_STATE_STORAGE_KEYS", "").split(",") if key.strip()]
+
+# Marca interna para que el script de inyección corra una sola vez por pestaña
+INJECTED_FLAG = "__qaStateInjected"
+
+CAPTURE_SCRIPT = """
+const dump = (storage) => {
+    const items = {};
+    for (let i = 0; i < storage.length; i++) {
+        const key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+};
+return {origin: location.origin, local_storage: dump(localStorage), session_storage: dump(sessionStorage)};
+"""
+
+INJECT_SCRIPT = """
+(() => {
+    const state = %s;
+    if (location.origin !== state.origin || sessionStorage.getItem("%s")) return;
+    for (const [key, value] of Object.entries(state.local_storage)) localStorage.setItem(key, value);
+    for (const [key, value] of Object.entries(state.session_storage)) sessionStorage.setItem(key, value);
+    sessionStorage.setItem("%s", "1");
+})();
+"""
+
+
+def _filter_storage(items, keys=UI_STATE_STORAGE_KEYS):
+    return {
+        key: value for key, value in items.items()
+        if key != INJECTED_FLAG and (not keys or key in keys)
+    }
+
+
+def capture_state(driver, cookies: bool = True) -> dict:
+    """
+    Guarda el estado del navegador en la página actual: localStorage, sessionStorage
+    (filtrados por UI_STATE_STORAGE_KEYS) y cookies (salvo cookies=False). Sirve para
+    reinyectarlo con inject_state.
+    """
+    state = driver.execute_script(CAPTURE_SCRIPT)
+    state["local_storage"] = _filter_storage(state["local_storage"])
+    state["session_storage"] = _filter_storage(state["session_storage"])
+    state["cookies"] = driver.get_cookies() if cookies else []
+    return state
+
+
+def merge_states(*states) -> dict:
+    """
+    Junta varios estados de capture_state en uno (p. ej. la sesión de un usuario y un
+    carrito armado aparte). Si se repite una cookie o una clave de storage gana el último.
+    """
+    merged = {"origin": states[0]["origin"], "cookies": [], "local_storage": {}, "session_storage": {}}
+    cookies = {}
+    for state in states:
+        for cookie in state["cookies"]:
+            cookies[(cookie["name"], cookie.get("domain"), cookie.get("path", "/"))] = cookie
+        merged["local_storage"].update(state["local_storage"])
+        merged["session_storage"].update(state["session_storage"])
+    merged["cookies"] = list(cookies.values())
+    return merged
+
+
+def inject_state(driver, state: dict, url: str):
+    """
+    Abre 'url' con el estado ya cargado (sesión, carrito...) en una sola carga de página:
+    las cookies se crean por CDP y el storage lo escribe un script que corre antes que
+    los scripts de la app. Así la app arranca como si el usuario ya hubiera hecho el flujo.
+    """
+    for cookie in state["cookies"]:
+        params = {
+            "name": cookie["name"],
+            "value": cookie["value"],
+            "url": state["origin"],
+            "path": cookie.get("path", "/"),
+            "secure": cookie.get("secure", False),
+            "httpOnly": cookie.get("httpOnly", False),
+        }
+        if cookie.get("domain"):
+            params["domain"] = cookie["domain"]
+        if cookie.get("expiry"):
+            params["expires"] = cookie["expiry"]
+        if cookie.get("sameSite"):
+            params["sameSite"] = cookie["sameSite"]
+        driver.execute_cdp_cmd("Network.setCookie", params)
+
+    source = INJECT_SCRIPT % (json.dumps(state), INJECTED_FLAG, INJECTED_FLAG)
+    script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": source})
+    try:
+        driver.get(url)
+    finally:
+        driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+
+class StateCache:
+    """
+    Estados de navegador (usuario logueado, carrito con productos) que se construyen
+    una sola vez por sesión, pasando por la UI con un navegador del pool, y luego se
+    inyectan en cada test que los necesite como precondición.
+
+    Todos los tests reciben la misma copia. La sesión de un usuario se puede compartir
+    mientras ningún test haga logout; un carrito solo si vive en el navegador, porque si
+    el servidor lo guarda un test que lo vacía se lo cambia a los demás.
+    """
+
+    def __init__(self, driver_pool):
+        self.driver_pool = driver_pool
+        self._states = {}
+        self._lock = threading.Lock()
+
+    def get(self, name: str, build, cookies: bool = True) -> dict:
+        """
+        Retorna el estado 'name', construyéndolo la primera vez con build(driver).
+        build puede retornar datos extra (email, productos...) que se guardan junto al estado.
+        Con cookies=False solo se guarda el storage (ver capture_state).
+        """
+        with self._lock:
+            if name not in self._states:
+                # El test que lo pide ya tiene su navegador: si el pool está lleno no se
+                # espera (sería un deadlock), se usa un navegador temporal
+                driver = self.driver_pool.acquire(blocking=False)
+                pooled = driver is not None
+                if not pooled:
+                    driver = self.driver_pool.factory()
+                try:
+                    extra = build(driver) or {}
+                    self._states[name] = {"state": capture_state(driver, cookies), **extra}
+                finally:
+                    if pooled:
+                        self.driver_pool.release(driver)
+                    else:
+                        quit_driver(driver)
+            return self._states[name]
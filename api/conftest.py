@@ -3,11 +3,333 @@ import os
 from dotenv import load_dotenv, find_dotenv
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils.payloads import PayloadFactory
+from api.utils import payloads as payload_stats
+from api.utils import cassettes, cleanup, metrics, resilience, session_pool, unique_keys, warmup, workers
+from api.utils.resource_pool import ResourceWarehouse
+from api.utils.token_cache import TokenCache
 import requests
-import datetime
-import time
+import itertools
 from api.utils import settings
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--no-token-cache",
+        action="store_true",
+        help="No reutilizar tokens ni usuarios de prueba guardados en corridas anteriores"
+    )
+    parser.addoption(
+        "--no-api-warmup",
+        action="store_true",
+        help="No calentar la API (probe + conexiones pre-abiertas) al iniciar la sesión"
+    )
+    parser.addoption(
+        "--no-api-cleanup",
+        action="store_true",
+        help="No borrar al terminar los recursos que la suite creó en la API"
+    )
+    group = parser.getgroup("api-cassettes", "record/replay de la API")
+    group.addoption(
+        "--api-record",
+        action="store_true",
+        help="Graba todas las peticiones de APIClient en API_CASSETTE_DIR"
+    )
+    group.addoption(
+        "--api-replay",
+        action="store_true",
+        help="Responde todas las peticiones de APIClient desde API_CASSETTE_DIR, sin red"
+    )
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers",
+        "fresh_user: el test modifica o elimina el usuario, así que necesita uno recién creado"
+    )
+    if config.getoption("--api-record") and config.getoption("--api-replay"):
+        raise pytest.UsageError("--api-record y --api-replay no se pueden usar juntos")
+    if config.getoption("--api-record") and (workers.is_worker() or getattr(config.option, "numprocesses", None)):
+        # Cada worker escribiría su propio índice de cassettes sobre el mismo archivo
+        raise pytest.UsageError("--api-record no se puede usar con pytest-xdist (-n); grabá en un solo proceso")
+    if config.getoption("--api-record"):
+        cassettes.activate(cassettes.RECORD, settings.API_CASSETTE_DIR)
+    elif config.getoption("--api-replay"):
+        cassettes.activate(cassettes.REPLAY, settings.API_CASSETTE_DIR)
+        # Sin red no tiene sentido esperar entre reintentos: las respuestas ya están grabadas
+        resilience.engine.configure(base_delay=0, max_delay=0)
+    store = cassettes.active_store()
+    if store is not None:
+        # Misma semilla al grabar y al reproducir: los fixtures de sesión generan los mismos datos
+        Faker.seed(store.seed)
+
+    # Latencias de todas las llamadas de APIClient, por endpoint y por test/fixture
+    config._api_metrics = metrics.MetricsRecorder()
+    APIClient.add_hook(config._api_metrics)
+    # Con xdist: reintentos, pool, payloads y warm-up que mandó cada worker (ver pytest_testnodedown)
+    config._api_worker_stats = {}
+
+    # Despertar la API mientras se recolectan los tests (no aplica sin red)
+    config._api_warmup = None
+    live_api = settings.API_BASE_URL and settings.API_BASE_URL != settings.FAKE_API_BASE_URL
+    replaying = store is not None and store.mode == cassettes.REPLAY
+    if live_api and not replaying and not (config.getoption("--no-api-warmup") or config.option.collectonly):
+        if workers.is_worker():
+            # El proceso principal ya despertó la API: cada worker solo pre-abre sus conexiones
+            config._api_warmup = warmup.WarmUp(settings.API_BASE_URL, probe=False).start()
+        else:
+            config._api_warmup = warmup.WarmUp(settings.API_BASE_URL).start()
+            if getattr(config.option, "numprocesses", None):
+                # Con xdist el principal no recolecta: espera aquí, una sola vez, antes de lanzar los workers
+                config._api_warmup.wait()
+
+    # Ledger de los recursos creados, para borrarlos al terminar (ver api/utils/cleanup.py)
+    config._api_cleanup = None
+    config._api_cleanup_report = None
+    if live_api and not replaying and not (config.getoption("--no-api-cleanup") or config.option.collectonly):
+        config._api_cleanup = cleanup.TeardownRegistry(settings.API_BASE_URL).open()
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(items):
+    """
+    Con pytest -n ... --dist loadgroup, agrupa los tests por la cadena de fixtures
+    caros que usan (ver api/utils/workers.py). Corre antes que el hook de xdist,
+    que es el que lee los xdist_group.
+    """
+    if not workers.is_worker():
+        return
+    for item in items:
+        group = workers.scheduling_group(item.fixturenames)
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(group))
+
+
+def pytest_collection_finish(session):
+    """
+    Los tests arrancan recién cuando la API respondió el probe del warm-up.
+    Sin warm-up (fake, --api-replay, --no-api-warmup) no hay nada que esperar.
+    """
+    warm_up = getattr(session.config, "_api_warmup", None)
+    if warm_up is not None:
+        warm_up.wait()
+
+
+def cleanup_client():
+    """APIClient de admin para borrar los recursos de la corrida (token del caché en disco si se usa)."""
+    token_cache = TokenCache(settings.API_TOKEN_CACHE_PATH) if settings.API_TOKEN_CACHE_PATH else None
+    return cleanup.admin_client(settings.API_BASE_URL, token_cache)
+
+
+def process_stats(config):
+    """Reintentos, pool de conexiones, payloads y warm-up de este proceso."""
+    warm_up = getattr(config, "_api_warmup", None)
+    payloads = getattr(config, "_api_payloads", None)
+    return {
+        "retries": resilience.engine.stats(),
+        "pool": session_pool.pool_stats(),
+        "payloads": payloads.stats() if payloads is not None else None,
+        "warmup": warm_up.report if warm_up is not None else None,
+    }
+
+
+def run_stats(config):
+    """process_stats de este proceso sumado al de cada worker de xdist (sin xdist, solo el propio)."""
+    local = process_stats(config)
+    remote = getattr(config, "_api_worker_stats", {})
+    every = [local, *remote.values()]
+    payloads = [stats["payloads"] for stats in every if stats["payloads"] is not None]
+    merged = {
+        "retries": resilience.merge_stats([stats["retries"] for stats in every]),
+        "pool": session_pool.merge_pool_stats([stats["pool"] for stats in every]),
+        "payloads": payload_stats.merge_stats(payloads) if payloads else None,
+        "warmup": local["warmup"],
+    }
+    worker_warmups = {worker: stats["warmup"] for worker, stats in remote.items() if stats["warmup"]}
+    if worker_warmups:
+        merged["warmup"] = {**(local["warmup"] or {}), "workers": worker_warmups}
+    return merged
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    """
+    Con xdist, cada worker manda sus métricas al terminar (workeroutput) y el proceso
+    principal las junta para el JSON, el reporte HTML y el resumen de la terminal.
+    """
+    stats = getattr(node, "workeroutput", {}).get("api_stats")
+    if stats is None:
+        return
+    node.config._api_metrics.merge(stats.pop("metrics"))
+    node.config._api_worker_stats[node.workerinput["workerid"]] = stats
+
+
+def pytest_sessionfinish(session):
+    """
+    Guarda el índice de cassettes si se estaba grabando, borra los recursos creados
+    por la corrida y escribe el JSON de latencias, reintentos y warm-up. Los workers
+    de xdist no escriben nada: mandan sus métricas al proceso principal.
+    """
+    store = cassettes.deactivate()
+    if store is not None:
+        session.config._api_cassette_store = store
+
+    # Las recargas del almacén pueden seguir creando recursos (p. ej. si la sesión se
+    # interrumpió antes del teardown de los fixtures): se esperan antes de cerrar el ledger
+    warehouse = getattr(session.config, "_api_warehouse", None)
+    if warehouse is not None:
+        warehouse.close()
+
+    registry = getattr(session.config, "_api_cleanup", None)
+    if registry is not None:
+        if workers.is_worker():
+            # Los recursos compartidos los siguen usando otros workers: los borra el proceso principal
+            registry.close()
+        else:
+            with metrics.scoped("cleanup"):
+                session.config._api_cleanup_report = registry.purge_run(cleanup_client)
+
+    recorder = getattr(session.config, "_api_metrics", None)
+    if recorder is None:
+        return
+    if workers.is_worker():
+        session.config.workeroutput["api_stats"] = {"metrics": recorder.export(), **process_stats(session.config)}
+        return
+    if recorder.calls and settings.API_METRICS_PATH:
+        stats = run_stats(session.config)
+        extra = {"retries": stats["retries"], "connection_pool": stats["pool"]}
+        if stats["warmup"] is not None:
+            extra["warmup"] = stats["warmup"]
+        if stats["payloads"] is not None:
+            extra["payloads"] = stats["payloads"]
+        cleanup_report = getattr(session.config, "_api_cleanup_report", None)
+        if cleanup_report is not None:
+            extra["cleanup"] = cleanup_report
+        recorder.write_json(settings.API_METRICS_PATH, extra=extra)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """
+    Con --api-record / --api-replay, las peticiones de un fixture de sesión o de
+    módulo se agrupan bajo el nombre del fixture (no del test que lo pidió primero),
+    y las de un fixture de función bajo el id del test. Así una corrida parcial
+    (-k, un solo archivo) reproduce lo mismo que la corrida completa.
+    """
+    if fixturedef.scope == "function":
+        scope = request.node.nodeid
+    else:
+        scope = f"fixture:{fixturedef.argname}"
+    with cassettes.scoped(scope, seed_key=f"{scope}:{fixturedef.argname}"), \
+            metrics.scoped(f"fixture:{fixturedef.argname}"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    """Siembra Faker y fija el ámbito de grabación y de métricas con el id del test."""
+    with cassettes.scoped(item.nodeid), metrics.scoped(item.nodeid):
+        yield
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_html_results_summary(prefix, summary, postfix, session):
+    """Agrega al reporte de pytest-html la tabla de latencias por endpoint."""
+    recorder = getattr(session.config, "_api_metrics", None)
+    if recorder is not None and recorder.calls:
+        prefix.append(recorder.to_html())
+
+
+def pytest_terminal_summary(terminalreporter):
+    """
+    Al final de la sesión reporta cuántas conexiones se reutilizaron
+    en el pool compartido de APIClient (handshakes TCP+TLS ahorrados).
+    """
+    store = getattr(terminalreporter.config, "_api_cassette_store", None)
+    if store is not None:
+        terminalreporter.write_sep("-", "API cassettes")
+        if store.mode == cassettes.RECORD:
+            terminalreporter.write_line(f"📼 {store.recorded} interacciones grabadas en {store.path}")
+        else:
+            terminalreporter.write_line(f"📼 {store.replayed} interacciones reproducidas desde {store.path}")
+
+    run = run_stats(terminalreporter.config)
+
+    recorder = getattr(terminalreporter.config, "_api_metrics", None)
+    if recorder is not None and recorder.calls:
+        data = recorder.to_dict()
+        slowest = sorted(data["endpoints"].items(), key=lambda item: item[1]["total_ms"]["p95"], reverse=True)
+        terminalreporter.write_sep("-", "API latency")
+        terminalreporter.write_line(
+            f"⏱️ {data['calls']} llamadas, {data['total_ms'] / 1000:.1f}s en la API"
+            + (f" (detalle en {settings.API_METRICS_PATH})" if settings.API_METRICS_PATH else "")
+        )
+        for endpoint, stats in slowest[:5]:
+            total = stats["total_ms"]
+            terminalreporter.write_line(
+                f"   {endpoint}: p50 {total['p50']:.0f}ms, p95 {total['p95']:.0f}ms, p99 {total['p99']:.0f}ms ({stats['calls']} llamadas)"
+            )
+
+    report = run["warmup"]
+    if report:
+        terminalreporter.write_sep("-", "API warm-up")
+        if "error" in report:
+            terminalreporter.write_line(f"🔥 Warm-up falló: {report['error']}")
+        elif "cold_start_ms" in report:
+            terminalreporter.write_line(
+                f"🔥 Arranque en frío: {report['cold_start_ms'] / 1000:.1f}s hasta el primer {report['probe_status']} "
+                f"({report['probe_attempts']} probes), DNS {report['dns_ms']:.0f}ms, "
+                f"{report['preconnected']} conexiones pre-abiertas"
+            )
+
+    data = run["payloads"]
+    if data is not None:
+        slowest = sorted(data["columns"].items(), key=lambda item: item[1]["ms"], reverse=True)
+        terminalreporter.write_sep("-", "API payloads")
+        terminalreporter.write_line(
+            f"🧪 {data['generated']} valores generados en {data['ms']:.0f}ms (tandas de {data['batch_size']}, "
+            f"semilla {data['seed']}), {data['taken']} usados por los fixtures"
+        )
+        terminalreporter.write_line(
+            "   " + ", ".join(f"{name} {stats['ms']:.0f}ms" for name, stats in slowest[:5])
+        )
+
+    cleanup_report = getattr(terminalreporter.config, "_api_cleanup_report", None)
+    if cleanup_report is not None and cleanup_report["pending"]:
+        terminalreporter.write_sep("-", "API cleanup")
+        for line in cleanup.format_report(cleanup_report):
+            terminalreporter.write_line(line)
+
+    spend = run["retries"]
+    if spend["retries"] or spend["budget_denied"] or spend["short_circuited"]:
+        terminalreporter.write_sep("-", "API retries")
+        terminalreporter.write_line(
+            f"🔁 {spend['retries']} reintentos ({spend['wait_seconds']:.1f}s esperando), "
+            f"{spend['budget_denied']} negados por presupuesto, {spend['short_circuited']} cortados por circuito abierto"
+        )
+        for key, values in spend["by_key"].items():
+            terminalreporter.write_line(
+                f"   {key}: {values['retries']} reintentos en {values['calls']} llamadas, {values['wait_seconds']:.1f}s"
+            )
+        for key, times in spend["circuits_opened"].items():
+            terminalreporter.write_line(f"   ⚡ circuito de {key} abierto {times} vez/veces")
+
+    stats = run["pool"]
+    if not stats["requests"]:
+        return
+    terminalreporter.write_sep("-", "API connection pool")
+    terminalreporter.write_line(
+        f"🔌 {stats['requests']} peticiones sobre {stats['connections']} conexiones "
+        f"(reutilización {stats['reuse_rate']:.1%}, {stats['handshakes_saved']} handshakes ahorrados)"
+    )
+
+
+def pytest_unconfigure(config):
+    """
+    Cierra las conexiones del pool compartido de APIClient. Corre siempre, también
+    en los workers de xdist y cuando el resumen no reporta el pool.
+    """
+    session_pool.close_all()
+
 @pytest.fixture(scope="session")
 def api_base_url():
     """
@@ -27,18 +349,24 @@ def faker():
     """Fixture que retorna una instancia de Faker para usar en las pruebas."""
     return Faker()
 
+@pytest.fixture(scope="session")
+def payloads(request):
+    """
+    Fábrica de payloads de la sesión (ver api/utils/payloads.py): un solo Faker
+    sembrado que pre-genera los datos por tandas y los fixtures toman en O(1).
+    """
+    store = cassettes.active_store()
+    seed = settings.API_PAYLOAD_SEED or (store.seed if store is not None else unique_keys.RUN_ID)
+    factory = PayloadFactory(seed).fill()
+    request.config._api_payloads = factory
+    return factory
+
 @pytest.fixture
-def signup_payload():
+def signup_payload(payloads):
     """
     Fixture que genera y retorna un payload de registro de usuario con datos únicos.
     """
-    fake = Faker()
-    payload = {
-        "email": fake.unique.email(),
-        "password": fake.password(length=7),
-        "full_name": fake.name()
-    }
-    return payload
+    return payloads.signup()
 
 @pytest.fixture
 def login_payload(signup_payload):
@@ -53,24 +381,74 @@ def login_payload(signup_payload):
 
 
 @pytest.fixture(scope="session")
-def admin_token(api_base_url):
+def token_cache(request, tmp_path_factory):
+    """
+    Fixture que retorna el caché en disco de tokens y usuarios de prueba.
+    Con --no-token-cache (o API_TOKEN_CACHE_PATH vacío) se usa un caché
+    temporal que solo vive durante la sesión. Con la API falsa también, porque
+    sus usuarios no sobreviven al proceso, y al grabar/reproducir cassettes,
+    para que cada corrida haga las mismas peticiones.
+    """
+    fake_api_in_use = settings.API_BASE_URL == settings.FAKE_API_BASE_URL
+    if (
+        request.config.getoption("--no-token-cache")
+        or not settings.API_TOKEN_CACHE_PATH
+        or fake_api_in_use
+        or cassettes.active_store() is not None
+    ):
+        shared = shared_resources_root(tmp_path_factory)
+        if shared is not None:
+            # Un solo caché temporal para todos los workers de la corrida: un solo login de admin
+            return TokenCache(shared / "tokens.json", persistent=False)
+        return TokenCache(tmp_path_factory.mktemp("token_cache") / "tokens.json", persistent=False)
+    return TokenCache(settings.API_TOKEN_CACHE_PATH)
+
+
+def shared_resources_root(tmp_path_factory):
+    """
+    Directorio común a todos los workers de xdist en esta corrida (o None).
+    No aplica con la API falsa (cada worker tiene la suya en memoria) ni con
+    cassettes (cada worker tiene que reproducir sus propias peticiones).
+    """
+    fake_api_in_use = settings.API_BASE_URL == settings.FAKE_API_BASE_URL
+    if not workers.is_worker() or fake_api_in_use or cassettes.active_store() is not None:
+        return None
+    # basetemp de cada worker es <raíz de la corrida>/popen-gwN: el padre es común
+    return tmp_path_factory.getbasetemp().parent / "shared"
+
+
+@pytest.fixture(scope="session")
+def shared_resources(tmp_path_factory):
+    """
+    Recursos de sesión creados una sola vez entre todos los workers de xdist
+    (ver api/utils/workers.py). Es None si no se corre en paralelo.
+    """
+    root = shared_resources_root(tmp_path_factory)
+    return workers.SharedResources(root) if root is not None else None
+
+@pytest.fixture(scope="session")
+def admin_token(api_base_url, token_cache):
     """
     Fixture que hace login con las credenciales de administrador
-    y retorna el token de acceso.
+    y retorna el token de acceso. El token se reutiliza entre corridas
+    mientras no venza (ver api/utils/token_cache.py).
     """
-    temp_api_client = APIClient(base_url=api_base_url)
+    def login():
+        temp_api_client = APIClient(base_url=api_base_url)
 
-    login_payload = {
-        "username": settings.ADMIN_EMAIL,
-        "password": settings.ADMIN_PASSWORD
-    }
+        login_payload = {
+            "username": settings.ADMIN_EMAIL,
+            "password": settings.ADMIN_PASSWORD
+        }
+
+        # Login con post_form
+        login_response = temp_api_client.post_form(endpoint="/auth/login", data=login_payload)
 
-    # Login con post_form
-    login_response = temp_api_client.post_form(endpoint="/auth/login", data=login_payload)
+        assert login_response.status_code == 200
 
-    assert login_response.status_code == 200
+        return login_response.json()["access_token"]
 
-    return login_response.json()["access_token"]
+    return token_cache.get_or_login(api_base_url, settings.ADMIN_EMAIL, login)
 
 @pytest.fixture (scope="session")
 def auth_api_client(api_base_url, admin_token):
@@ -81,71 +459,59 @@ def auth_api_client(api_base_url, admin_token):
     return APIClient(base_url=api_base_url, token=admin_token)
 
 @pytest.fixture
-def admin_signup_payload():
+def admin_signup_payload(payloads):
     """
     Fixture que genera y retorna un payload de registro de usuario con rol de 'admin'.
     """
-    fake = Faker()
-    payload = {
-        "email": fake.email(),
-        "password": fake.password(length=7),
-        "full_name": fake.name(),
-        "role": "admin"
-    }
-    return payload
+    return payloads.admin_signup()
 
 
-@pytest.fixture
-def created_admin_user_info(api_client, admin_token, faker):
+def request_until_ok(description, send, retry_statuses=()):
     """
-    Crea un usuario admin a través del endpoint /users y retorna sus datos y su token.
+    Ejecuta 'send(intento)', que retorna una respuesta de APIClient, y falla el test
+    si no termina en 2xx. Los 5xx y errores de conexión ya los reintenta APIClient;
+    aquí solo se reintentan los 'retry_statuses' propios del fixture (p. ej. 400 por
+    un email o código que ya existe, generando un payload nuevo en cada intento),
+    con el backoff y el presupuesto compartidos de api/utils/resilience.py.
     """
-    max_retries = 5
-    signup_response = None
-    login_response = None
+    try:
+        response = resilience.engine.retry(
+            description, send, lambda response: response.status_code in retry_statuses
+        )
+    except resilience.RetryExhaustedError as err:
+        response = err.outcome
+    except requests.exceptions.RequestException as err:
+        pytest.fail(f"Falla crítica: {description} falló. Error: {err}")
 
+    if not response.ok:
+        pytest.fail(
+            f"Falla crítica: {description} falló con {response.status_code} después de reintentar. "
+            f"Error: {response.text}"
+        )
+    return response
+
+
+def create_admin_user(api_client, admin_token, payloads):
+    """
+    Crea un usuario admin a través del endpoint /users y retorna sus datos y su token.
+    """
     # 1. Crear el cliente de API con el token de admin
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
 
-    # 2. Registrar al usuario con lógica de reintento
-    for attempt in range(max_retries):
-        try:
-            # Generamos un payload de registro único para cada intento
-            admin_signup_payload = {
-                "email": faker.email(),
-                "password": faker.password(length=7),
-                "full_name": faker.name(),
-                "role": "admin"
-            }
-            response = admin_api_client.post(endpoint="/users", data=admin_signup_payload)
-            response.raise_for_status()
-            signup_response = response
-            break
-        except requests.exceptions.HTTPError as err:
-            if response is not None and response.status_code in [400, 500] and attempt < max_retries - 1:
-                print(f"⚠️ Signup falló con {response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(f"Falla crítica: Signup falló después de {max_retries} intentos. Error: {err}")
+    # 2. Registrar al usuario (el email es único por construcción, ver api/utils/unique_keys.py)
+    admin_signup_payload = payloads.admin_signup()
+    signup_response = request_until_ok(
+        "Signup", lambda attempt: admin_api_client.post(endpoint="/users", data=admin_signup_payload)
+    )
 
     # 3. Hacer login con el nuevo usuario 'admin' para obtener su token
     login_payload = {
         "username": admin_signup_payload["email"],
         "password": admin_signup_payload["password"],
     }
-
-    # Lógica de reintento para el login
-    for attempt in range(max_retries):
-        try:
-            login_response = api_client.post_form(endpoint="/auth/login", data=login_payload)
-            login_response.raise_for_status()
-            break
-        except requests.exceptions.HTTPError as err:
-            if login_response is not None and login_response.status_code in [400, 500] and attempt < max_retries - 1:
-                print(f"⚠️ Login falló con {login_response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(f"Falla crítica: Login falló después de {max_retries} intentos. Error: {err}")
+    login_response = request_until_ok(
+        "Login", lambda attempt: api_client.post_form(endpoint="/auth/login", data=login_payload), retry_statuses=(400,)
+    )
 
     return {
         "id": signup_response.json()["id"],
@@ -157,54 +523,25 @@ def created_admin_user_info(api_client, admin_token, faker):
     }
 
 
-@pytest.fixture
-def created_passenger_user_info(api_client, faker):
+def create_passenger_user(api_client, payloads):
     """
     Crea un usuario 'passenger' a través del endpoint /auth/signup
     y retorna sus datos y su token.
     """
-    max_retries = 5
-    signup_response = None
-
-    # 1. Registrar al usuario con lógica de reintento
-    for attempt in range(max_retries):
-        try:
-            # Generamos un payload de registro único para cada intento
-            signup_payload = {
-                "email": faker.email(),
-                "password": faker.password(length=7),
-                "full_name": faker.name()
-            }
-            response = api_client.post(endpoint="/auth/signup", data=signup_payload)
-            response.raise_for_status()
-            signup_response = response
-            break
-        except requests.exceptions.HTTPError as err:
-            if response.status_code in [400, 500] and attempt < max_retries - 1:
-                print(f"⚠️ Signup falló con {response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(f"Falla crítica: Signup falló después de {max_retries} intentos. Error: {err}")
+    # 1. Registrar al usuario (el email es único por construcción, ver api/utils/unique_keys.py)
+    signup_payload = payloads.signup("passenger")
+    signup_response = request_until_ok(
+        "Signup", lambda attempt: api_client.post(endpoint="/auth/signup", data=signup_payload)
+    )
 
     # 2. Hacer login con el nuevo usuario 'passenger' para obtener su token
     login_payload = {
         "username": signup_payload["email"],
         "password": signup_payload["password"],
     }
-    login_response = None
-
-    # Lógica de reintento para el login
-    for attempt in range(max_retries):
-        try:
-            login_response = api_client.post_form(endpoint="/auth/login", data=login_payload)
-            login_response.raise_for_status()
-            break
-        except requests.exceptions.HTTPError as err:
-            if login_response is not None and login_response.status_code in [400, 500] and attempt < max_retries - 1:
-                print(f"⚠️ Login falló con {login_response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(f"Falla crítica: Login falló después de {max_retries} intentos. Error: {err}")
+    login_response = request_until_ok(
+        "Login", lambda attempt: api_client.post_form(endpoint="/auth/login", data=login_payload), retry_statuses=(400,)
+    )
 
     return {
         "id": signup_response.json()["id"],
@@ -215,268 +552,273 @@ def created_passenger_user_info(api_client, faker):
         "role": signup_response.json()["role"],
     }
 
+def pooled_user(request, token_cache, base_url, role, create_user):
+    """
+    Generador común de los fixtures de usuario: reutiliza un usuario del pool
+    del caché (token aún vigente) salvo que el test tenga la marca 'fresh_user',
+    y al terminar lo devuelve al pool para el siguiente test o corrida.
+    Los usuarios que no quedan en el pool del caché en disco se borran al
+    terminar la sesión (ver api/utils/cleanup.py).
+    """
+    reusable = request.node.get_closest_marker("fresh_user") is None
+    user_info = token_cache.claim_user(base_url, role) if reusable else None
+    if user_info is None:
+        user_info = create_user()
+
+    yield user_info
+
+    if reusable and token_cache.release_user(base_url, role, user_info) and token_cache.persistent:
+        registry = request.config._api_cleanup
+        if registry is not None:
+            registry.keep("users", user_info["id"])
+
+@pytest.fixture
+def created_admin_user_info(request, api_client, admin_token, payloads, token_cache):
+    """
+    Retorna los datos y el token de un usuario admin (reutilizado del pool o recién creado).
+    """
+    yield from pooled_user(
+        request, token_cache, api_client.base_url, "admin",
+        lambda: create_admin_user(api_client, admin_token, payloads)
+    )
+
 @pytest.fixture
-def airport_payload():
+def created_passenger_user_info(request, api_client, payloads, token_cache):
+    """
+    Retorna los datos y el token de un usuario 'passenger' (reutilizado del pool o recién creado).
+    """
+    yield from pooled_user(
+        request, token_cache, api_client.base_url, "passenger",
+        lambda: create_passenger_user(api_client, payloads)
+    )
+
+@pytest.fixture
+def airport_payload(payloads):
     """
     Fixture que genera y retorna un payload de creación de aeropuerto con datos únicos.
     """
-    fake = Faker()
-    payload = {
-        "iata_code": fake.unique.lexify(text="???").upper(),
-        "city": fake.city(),
-        "country": fake.country()
-    }
-    return payload
+    return payloads.airport()
 
 
 @pytest.fixture
-def aircraft_payload(faker):
+def aircraft_payload(payloads):
     """
     Fixture que genera y retorna un payload de creación de aeronave
     con datos válidos y un 'tail_number' con longitud entre 5 y 10.
     """
-    random_length = faker.random_int(min=5, max=10)
-    template = "?" * random_length
-
-    payload = {
-        "tail_number": faker.lexify(text=template).upper(),
-        "model": faker.word(),
-        "capacity": faker.random_int(min=0)
-    }
-    return payload
+    return payloads.aircraft()
 
 @pytest.fixture(scope="session")
-def created_airport_info(api_client, admin_token, faker):
+def created_airport_info(api_client, admin_token, payloads, shared_resources):
+    """
+    Crea un aeropuerto y retorna su payload. El código IATA no se repite en la corrida,
+    pero con solo 3 letras puede existir de corridas anteriores: ahí se usa el siguiente.
+    Con xdist lo crea el primer worker y el resto reutiliza el mismo.
+    """
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
+    payload = {}
+
+    def create(attempt):
+        payload.update(payloads.airport())
+        return admin_api_client.post(endpoint="/airports", data=payload)
 
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            payload = {
-                "iata_code": faker.lexify(text="???").upper(),
-                "city": faker.city(),
-                "country": faker.country()
-            }
-            response = admin_api_client.post(endpoint="/airports", data=payload)
-            response.raise_for_status()
-            return payload
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"⚠️ ERROR: El servidor falló con {response.status_code}. Reintentando...")
+    def create_airport():
+        request_until_ok("La creación del aeropuerto", create, retry_statuses=(400, 409))
+        return payload
+
+    if shared_resources is not None:
+        return shared_resources.get_or_create("created_airport_info", create_airport)
+    return create_airport()
 
 @pytest.fixture(scope="session")
-def created_aircraft_info(api_client, admin_token):
+def created_aircraft_info(api_client, admin_token, payloads, shared_resources):
     """
     Crea una aeronave y retorna su ID.
+    Con xdist la crea el primer worker y el resto reutiliza la misma.
     """
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
-    fake = Faker()
-    payload = {
-        "tail_number": fake.unique.lexify(text="?????").upper(),
-        "model": fake.word(),
-        "capacity": fake.random_int(min=10, max=300)
-    }
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = admin_api_client.post(endpoint="/aircrafts", data=payload)
-            response.raise_for_status()
-            return {"id": response.json()["id"], "payload": payload}
-        except Exception as e:
-            if attempt < max_retries - 1:
-                print(f"⚠️ ERROR: El servidor falló con {response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
+    payload = payloads.aircraft()
+
+    def create_aircraft():
+        response = request_until_ok(
+            "La creación de la aeronave", lambda attempt: admin_api_client.post(endpoint="/aircrafts", data=payload)
+        )
+        return {"id": response.json()["id"], "payload": payload}
+
+    if shared_resources is not None:
+        return shared_resources.get_or_create("created_aircraft_info", create_aircraft)
+    return create_aircraft()
+
+def create_resources_in_batch(client, endpoint, payloads, resource_name, max_retries=5):
+    """
+    Crea varios recursos en paralelo con APIClient.batch y retorna sus respuestas JSON
+    en el mismo orden que 'payloads'. Cada petición ya reintenta sus 5xx en APIClient;
+    las que aun así fallaron se reintentan todas juntas en una nueva oleada.
+    """
+    created = [None] * len(payloads)
+    pending = list(range(len(payloads)))
+
+    def wave(attempt):
+        results = client.batch([("post", endpoint, payloads[i]) for i in pending])
+        failed = []
+        for index, result in zip(pending, results):
+            if result.ok:
+                created[index] = result.response.json()
             else:
-                pytest.fail(f"Falla crítica: La API no respondió correctamente después de {max_retries} intentos. El test no puede continuar. Error: {e}")
+                failed.append((index, result))
+        pending[:] = [index for index, _ in failed]
+        return failed
+
+    try:
+        resilience.engine.retry(f"Batch POST {endpoint}", wave, bool, attempts=max_retries)
+    except resilience.RetryExhaustedError as err:
+        index, result = err.outcome[0]
+        error = result.error or f"status {result.response.status_code}"
+        pytest.fail(
+            f"Falla crítica: No se pudo crear {resource_name} {index + 1} después de {err.attempts} intentos. Error: {error}"
+        )
+    return created
 
 @pytest.fixture(scope="function")
-def created_aircraft_list(api_client, admin_token, faker):
+def created_aircraft_list(api_client, admin_token, payloads):
     """
-    Crea una lista de aeronaves y retorna sus payloads.
+    Crea una lista de aeronaves (en una sola oleada paralela) y retorna sus payloads.
     """
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
-    fake = Faker()
-    max_retries = 5
     num_aircrafts_to_create = 5
-    created_aircrafts = []
 
-    for i in range(num_aircrafts_to_create):
-        payload = {
-            "tail_number": fake.unique.lexify(text="?????").upper(),
-            "model": fake.word(),
-            "capacity": fake.random_int(min=10, max=300)
-        }
+    aircraft_payloads = [payloads.aircraft() for _ in range(num_aircrafts_to_create)]
 
-        for attempt in range(max_retries):
-            try:
-                response = admin_api_client.post(endpoint="/aircrafts", data=payload)
-                response.raise_for_status()
-                created_aircrafts.append(response.json())
-                break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"⚠️ ERROR: Aeronave {i + 1} falló. Reintentando... ({attempt + 1}/{max_retries})")
-                    time.sleep(1)
-                else:
-                    pytest.fail(
-                        f"Falla crítica: No se pudo crear la aeronave {i + 1} después de {max_retries} intentos. Error: {e}"
-                    )
-
-    return created_aircrafts
+    return create_resources_in_batch(admin_api_client, "/aircrafts", aircraft_payloads, "la aeronave")
 
 @pytest.fixture (scope="function")
-def flight_payload(faker, created_airport_info, created_aircraft_info):
+def flight_payload(payloads, created_airport_info, created_aircraft_info):
     """
     Fixture que genera y retorna un payload de creación de vuelo válido.
     """
-    departure_time = faker.date_time_between(start_date="now", end_date="+1d", tzinfo=datetime.timezone.utc)
-    arrival_time = faker.date_time_between(start_date=departure_time, end_date="+2d", tzinfo=datetime.timezone.utc)
+    return payloads.flight(
+        created_airport_info["iata_code"], created_airport_info["iata_code"], created_aircraft_info["id"]
+    )
 
-    payload = {
-        "origin": created_airport_info["iata_code"],
-        "destination": created_airport_info["iata_code"],
-        "departure_time": departure_time.isoformat(),
-        "arrival_time": arrival_time.isoformat(),
-        "base_price": faker.random_int(min=50, max=500),
-        "aircraft_id": created_aircraft_info["id"]
-    }
-    return payload
+@pytest.fixture(scope="session")
+def resource_warehouse(request, api_base_url, admin_token, payloads):
+    """
+    Almacén de recursos pre-creados para la sesión. Los vuelos y reservas se crean
+    por tandas en paralelo y los fixtures de función hacen checkout de uno nuevo
+    en O(1), en lugar de recorrer toda la cadena de creación en cada test.
+    Cada pool se recarga en segundo plano cuando le quedan pocos recursos; al
+    terminar la sesión se esperan las recargas en curso y no se lanzan más.
+    """
+    admin_api_client = APIClient(base_url=api_base_url, token=admin_token)
+    # Al grabar/reproducir cassettes las recargas deben ocurrir siempre en el mismo orden
+    warehouse = ResourceWarehouse(background=cassettes.active_store() is None)
+    # pytest_sessionfinish lo cierra antes de purgar los recursos de la corrida
+    request.config._api_warehouse = warehouse
+
+    def create_airports(count):
+        airport_payloads = [payloads.airport() for _ in range(count)]
+        return create_resources_in_batch(admin_api_client, "/airports", airport_payloads, "el aeropuerto")
+
+    def create_aircrafts(count):
+        aircraft_payloads = [payloads.aircraft() for _ in range(count)]
+        return create_resources_in_batch(admin_api_client, "/aircrafts", aircraft_payloads, "la aeronave")
+
+    def create_flights(count):
+        # Aeropuerto y aeronave propios del almacén: los tests no los modifican
+        airport = warehouse.checkout("airports")
+        aircraft = warehouse.checkout("aircrafts")
+        flight_payloads = [
+            payloads.flight(airport["iata_code"], airport["iata_code"], aircraft["id"]) for _ in range(count)
+        ]
+        return create_resources_in_batch(admin_api_client, "/flights", flight_payloads, "el vuelo")
+
+    def create_bookings(count):
+        flight = warehouse.checkout("flights")
+        booking_payloads = [payloads.booking(flight["id"]) for _ in range(count)]
+        return create_resources_in_batch(admin_api_client, "/bookings", booking_payloads, "la reserva")
+
+    def scoped(name, factory):
+        # Cada recarga tiene su propio ámbito (cassettes y métricas), sin importar qué test la dispare
+        refills = itertools.count()
+
+        def create(count):
+            with cassettes.scoped(f"warehouse:{name}", seed_key=f"warehouse:{name}:{next(refills)}"), \
+                    metrics.scoped(f"warehouse:{name}"):
+                try:
+                    return factory(count)
+                except pytest.fail.Exception as err:
+                    # Las recargas también corren en hilos propios, que solo atrapan Exception
+                    raise RuntimeError(err.msg) from None
+        return create
+
+    # Aeropuertos y aeronaves solo alimentan las recargas de vuelos
+    warehouse.add_pool("airports", scoped("airports", create_airports), size=2, low_watermark=1)
+    warehouse.add_pool("aircrafts", scoped("aircrafts", create_aircrafts), size=2, low_watermark=1)
+    warehouse.add_pool("flights", scoped("flights", create_flights), size=settings.API_WAREHOUSE_SIZE)
+    warehouse.add_pool("bookings", scoped("bookings", create_bookings), size=settings.API_WAREHOUSE_SIZE)
+    yield warehouse
+    warehouse.close()
 
 @pytest.fixture
-def created_flight(auth_api_client, flight_payload):
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            response = auth_api_client.post(endpoint="/flights", data=flight_payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as err:
-            # Captura el código de estado de la respuesta
-            status_code = err.response.status_code
-
-            # Reintenta SOLO si el error es un problema del servidor (5xx)
-            if 500 <= status_code < 600 and attempt < max_retries - 1:
-                print(f"⚠️ Petición falló con {status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                # Falla la prueba si el error es 4xx o si se agotaron los reintentos
-                pytest.fail(f"Falla crítica: La API no respondió correctamente después de {max_retries} intentos. Error: {err}")
+def created_flight(resource_warehouse):
+    """
+    Retorna un vuelo recién creado (respuesta de la API) tomado del almacén de recursos.
+    """
+    return resource_warehouse.checkout("flights")
 
 @pytest.fixture(scope="function")
-def created_flight_list(auth_api_client, flight_payload, faker):
+def created_flight_list(auth_api_client, flight_payload, payloads):
     """
-    Crea una lista de vuelos y retorna sus payloads.
+    Crea una lista de vuelos (en una sola oleada paralela) y retorna sus payloads.
     """
-    max_retries = 5
     num_flights_to_create = 5
-    created_flights_list = []
 
-    for i in range(num_flights_to_create):
+    flight_payloads = []
+    for _ in range(num_flights_to_create):
         payload = flight_payload.copy()
-        payload["base_price"] = faker.random_int(min=50, max=500)
-
-        for attempt in range(max_retries):
-            try:
-                response = auth_api_client.post(endpoint="/flights", data=payload)
-                response.raise_for_status()
-                created_flights_list.append(response.json())
-                break
-            except Exception as e:
-                if attempt < max_retries - 1:
-                    print(f"⚠️ ERROR: Vuelo {i + 1} falló. Reintentando... ({attempt + 1}/{max_retries})")
-                    time.sleep(1)
-                else:
-                    pytest.fail(f"Falla crítica: No se pudo crear el vuelo {i + 1} después de {max_retries} intentos. Error: {e}")
-
-    return created_flights_list
+        payload["base_price"] = payloads.take("price")
+        flight_payloads.append(payload)
+
+    return create_resources_in_batch(auth_api_client, "/flights", flight_payloads, "el vuelo")
 
 @pytest.fixture
-def booking_payload(faker, created_flight):
+def booking_payload(payloads, created_flight):
     """
     Fixture que genera y retorna un payload de reserva válido.
     """
-    payload = {
-        "flight_id": created_flight["id"],
-        "passengers": [
-            {
-                "full_name": faker.name(),
-                "passport": faker.passport_number(),
-                "seat": faker.bothify(text="?#")
-            }
-        ]
-    }
-    return payload
+    return payloads.booking(created_flight["id"])
 
 
 @pytest.fixture
-def created_booking(api_client, admin_token, booking_payload):
+def created_booking(resource_warehouse):
     """
-    Crea una reserva en la API y retorna la respuesta completa de la creación.
+    Retorna una reserva recién creada por el admin (respuesta completa de la creación)
+    tomada del almacén de recursos.
     """
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
-            response = admin_api_client.post(endpoint="/bookings", data=booking_payload)
-
-            # 1. Verifica explícitamente el status code.
-            if response.status_code == 201:
-                return response.json()
-            else:
-                # 2. Si el código no es 201, levanta una excepción para que el reintento funcione.
-                response.raise_for_status()
-
-        except requests.exceptions.HTTPError as err:
-            if attempt < max_retries - 1:
-                print(f"⚠️ Petición falló con {response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(
-                    f"Falla crítica: La API no respondió correctamente después de {max_retries} intentos. Error: {err}")
-        except Exception as e:
-            pytest.fail(f"Ocurrió un error inesperado al crear la reserva: {e}")
+    return resource_warehouse.checkout("bookings")
 
 @pytest.fixture
 def created_booking_as_passenger(api_client, created_passenger_user_info, booking_payload):
     """
     Crea una reserva en la API como un usuario 'passenger' y retorna la respuesta completa de la creación.
     """
-    max_retries = 5
-    for attempt in range(max_retries):
-        try:
-            passenger_api_client = APIClient(base_url=api_client.base_url, token=created_passenger_user_info["token"])
-            response = passenger_api_client.post(endpoint="/bookings", data=booking_payload)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.HTTPError as err:
-            if attempt < max_retries - 1:
-                print(f"⚠️ Petición falló con {response.status_code}. Reintentando... ({attempt + 1}/{max_retries})")
-                time.sleep(1)
-            else:
-                pytest.fail(f"Falla crítica: La API no respondió correctamente después de {max_retries} intentos. Error: {err}")
+    passenger_api_client = APIClient(base_url=api_client.base_url, token=created_passenger_user_info["token"])
+    response = request_until_ok(
+        "La reserva del pasajero", lambda attempt: passenger_api_client.post(endpoint="/bookings", data=booking_payload)
+    )
+    return response.json()
 
 
 @pytest.fixture
-def payment_payload(faker: Faker, created_booking: dict) -> dict:
+def payment_payload(payloads: PayloadFactory, created_booking: dict) -> dict:
     """
     Crea y retorna un payload de pago válido.
     """
-    amount_decimal = faker.pydecimal(left_digits=3, right_digits=2, min_value=0)
-    payload = {
-        "booking_id": created_booking["id"],
-        "amount": float(amount_decimal),
-        "payment_method": faker.credit_card_provider()
-    }
-    return payload
+    return payloads.payment(created_booking["id"])
 
 @pytest.fixture
-def payment_payload_as_passenger(faker: Faker, created_booking_as_passenger: dict) -> dict:
+def payment_payload_as_passenger(payloads: PayloadFactory, created_booking_as_passenger: dict) -> dict:
     """
     Crea y retorna un payload de pago válido para una reserva de pasajero.
     """
-    payload = {
-        "booking_id": created_booking_as_passenger["id"],
-        "amount": float(faker.pydecimal(left_digits=3, right_digits=2, min_value=0)),
-        "payment_method": faker.credit_card_provider()
-    }
-    return payload
+    return payloads.payment(created_booking_as_passenger["id"])
@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import unique_keys
 import requests
 
 # ----------------- Pruebas de Create Aircraft -----------------
@@ -122,7 +123,7 @@ def test_admin_can_update_aircraft_successfully(api_client, admin_token, aircraf
 
     fake = Faker()
     update_payload = {
-        "tail_number": fake.unique.lexify(text="??????").upper(),
+        "tail_number": unique_keys.tail_number(),
         "model": fake.word(),
         "capacity": fake.random_int(min=1, max=200)
     }
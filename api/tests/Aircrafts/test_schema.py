@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 
 ## ----------------- Pruebas de Create Aircraft -----------------
 # ----------------- Pruebas para el campo 'tail_number' (Valores Límite) -----------------
@@ -25,6 +26,7 @@ def test_aircraft_with_valid_tail_number_length_5(auth_api_client, aircraft_payl
     payload["tail_number"] = fake.password(length=5, special_chars=False).upper()
     response = auth_api_client.post(endpoint="/aircrafts", data=payload)
     assert response.status_code == 201
+    schemas.assert_schema("Aircraft", response.json())
 
 def test_aircraft_with_valid_tail_number_length_9(auth_api_client, aircraft_payload):
     """
@@ -35,6 +37,7 @@ def test_aircraft_with_valid_tail_number_length_9(auth_api_client, aircraft_payl
     payload["tail_number"] = fake.password(length=9, special_chars=False).upper()
     response = auth_api_client.post(endpoint="/aircrafts", data=payload)
     assert response.status_code == 201
+    schemas.assert_schema("Aircraft", response.json())
 
 def test_aircraft_with_valid_tail_number_length_10(auth_api_client, aircraft_payload):
     """
@@ -45,6 +48,7 @@ def test_aircraft_with_valid_tail_number_length_10(auth_api_client, aircraft_pay
     payload["tail_number"] = fake.password(length=10, special_chars=False).upper()
     response = auth_api_client.post(endpoint="/aircrafts", data=payload)
     assert response.status_code == 201
+    schemas.assert_schema("Aircraft", response.json())
 
 def test_aircraft_with_invalid_tail_number_length_11(auth_api_client, aircraft_payload):
     """
@@ -65,6 +69,7 @@ def test_aircraft_with_valid_model_string(auth_api_client, aircraft_payload):
     """
     response = auth_api_client.post(endpoint="/aircrafts", data=aircraft_payload)
     assert response.status_code == 201
+    schemas.assert_schema("Aircraft", response.json())
 
 def test_aircraft_with_non_string_model(auth_api_client, aircraft_payload):
     """
@@ -148,6 +153,7 @@ def test_get_aircrafts_with_skip_equal_to_zero(api_client):
     response = api_client.get(endpoint="/aircrafts", params=params)
 
     assert response.status_code == 200
+    schemas.assert_schema("Aircraft", response.json(), many=True)
     assert len(response.json()) == 2
 
 # ----------------- Pruebas de Get Aircraft por ID-----------------
@@ -214,6 +220,7 @@ def test_update_aircraft_with_valid_tail_number_length_5(api_client, admin_token
     response = admin_api_client.put(endpoint=f"/aircrafts/{aircraft_id_to_update}", json_data=update_payload)
 
     assert response.status_code == 200
+    schemas.assert_schema("Aircraft", response.json())
 
 
 def test_update_aircraft_with_valid_tail_number_length_9(api_client, admin_token, aircraft_payload):
@@ -234,6 +241,7 @@ def test_update_aircraft_with_valid_tail_number_length_9(api_client, admin_token
     response = admin_api_client.put(endpoint=f"/aircrafts/{aircraft_id_to_update}", json_data=update_payload)
 
     assert response.status_code == 200
+    schemas.assert_schema("Aircraft", response.json())
 
 
 def test_update_aircraft_with_valid_tail_number_length_10(api_client, admin_token, aircraft_payload):
@@ -254,6 +262,7 @@ def test_update_aircraft_with_valid_tail_number_length_10(api_client, admin_toke
     response = admin_api_client.put(endpoint=f"/aircrafts/{aircraft_id_to_update}", json_data=update_payload)
 
     assert response.status_code == 200
+    schemas.assert_schema("Aircraft", response.json())
 
 
 def test_update_aircraft_with_invalid_tail_number_length_11(api_client, admin_token, aircraft_payload):
@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 import requests
 
 # ----------------- Pruebas para Create Airport -----------------
@@ -55,14 +56,9 @@ def test_get_airports_successfully(api_client):
     assert response.status_code == 200
 
     response_data = response.json()
-    assert isinstance(response_data, list)
+    schemas.assert_schema("Airport", response_data, many=True)
     assert len(response_data) == 3
 
-    # Validar el schema de un aeropuerto en la lista
-    assert "iata_code" in response_data[0]
-    assert "city" in response_data[0]
-    assert "country" in response_data[0]
-
 
 def test_get_airports_according_pagination(api_client):
     """
@@ -105,12 +101,15 @@ def test_get_airport_with_non_existent_iata_code(api_client):
 
 # ----------------- Pruebas para Update Airport -----------------
 
-def test_admin_can_update_airport_successfully(api_client, admin_token, created_airport_info):
+def test_admin_can_update_airport_successfully(api_client, admin_token, airport_payload):
     """
     Verifica que un usuario admin puede actualizar un aeropuerto con éxito.
     """
+    # Precondición: crear un aeropuerto propio (el de sesión lo usan otros tests y workers)
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
-    iata_code_to_update = created_airport_info["iata_code"]
+    creation_response = admin_api_client.post(endpoint="/airports", data=airport_payload)
+    assert creation_response.status_code == 201
+    iata_code_to_update = airport_payload["iata_code"]
 
     # Crear payload de actualización
     from faker import Faker
@@ -173,13 +172,16 @@ def test_update_airport_fails_without_token(api_client, airport_payload, admin_t
 
 # ----------------- Pruebas para Delete Airport -----------------
 
-def test_admin_can_delete_airport_successfully(api_client, admin_token, created_airport_info):
+def test_admin_can_delete_airport_successfully(api_client, admin_token, airport_payload):
     """
     Verifica que un usuario 'admin' puede eliminar un aeropuerto con éxito.
     """
+    # Precondición: crear un aeropuerto propio (el de sesión lo usan otros tests)
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
+    creation_response = admin_api_client.post(endpoint="/airports", data=airport_payload)
+    assert creation_response.status_code == 201
 
-    iata_code_to_delete = created_airport_info["iata_code"]
+    iata_code_to_delete = airport_payload["iata_code"]
 
     # Acción: Eliminar el aeropuerto
     delete_response = admin_api_client.delete(f"/airports/{iata_code_to_delete}")
@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas, unique_keys
 
 # ----------------- Pruebas para Create Airport -----------------
 # ----------------- Pruebas para el campo 'iata_code' -----------------
@@ -9,20 +10,8 @@ def test_create_airport_with_valid_iata_code(created_airport_info):
     """
     Verifica que la API acepta un código IATA de 3 letras.
     """
-    airport_data = created_airport_info
-
-    assert "iata_code" in airport_data
-    assert "city" in airport_data
-    assert "country" in airport_data
-
-    # Validar tipos
-    assert isinstance(airport_data["iata_code"], str)
-    assert isinstance(airport_data["city"], str)
-    assert isinstance(airport_data["country"], str)
-
-    # Validar patrón de iata_code
-    assert len(airport_data["iata_code"]) == 3
-    assert airport_data["iata_code"].isupper()
+    # Campos, tipos y patrón ^[A-Z]{3}$ del iata_code
+    schemas.assert_schema("Airport", created_airport_info)
 
 def test_create_airport_with_invalid_iata_code_length(auth_api_client, airport_payload):
     """
@@ -48,9 +37,8 @@ def test_create_airport_with_valid_city_string(created_airport_info):
     """
     Verifica que el city del aeropuerto creado sea un string.
     """
-    airport_data = created_airport_info
-    assert isinstance(airport_data["city"], str)
-    assert len(airport_data["city"]) > 0
+    schemas.assert_schema("Airport", created_airport_info)
+    assert len(created_airport_info["city"]) > 0
 
 def test_create_airport_with_non_string_city(auth_api_client, airport_payload):
     """
@@ -68,9 +56,8 @@ def test_create_airport_with_valid_country_string(created_airport_info):
     """
     Verifica que el country del aeropuerto creado sea un string.
     """
-    airport_data = created_airport_info
-    assert isinstance(airport_data["country"], str)
-    assert len(airport_data["country"]) > 0
+    schemas.assert_schema("Airport", created_airport_info)
+    assert len(created_airport_info["country"]) > 0
 
 def test_create_airport_with_non_string_country(auth_api_client, airport_payload):
     """
@@ -144,6 +131,7 @@ def test_get_airports_with_skip_equal_to_zero(api_client):
     response = api_client.get(endpoint="/airports", params=params)
 
     assert response.status_code == 200
+    schemas.assert_schema("Airport", response.json(), many=True)
     assert len(response.json()) == 2
 
 # ----------------- Pruebas para Listar aeropuertos según IATA CODE -----------------
@@ -193,16 +181,19 @@ def test_update_airport_with_invalid_iata_code_length(api_client, admin_token, c
     assert response.json()["detail"][0]["msg"] == "String should match pattern '^[A-Z]{3}$'"
 
 
-def test_update_airport_with_valid_iata_code(api_client, admin_token, created_airport_info):
+def test_update_airport_with_valid_iata_code(api_client, admin_token, airport_payload):
     """
     Verifica que la API acepta una actualización con un código IATA de 3 letras.
     """
+    # Precondición: crear un aeropuerto propio, porque el test le cambia el código IATA
     admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
-    iata_code_to_update = created_airport_info["iata_code"]
+    creation_response = admin_api_client.post(endpoint="/airports", data=airport_payload)
+    assert creation_response.status_code == 201
+    iata_code_to_update = airport_payload["iata_code"]
 
     fake = Faker()
     update_payload = {
-        "iata_code": "NEW",
+        "iata_code": unique_keys.iata_code(),
         "city": fake.city(),
         "country": fake.country()
     }
@@ -213,6 +204,7 @@ def test_update_airport_with_valid_iata_code(api_client, admin_token, created_ai
     )
 
     assert response.status_code == 200
+    schemas.assert_schema("Airport", response.json())
 
 def test_update_airport_with_non_string_country(api_client, admin_token, airport_payload):
     """
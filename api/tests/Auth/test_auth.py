@@ -118,8 +118,7 @@ def test_login_with_json_payload(api_client, created_passenger_user_info):
         "username": created_passenger_user_info["email"],
         "password": created_passenger_user_info["password"],
     }
-    login_url = f"{api_client.base_url}/auth/login"
-    login_response = requests.post(login_url, json=login_payload_json)
+    login_response = api_client.post(endpoint="/auth/login", data=login_payload_json)
     assert login_response.status_code == 422
     assert login_response.json()["detail"][0]["type"] == "missing"
     assert "Field required" in login_response.json()["detail"][0]["msg"]
\ No newline at end of file
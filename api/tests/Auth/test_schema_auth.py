@@ -1,6 +1,7 @@
 import pytest
 import requests
 from faker import Faker
+from api.utils import schemas
 # ----------------- Pruebas para los campos en Signup -----------------
 
 # ----------------- Pruebas para el campo 'email' -----------------
@@ -11,6 +12,7 @@ def test_signup_with_valid_email(api_client, signup_payload):
     """
     response = api_client.post("/auth/signup", data=signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 
 def test_signup_invalid_email_format(api_client, signup_payload):
@@ -36,6 +38,7 @@ def test_signup_password_exactly_6_characters(api_client, signup_payload):
     signup_payload["password"] = fake.password(length=6)
     response = api_client.post("/auth/signup", data=signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 
 def test_signup_password_too_short(api_client, signup_payload):
@@ -62,6 +65,7 @@ def test_signup_password_more_than_6_characters(api_client, signup_payload):
     signup_payload["password"] = fake.password(length=7)
     response = api_client.post("/auth/signup", data=signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 # ----------------- Pruebas para el campo 'full_name' -----------------
 
@@ -71,6 +75,7 @@ def test_signup_with_valid_full_name(api_client, signup_payload):
     """
     response = api_client.post("/auth/signup", data=signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 
 def test_signup_with_non_string_full_name(api_client, signup_payload):
@@ -102,10 +107,7 @@ def test_login_successful_with_valid_string_username(api_client, created_passeng
 
     assert login_response.status_code == 200
 
-    response_data = login_response.json()
-    assert "access_token" in response_data
-    assert "token_type" in response_data
-    assert response_data["token_type"] == "bearer"
+    schemas.assert_schema("Token", login_response.json())
 
 def test_login_unsuccessful_non_string_username(api_client, created_passenger_user_info):
     """
@@ -136,10 +138,7 @@ def test_login_successful_with_valid_string_password(api_client, created_passeng
 
     assert login_response.status_code == 200
 
-    response_data = login_response.json()
-    assert "access_token" in response_data
-    assert "token_type" in response_data
-    assert response_data["token_type"] == "bearer"
+    schemas.assert_schema("Token", login_response.json())
 
 def test_login_unsuccessful_non_string_password(api_client, created_passenger_user_info):
     """
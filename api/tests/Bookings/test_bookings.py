@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 
 # ----------------- Pruebas Create Booking -----------------
 
@@ -114,6 +115,20 @@ def test_get_bookings_according_pagination(api_client, created_booking, admin_to
     assert len(response_data) == 2
     assert isinstance(response_data, list)
 
+
+def test_iter_bookings_pages_from_skip(api_client, created_booking, admin_token):
+    """
+    Verifica que APIClient.iter_pages arranque desde el 'skip' indicado, pida
+    una página por reserva y se detenga en 'max_items'.
+    """
+    admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
+
+    bookings = list(admin_api_client.iter_pages(endpoint="/bookings", page_size=1, params={"skip": 1}, max_items=2))
+    expected = admin_api_client.get(endpoint="/bookings", params={"skip": 1, "limit": 2}).json()
+
+    assert [booking["id"] for booking in bookings] == [booking["id"] for booking in expected]
+    schemas.assert_schema("Booking", bookings, many=True)
+
 # ----------------- Pruebas Get Booking por ID-----------------
 
 def test_get_booking_by_id_with_admin_token(api_client, created_booking, admin_token):
@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 
 # ----------------- Pruebas Create Booking -----------------
 
@@ -104,6 +105,7 @@ def test_get_bookings_with_skip_equal_to_zero(auth_api_client):
     response = auth_api_client.get(endpoint="/bookings", params=params)
 
     assert response.status_code == 200
+    schemas.assert_schema("Booking", response.json(), many=True)
     assert len(response.json()) == 1
 
 # ----------------- Pruebas Get Booking por ID-----------------
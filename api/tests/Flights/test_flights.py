@@ -68,6 +68,31 @@ def test_search_flights_with_pagination(api_client, created_flight_list):
     assert len(response_data) == 2
     assert isinstance(response_data, list)
 
+
+def test_iter_flights_pages_stops_on_short_page(api_client, created_flight):
+    """
+    Verifica que APIClient.iter_pages entregue todos los vuelos de la búsqueda
+    y deje de pedir páginas con la primera incompleta.
+    """
+    params = {"origin": created_flight["origin"], "destination": created_flight["destination"]}
+    expected = api_client.get(endpoint="/flights", params=dict(params, skip=0, limit=1000)).json()
+    page_size = 3
+    requests_sent = []
+
+    def count_pages(record):
+        if record.method == "GET" and record.endpoint == "/flights":
+            requests_sent.append(record)
+
+    APIClient.add_hook(count_pages)
+    try:
+        flights = list(api_client.iter_pages(endpoint="/flights", page_size=page_size, params=params))
+    finally:
+        APIClient.remove_hook(count_pages)
+
+    assert [flight["id"] for flight in flights] == [flight["id"] for flight in expected]
+    # Una página por cada 'page_size' vuelos más la incompleta (vacía si la última estaba llena)
+    assert len(requests_sent) == len(expected) // page_size + 1
+
 # ----------------- Pruebas Get Flight por ID-----------------
 
 def test_get_flight_by_id_successfully(api_client, created_flight):
@@ -2,6 +2,7 @@ import pytest
 import datetime
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 
 # ----------------- Pruebas Create Flight-----------------
 
@@ -11,6 +12,7 @@ def test_create_flight_with_valid_data(auth_api_client, flight_payload):
     """
     response = auth_api_client.post(endpoint="/flights", data=flight_payload)
     assert response.status_code == 201
+    schemas.assert_schema("Flight", response.json())
 
 
 def test_create_flight_with_invalid_origin_iata_code_format(auth_api_client, flight_payload):
@@ -162,6 +164,7 @@ def test_search_flights_with_skip_equal_to_zero(api_client):
     params = {"skip": 0, "limit": 1}
     response = api_client.get(endpoint="/flights", params=params)
     assert response.status_code == 200
+    schemas.assert_schema("Flight", response.json(), many=True)
     assert len(response.json()) == 1
 
 # ----------------- Pruebas Get Flight por ID-----------------
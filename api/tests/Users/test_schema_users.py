@@ -1,6 +1,7 @@
 import pytest
 from faker import Faker
 from api.utils.api_client import APIClient
+from api.utils import schemas
 
 # ----------------- Pruebas para Create User as Admin -----------------
 
@@ -10,8 +11,8 @@ def test_create_admin_user_with_valid_email(created_admin_user_info):
     """
     Verifica que la creación de usuario admin con un email válido es exitosa.
     """
+    schemas.assert_schema("User", created_admin_user_info)
     assert created_admin_user_info["role"] == "admin"
-    assert "@" in created_admin_user_info["email"]
     assert created_admin_user_info["full_name"] != ""
 
 def test_create_admin_user_with_invalid_email_format(auth_api_client, admin_signup_payload):
@@ -37,6 +38,7 @@ def test_create_admin_user_password_exactly_6_characters(auth_api_client, admin_
     admin_signup_payload["password"] = fake.password(length=6)
     response = auth_api_client.post(endpoint="/users", data=admin_signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 
 def test_create_admin_user_password_too_short(auth_api_client, admin_signup_payload):
@@ -63,6 +65,7 @@ def test_create_admin_user_password_more_than_6_characters(auth_api_client, admi
     admin_signup_payload["password"] = fake.password(length=7)
     response = auth_api_client.post(endpoint="/users", data=admin_signup_payload)
     assert response.status_code == 201
+    schemas.assert_schema("User", response.json())
 
 
 # ----------------- Pruebas para el campo 'full_name' -----------------
@@ -71,8 +74,8 @@ def test_create_admin_user_with_valid_full_name(created_admin_user_info):
     """
     Verifica que la creación es exitosa cuando se envía un full_name válido (string).
     """
+    schemas.assert_schema("User", created_admin_user_info)
     assert created_admin_user_info["role"] == "admin"
-    assert "@" in created_admin_user_info["email"]
     assert created_admin_user_info["full_name"] != ""
 
 
@@ -95,8 +98,8 @@ def test_create_admin_user_with_valid_role(created_admin_user_info):
     """
     Verifica que la creación es exitosa cuando se envía un rol válido (admin).
     """
+    schemas.assert_schema("User", created_admin_user_info)
     assert created_admin_user_info["role"] == "admin"
-    assert "@" in created_admin_user_info["email"]
     assert created_admin_user_info["full_name"] != ""
 
 
@@ -130,8 +133,8 @@ def test_get_users_with_valid_skip_and_limit(api_client, admin_token):
     assert response.status_code == 200
 
     response_data = response.json()
+    schemas.assert_schema("User", response_data, many=True)
     assert len(response_data) == 2
-    assert isinstance(response_data, list)
 
 def test_get_users_with_non_integer_skip(api_client, admin_token):
     """
@@ -193,6 +196,7 @@ def test_get_users_with_skip_equal_to_zero(api_client, admin_token):
     response = admin_api_client.get(endpoint="/users", params=params)
 
     assert response.status_code == 200
+    schemas.assert_schema("User", response.json(), many=True)
     assert len(response.json()) == 2
 
 
@@ -2,7 +2,7 @@ import pytest
 import requests
 from faker import Faker
 from api.utils.api_client import APIClient
-from api.utils import settings
+from api.utils import schemas, settings, unique_keys
 
 # ----------------- Pruebas para Create User as Admin -----------------
 
@@ -69,8 +69,7 @@ def test_create_user_fails_with_passenger_token(api_client, signup_payload):
         "password": signup_payload["password"],
     }
 
-    login_url = f"{api_client.base_url}/auth/login"
-    login_response = requests.post(login_url, data=login_payload)
+    login_response = api_client.post_form(endpoint="/auth/login", data=login_payload)
     user_token = login_response.json()["access_token"]
 
     # 3. Crear una instancia de APIClient con el token del usuario normal
@@ -101,15 +100,9 @@ def test_get_users_successfully(api_client, admin_token):
     assert response.status_code == 200
 
     response_data = response.json()
-    assert isinstance(response_data, list)
+    schemas.assert_schema("User", response_data, many=True)
     assert len(response_data) == 3
 
-    # Validar el schema de un usuario en la lista
-    assert "id" in response_data[0]
-    assert "email" in response_data[0]
-    assert "full_name" in response_data[0]
-    assert "role" in response_data[0]
-
 
 def test_get_users_according_pagination(api_client, admin_token):
     """
@@ -127,6 +120,21 @@ def test_get_users_according_pagination(api_client, admin_token):
     assert isinstance(response_data, list)
 
 
+def test_iter_users_pages_across_several_pages(api_client, admin_token):
+    """
+    Verifica que APIClient.iter_pages recorra /users pidiendo varias páginas,
+    que entregue los mismos usuarios (y en el mismo orden) que una sola petición
+    con skip/limit y que cada uno cumpla el schema.
+    """
+    admin_api_client = APIClient(base_url=api_client.base_url, token=admin_token)
+
+    users = list(admin_api_client.iter_pages(endpoint="/users", page_size=2, max_items=3))
+    expected = admin_api_client.get(endpoint="/users", params={"skip": 0, "limit": 3}).json()
+
+    assert [user["id"] for user in users] == [user["id"] for user in expected]
+    schemas.assert_schema("User", users, many=True)
+
+
 def test_get_users_fails_with_passenger_token(api_client, created_passenger_user_info):
     """
     Verifica que un usuario 'passenger' no puede acceder a la lista de usuarios.
@@ -210,6 +218,7 @@ def test_get_my_user_data_without_token(api_client):
 
 # ----------------- Pruebas para Update Users -----------------
 
+@pytest.mark.fresh_user
 def test_passenger_user_can_successfully_update_password(api_client, created_passenger_user_info):
     """
     Verifica que un usuario puede actualizar su propio password y que la API
@@ -239,6 +248,7 @@ def test_passenger_user_can_successfully_update_password(api_client, created_pas
     # Validar que la actualización fue exitosa
     assert update_response.status_code == 200
 
+@pytest.mark.fresh_user
 def test_passenger_login_with_new_password(api_client, created_passenger_user_info):
     """
     Verifica que el password actualizado se puede usar para iniciar sesión.
@@ -286,8 +296,7 @@ def test_passenger_user_can_successfully_update_email(api_client, signup_payload
     user_api_client = APIClient(base_url=api_client.base_url, token=user_token)
 
     # 3. Preparar el payload de actualización con un nuevo email
-    fake = Faker()
-    new_email = fake.email()
+    new_email = unique_keys.email("user")
     update_payload = {
         "email": new_email,
         "password": signup_payload["password"],
@@ -316,8 +325,7 @@ def test_passenger_updated_email_is_reflected_in_me_endpoint(api_client, signup_
     user_token = login_response.json()["access_token"]
     user_api_client = APIClient(base_url=api_client.base_url, token=user_token)
 
-    fake = Faker()
-    new_email = fake.email()
+    new_email = unique_keys.email("user")
     update_payload = {
         "email": new_email,
         "password": signup_payload["password"],
@@ -331,6 +339,7 @@ def test_passenger_updated_email_is_reflected_in_me_endpoint(api_client, signup_
     assert me_response.status_code == 200
     assert me_response.json()["email"] == new_email
 
+@pytest.mark.fresh_user
 def test_passenger_user_can_successfully_update_full_name(api_client, created_passenger_user_info, faker):
     """
     Verifica que un usuario puede actualizar su nombre completo.
@@ -382,6 +391,7 @@ def test_passenger_updated_full_name_is_reflected_in_me_endpoint(api_client, sig
     assert me_response.json()["full_name"] == new_full_name
 
 
+@pytest.mark.fresh_user
 def test_admin_user_can_successfully_update_password(api_client, created_admin_user_info):
     """
     Verifica que un usuario admin puede actualizar su propio password y que la API
@@ -401,6 +411,7 @@ def test_admin_user_can_successfully_update_password(api_client, created_admin_u
     update_response = admin_api_client.put(endpoint=f"/users/{user_id}", json_data=update_payload)
     assert update_response.status_code == 200
 
+@pytest.mark.fresh_user
 def test_admin_login_with_new_password_fails(api_client, created_admin_user_info):
     """
     Verifica el bug de la API donde el login con un password de admin recién actualizado
@@ -423,6 +434,7 @@ def test_admin_login_with_new_password_fails(api_client, created_admin_user_info
     new_login_response = api_client.post_form(endpoint="/auth/login", data=new_login_payload)
     assert new_login_response.status_code == 500
 
+@pytest.mark.fresh_user
 def test_admin_user_can_successfully_update_email(api_client, created_admin_user_info):
     """
     Verifica que un usuario admin puede actualizar su propio email.
@@ -430,8 +442,7 @@ def test_admin_user_can_successfully_update_email(api_client, created_admin_user
     user_id = created_admin_user_info["id"]
     admin_api_client = APIClient(base_url=api_client.base_url, token=created_admin_user_info["token"])
 
-    fake = Faker()
-    new_email = fake.email()
+    new_email = unique_keys.email("user")
     update_payload = {
         "email": new_email,
         "password": created_admin_user_info["password"],
@@ -441,6 +452,7 @@ def test_admin_user_can_successfully_update_email(api_client, created_admin_user
     update_response = admin_api_client.put(endpoint=f"/users/{user_id}", json_data=update_payload)
     assert update_response.status_code == 200
 
+@pytest.mark.fresh_user
 def test_admin_updated_email_is_reflected_in_me_endpoint(api_client, created_admin_user_info):
     """
     Verifica que el email actualizado de un admin se refleja al obtener el usuario con /users/me.
@@ -448,8 +460,7 @@ def test_admin_updated_email_is_reflected_in_me_endpoint(api_client, created_adm
     user_id = created_admin_user_info["id"]
     admin_api_client = APIClient(base_url=api_client.base_url, token=created_admin_user_info["token"])
 
-    fake = Faker()
-    new_email = fake.email()
+    new_email = unique_keys.email("user")
     update_payload = {
         "email": new_email,
         "password": created_admin_user_info["password"],
@@ -463,6 +474,7 @@ def test_admin_updated_email_is_reflected_in_me_endpoint(api_client, created_adm
     assert me_response.status_code == 200
     assert me_response.json()["email"] == new_email
 
+@pytest.mark.fresh_user
 def test_admin_user_can_successfully_update_full_name(api_client, created_admin_user_info):
     """
     Verifica que un usuario admin puede actualizar su nombre completo.
@@ -481,6 +493,7 @@ def test_admin_user_can_successfully_update_full_name(api_client, created_admin_
     update_response = admin_api_client.put(endpoint=f"/users/{user_id}", json_data=update_payload)
     assert update_response.status_code == 200
 
+@pytest.mark.fresh_user
 def test_admin_updated_full_name_is_reflected_in_me_endpoint(api_client, created_admin_user_info):
     """
     Verifica que el nombre actualizado de un admin se refleja al obtener el usuario con /users/me.
@@ -524,8 +537,7 @@ def test_passenger_cannot_delete_user_returns_403(api_client, created_passenger_
 
     # 1. Crear un segundo usuario para intentar eliminarlo
     second_user_payload = signup_payload.copy()
-    fake = Faker()
-    second_user_payload["email"] = fake.email()
+    second_user_payload["email"] = unique_keys.email("user")
 
     signup_response = api_client.post(endpoint="/auth/signup", data=second_user_payload)
     assert signup_response.status_code == 201
@@ -540,6 +552,7 @@ def test_passenger_cannot_delete_user_returns_403(api_client, created_passenger_
     assert response.json()["detail"] == "Admin privileges required"
 
 
+@pytest.mark.fresh_user
 def test_admin_can_delete_passenger_user(api_client, created_admin_user_info, created_passenger_user_info):
     """
     Verifica que un usuario 'admin' puede eliminar a un usuario 'passenger' con éxito.
@@ -0,0 +1,92 @@
+import threading
+import time
+
+import pytest
+
+from api.utils import cassettes, session_pool
+from api.utils.api_client import APIClient
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """
+    Cliente cuyo get() no sale a la red: espera lo indicado en params["delay"],
+    retorna el endpoint y anota cuántas llamadas corrían a la vez.
+    """
+    monkeypatch.setattr(session_pool, "_adapters", {})
+    client = APIClient(base_url="https://batch.test")
+    client.calls = []
+    client.max_in_flight = 0
+    in_flight = [0]
+    lock = threading.Lock()
+
+    def get(endpoint, params=None):
+        with lock:
+            in_flight[0] += 1
+            client.max_in_flight = max(client.max_in_flight, in_flight[0])
+            client.calls.append(endpoint)
+        time.sleep((params or {}).get("delay", 0))
+        with lock:
+            in_flight[0] -= 1
+        return endpoint
+
+    monkeypatch.setattr(client, "get", get)
+    return client
+
+
+# ----------------- Pruebas de APIClient.batch -----------------
+
+def test_batch_keeps_the_input_order(client, monkeypatch):
+    """
+    Verifica que los resultados salgan en el orden de la entrada aunque las
+    primeras peticiones terminen últimas.
+    """
+    monkeypatch.setattr(cassettes, "active_store", lambda: None)
+    specs = [("get", f"/flights/{index}", {"delay": 0.05 - index * 0.01}) for index in range(5)]
+
+    results = client.batch(specs, max_concurrency=5)
+
+    assert [result.response for result in results] == [f"/flights/{index}" for index in range(5)]
+    assert [result.spec for result in results] == specs
+    assert client.max_in_flight > 1
+
+
+def test_batch_rejects_an_invalid_method_before_sending(client):
+    """
+    Verifica que un método que no está en BATCH_METHODS lance ValueError sin enviar nada.
+    """
+    with pytest.raises(ValueError, match="'fetch'"):
+        client.batch([("get", "/flights"), ("fetch", "/flights")])
+
+    assert client.calls == []
+
+
+def test_batch_captures_errors_per_request(client, monkeypatch):
+    """
+    Verifica que el error de una petición quede en su BatchResult sin cortar las demás.
+    """
+    def delete(endpoint):
+        raise RuntimeError("sin conexión")
+
+    monkeypatch.setattr(client, "delete", delete)
+
+    results = client.batch([("get", "/flights"), ("delete", "/flights/1")])
+
+    assert results[0].response == "/flights"
+    assert isinstance(results[1].error, RuntimeError)
+    assert not results[1].ok
+
+
+def test_batch_is_serialized_under_cassettes(client, monkeypatch):
+    """
+    Verifica que con --api-record / --api-replay activo batch corra de a una
+    petición, para que el orden grabado sea reproducible.
+    """
+    monkeypatch.setattr(cassettes, "active_store", lambda: object())
+    specs = [("get", f"/flights/{index}", {"delay": 0.01}) for index in range(4)]
+
+    results = client.batch(specs, max_concurrency=4)
+
+    assert client.max_in_flight == 1
+    assert client.calls == [f"/flights/{index}" for index in range(4)]
+    assert [result.response for result in results] == client.calls
@@ -0,0 +1,154 @@
+import pytest
+
+from api.utils import cassettes, cleanup, settings, unique_keys
+from api.utils.api_client import APIClient
+from api.utils.metrics import CallRecord
+
+# Contra la API falsa en memoria: sin cassettes, que no tienen grabadas estas llamadas
+pytestmark = pytest.mark.skipif(
+    cassettes.active_store() is not None, reason="⚠️ Los tests de limpieza no corren con --api-record/--api-replay"
+)
+
+BASE_URL = settings.FAKE_API_BASE_URL
+
+
+@pytest.fixture
+def admin():
+    return cleanup.admin_client(BASE_URL)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    registry = cleanup.TeardownRegistry(BASE_URL, tmp_path).open()
+    yield registry
+    if registry.ledger.lock.is_locked:
+        registry.close()
+
+
+def create_chain(admin, payloads):
+    """Aeropuerto, aeronave, vuelo y reserva encadenados; retorna {kind: id}."""
+    airport = admin.post(endpoint="/airports", data=payloads.airport()).json()
+    aircraft = admin.post(endpoint="/aircrafts", data=payloads.aircraft()).json()
+    flight = admin.post(
+        endpoint="/flights", data=payloads.flight(airport["iata_code"], airport["iata_code"], aircraft["id"])
+    ).json()
+    booking = admin.post(endpoint="/bookings", data=payloads.booking(flight["id"])).json()
+    return {"airports": airport["iata_code"], "aircrafts": aircraft["id"], "flights": flight["id"], "bookings": booking["id"]}
+
+
+class FakeResponse:
+    def __init__(self, body, status_code=200):
+        self.body = body
+        self.status_code = status_code
+        self.ok = status_code < 400
+
+    def json(self):
+        return self.body
+
+# ----------------- Pruebas del ledger -----------------
+
+def test_registry_records_creates_and_forgets_deletes(admin, registry, payloads):
+    """
+    Verifica que el ledger anote cada recurso creado (el aeropuerto con su ciudad y país)
+    y olvide los que se borraron.
+    """
+    airport_payload = payloads.airport()
+    admin.post(endpoint="/airports", data=airport_payload)
+    aircraft_id = admin.post(endpoint="/aircrafts", data=payloads.aircraft()).json()["id"]
+    admin.delete(f"/aircrafts/{aircraft_id}")
+
+    base_url, items = registry.ledger.pending()
+
+    assert base_url == BASE_URL
+    assert items == {
+        ("airports", airport_payload["iata_code"]): {
+            "city": airport_payload["city"], "country": airport_payload["country"],
+        },
+    }
+
+
+def test_registry_follows_airport_renamed_by_put(registry):
+    """
+    Verifica que un PUT que cambia el código IATA de un aeropuerto propio mueva la
+    anotación al código nuevo, y que un PUT sobre un aeropuerto ajeno se ignore.
+    """
+    old_code, new_code = unique_keys.iata_code(), unique_keys.iata_code()
+    created = {"iata_code": old_code, "city": "Lima", "country": "Peru"}
+    renamed = {"iata_code": new_code, "city": "Cusco", "country": "Peru"}
+    registry(CallRecord("POST", f"{BASE_URL}/airports", 201, 0, 0, 0.01, response=FakeResponse(created, 201)))
+    registry(CallRecord("PUT", f"{BASE_URL}/airports/{old_code}", 200, 0, 0, 0.01, response=FakeResponse(renamed)))
+    registry(CallRecord("PUT", f"{BASE_URL}/airports/ZZZ", 200, 0, 0, 0.01, response=FakeResponse(renamed)))
+
+    _, items = registry.ledger.pending()
+
+    assert items == {("airports", new_code): {"city": "Cusco", "country": "Peru"}}
+
+# ----------------- Pruebas de la purga -----------------
+
+def test_purge_deletes_dependents_before_their_parents(admin, payloads):
+    """
+    Verifica que la purga borre por niveles (reservas, vuelos, aeronaves/aeropuertos)
+    aunque los recursos lleguen en otro orden.
+    """
+    chain = create_chain(admin, payloads)
+    deleted = []
+
+    def hook(record):
+        if record.method == "DELETE" and record.url.startswith(BASE_URL):
+            deleted.append(record.url[len(BASE_URL):].split("/")[1])
+
+    APIClient.add_hook(hook)
+    try:
+        report = cleanup.purge(admin, [(kind, str(resource_id)) for kind, resource_id in chain.items()])
+    finally:
+        APIClient.remove_hook(hook)
+
+    assert report["failed"] == []
+    assert sum(report["deleted"].values()) == 4
+    assert deleted[:2] == ["bookings", "flights"]
+    assert sorted(deleted[2:]) == ["aircrafts", "airports"]
+    assert admin.get(f"/flights/{chain['flights']}").status_code == 404
+
+
+def test_purge_skips_airport_reused_by_another_run(admin, payloads):
+    """
+    Verifica que si el código IATA ya es de otro aeropuerto (otra ciudad/país)
+    la purga no lo borre.
+    """
+    airport_payload = payloads.airport()
+    admin.post(endpoint="/airports", data=airport_payload)
+    code = airport_payload["iata_code"]
+    identity = {"city": "Otra ciudad", "country": "Otro país"}
+
+    report = cleanup.purge(admin, [("airports", code)], {("airports", code): identity})
+
+    assert report["reused"] == 1
+    assert report["deleted"] == {}
+    assert admin.get(f"/airports/{code}").status_code == 200
+    admin.delete(f"/airports/{code}")
+
+# ----------------- Pruebas del recolector offline -----------------
+
+def test_gc_purges_ledgers_left_by_a_crashed_run(admin, tmp_path, payloads):
+    """
+    Verifica que python -m api.utils.cleanup borre lo que dejó una corrida que no
+    purgó (su ledger quedó sin lock) y que omita los ledgers que siguen en uso.
+    """
+    crashed = cleanup.TeardownRegistry(BASE_URL, tmp_path).open()
+    chain = create_chain(admin, payloads)
+    crashed.close()
+
+    running = cleanup.Ledger(tmp_path / "otra-corrida.main.1.jsonl")
+    running.lock.acquire()
+    running.append({"op": "open", "base_url": BASE_URL})
+    running.append({"op": "add", "kind": "flights", "id": "en-curso"})
+    try:
+        exit_code = cleanup.main(["--dir", str(tmp_path), "--base-url", BASE_URL])
+    finally:
+        running.release()
+
+    assert exit_code == 0
+    assert not crashed.ledger.path.exists()
+    assert admin.get(f"/airports/{chain['airports']}").status_code == 404
+    assert admin.get(f"/aircrafts/{chain['aircrafts']}").status_code == 404
+    assert running.pending()[1] == {("flights", "en-curso"): None}
@@ -0,0 +1,56 @@
+from api.utils.metrics import CallRecord, MetricsRecorder
+from api.utils.resilience import merge_stats
+from api.utils.session_pool import merge_pool_stats
+
+
+def call(path, total, status=200, scope="test"):
+    return CallRecord("GET", f"https://api.test{path}", status, 10, 100, total, ttfb=total / 2, scope=scope)
+
+
+# ----------------- Pruebas de métricas con xdist -----------------
+
+def test_merged_recorders_match_a_single_recorder():
+    """
+    Verifica que juntar lo exportado por varios workers dé lo mismo que
+    haber registrado todas las llamadas en un solo proceso.
+    """
+    calls = [call("/flights/1", 0.010), call("/flights/2", 0.250, status=500), call("/users", 0.030, scope="other")]
+    single = MetricsRecorder()
+    for record in calls:
+        single(record)
+
+    worker_a, worker_b = MetricsRecorder(), MetricsRecorder()
+    worker_a(calls[0])
+    worker_b(calls[1])
+    worker_b(calls[2])
+    merged = MetricsRecorder()
+    merged.merge(worker_a.export())
+    merged.merge(worker_b.export())
+
+    expected, actual = single.to_dict(), merged.to_dict()
+    assert actual["calls"] == 3
+    assert actual["endpoints"] == expected["endpoints"]
+    assert actual["slowest_scopes"] == expected["slowest_scopes"]
+
+
+def test_retry_and_pool_stats_are_summed():
+    """
+    Verifica que los reintentos y el pool de cada worker se sumen, también por endpoint.
+    """
+    worker = {
+        "retries": 2, "wait_seconds": 0.5, "budget_denied": 1, "short_circuited": 0, "budget_tokens_left": 3,
+        "circuits_opened": {"GET /users": 1},
+        "by_key": {"GET /users": {"calls": 4, "retries": 2, "wait_seconds": 0.5, "budget_denied": 1, "short_circuited": 0}},
+    }
+    retries = merge_stats([worker, worker])
+    assert retries["retries"] == 4
+    assert retries["circuits_opened"] == {"GET /users": 2}
+    assert retries["by_key"]["GET /users"]["calls"] == 8
+
+    pool = merge_pool_stats([
+        {"sessions": 1, "requests": 10, "connections": 2},
+        {"sessions": 1, "requests": 30, "connections": 2},
+    ])
+    assert pool["requests"] == 40
+    assert pool["handshakes_saved"] == 36
+    assert pool["reuse_rate"] == 0.9
@@ -0,0 +1,178 @@
+import pytest
+from requests.exceptions import ConnectionError, InvalidURL
+
+from api.utils.resilience import (
+    CircuitBreaker, CircuitOpenError, RetryBudget, RetryEngine, RetryExhaustedError,
+)
+
+
+class FakeResponse:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def new_engine(threshold=2, reset_timeout=60, reserve=10, ratio=0.0):
+    """Motor propio del test, sin esperas entre reintentos."""
+    return RetryEngine(
+        base_delay=0, max_delay=0, budget_ratio=ratio, budget_reserve=reserve,
+        breaker_threshold=threshold, breaker_reset_timeout=reset_timeout, sleep=lambda delay: None,
+    )
+
+
+def sender(*outcomes):
+    """send() que entrega (o lanza) cada resultado de 'outcomes' en orden."""
+    pending = list(outcomes)
+
+    def send():
+        outcome = pending.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return FakeResponse(outcome)
+    return send
+
+# ----------------- Pruebas del Circuit Breaker -----------------
+
+def test_breaker_opens_after_threshold_failures():
+    """
+    Verifica que el breaker pase de closed a open al llegar al umbral de fallas.
+    """
+    breaker = CircuitBreaker(threshold=2, reset_timeout=60)
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 1
+    assert not breaker.allow()
+
+
+def test_breaker_half_open_probe_success_closes_it():
+    """
+    Verifica que tras el enfriamiento pase una sola petición de prueba
+    y que si sale bien el breaker vuelva a closed.
+    """
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.record_failure()
+
+    assert breaker.allow()
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.failures == 0
+    assert breaker.allow()
+
+
+def test_breaker_half_open_probe_failure_reopens_it():
+    """
+    Verifica que si la petición de prueba falla el breaker vuelva a open.
+    """
+    breaker = CircuitBreaker(threshold=1, reset_timeout=0)
+    breaker.record_failure()
+    assert breaker.allow()
+
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.times_opened == 2
+
+
+def test_call_short_circuits_when_breaker_is_open():
+    """
+    Verifica que con el circuito abierto la petición no se envíe y se lance CircuitOpenError.
+    """
+    engine = new_engine(threshold=1)
+    with pytest.raises(ConnectionError):
+        engine.call("GET /flights", sender(ConnectionError("caída")), "GET", attempts=1)
+
+    with pytest.raises(CircuitOpenError):
+        engine.call("GET /flights", sender(200), "GET", attempts=1)
+    assert engine.stats()["short_circuited"] == 1
+
+
+def test_half_open_probe_with_unexpected_error_does_not_leave_breaker_stuck():
+    """
+    Verifica que un error que no es de transporte en la petición de prueba
+    (p. ej. InvalidURL) cuente como falla y el breaker no quede en half-open.
+    """
+    engine = new_engine(threshold=1, reset_timeout=0)
+    with pytest.raises(ConnectionError):
+        engine.call("GET /users", sender(ConnectionError("caída")), "GET", attempts=1)
+
+    with pytest.raises(InvalidURL):
+        engine.call("GET /users", sender(InvalidURL("url rota")), "GET", attempts=1)
+    assert engine.breaker("GET /users").state == CircuitBreaker.OPEN
+
+    response, attempts = engine.call("GET /users", sender(200), "GET", attempts=1)
+    assert response.status_code == 200
+    assert engine.breaker("GET /users").state == CircuitBreaker.CLOSED
+
+# ----------------- Pruebas de Reintentos y Presupuesto -----------------
+
+def test_call_retries_server_errors_until_success():
+    """
+    Verifica que un 5xx se reintente y se retorne la primera respuesta exitosa.
+    """
+    engine = new_engine()
+
+    response, attempts = engine.call("GET /airports", sender(503, 500, 200), "GET", attempts=5)
+
+    assert response.status_code == 200
+    assert attempts == 3
+    assert engine.stats()["retries"] == 2
+
+
+def test_call_does_not_retry_patch():
+    """
+    Verifica que PATCH no se reintente y se retorne el 5xx.
+    """
+    engine = new_engine()
+
+    response, attempts = engine.call("PATCH /bookings/{id}", sender(500, 200), "PATCH", attempts=5)
+
+    assert response.status_code == 500
+    assert attempts == 1
+
+
+def test_budget_denies_retries_when_exhausted():
+    """
+    Verifica que sin presupuesto la falla se devuelva sin reintentar.
+    """
+    engine = new_engine(threshold=10, reserve=1)
+
+    response, attempts = engine.call("GET /flights", sender(500, 500, 200), "GET", attempts=5)
+
+    assert response.status_code == 500
+    assert attempts == 2
+    stats = engine.stats()
+    assert stats["retries"] == 1
+    assert stats["budget_denied"] == 1
+
+
+def test_budget_deposit_does_not_exceed_reserve():
+    """
+    Verifica que cada petición recupere 'ratio' sin pasar de la reserva.
+    """
+    budget = RetryBudget(ratio=0.5, reserve=2)
+    assert budget.try_spend()
+    assert budget.tokens == 1
+
+    budget.deposit()
+    budget.deposit()
+    budget.deposit()
+    assert budget.tokens == 2
+
+
+def test_retry_raises_with_last_outcome_when_exhausted():
+    """
+    Verifica que RetryEngine.retry lance RetryExhaustedError con el último resultado.
+    """
+    engine = new_engine()
+
+    with pytest.raises(RetryExhaustedError) as error:
+        engine.retry("signup", lambda attempt: attempt, lambda outcome: True, attempts=3)
+
+    assert error.value.attempts == 3
+    assert error.value.outcome == 3
@@ -0,0 +1,44 @@
+import pytest
+
+from api.utils import session_pool
+
+
+@pytest.fixture(autouse=True)
+def isolated_registry(monkeypatch):
+    """Registro de adaptadores propio del test: no toca el pool que usa la suite."""
+    monkeypatch.setattr(session_pool, "_adapters", {})
+
+
+# ----------------- Pruebas del pool compartido -----------------
+
+def test_sessions_of_the_same_base_url_share_adapters():
+    """
+    Verifica que dos sesiones del mismo base_url sean distintas (cookies propias)
+    pero usen el mismo adaptador, y que otro base_url tenga el suyo.
+    """
+    first = session_pool.get_session("https://pool-a.test")
+    second = session_pool.get_session("https://pool-a.test")
+    other = session_pool.get_session("https://pool-b.test")
+
+    assert first is not second
+    assert first.cookies is not second.cookies
+    assert first.get_adapter("https://pool-a.test/users") is second.get_adapter("https://pool-a.test/users")
+    assert other.get_adapter("https://pool-b.test/users") is not first.get_adapter("https://pool-a.test/users")
+    assert session_pool.pool_stats()["sessions"] == 2
+
+
+def test_close_all_closes_the_shared_adapters(monkeypatch):
+    """
+    Verifica que close_all cierre cada adaptador compartido una sola vez y vacíe
+    el registro, así la siguiente sesión arma adaptadores nuevos.
+    """
+    session = session_pool.get_session("https://pool-a.test")
+    adapter = session.get_adapter("https://pool-a.test/users")
+    closed = []
+    monkeypatch.setattr(adapter, "close", lambda: closed.append(adapter))
+
+    session_pool.close_all()
+
+    assert closed == [adapter]
+    assert session_pool.pool_stats()["sessions"] == 0
+    assert session_pool.get_session("https://pool-a.test").get_adapter("https://pool-a.test/users") is not adapter
@@ -0,0 +1,93 @@
+import base64
+import json
+import time
+
+import pytest
+
+from api.utils.token_cache import EXPIRY_MARGIN_SECONDS, TokenCache, decode_jwt_expiry
+
+BASE_URL = "https://tokens.test"
+
+
+def jwt(expires_in):
+    """JWT sin firma válida que vence en 'expires_in' segundos."""
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+    return f"{encode({'alg': 'HS256'})}.{encode({'exp': int(time.time()) + expires_in})}.firma"
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return TokenCache(tmp_path / "tokens.json")
+
+
+# ----------------- Pruebas de tokens -----------------
+
+def test_valid_token_is_reused_without_login(cache):
+    """
+    Verifica que un token vigente se guarde y se reutilice sin volver a hacer login.
+    """
+    token = jwt(3600)
+    logins = []
+
+    assert cache.get_or_login(BASE_URL, "admin", lambda: logins.append(1) or token) == token
+    assert cache.get_or_login(BASE_URL, "admin", lambda: logins.append(1) or jwt(3600)) == token
+    assert cache.get_token(BASE_URL, "admin") == token
+    assert decode_jwt_expiry(token) is not None
+    assert len(logins) == 1
+
+
+def test_expired_token_is_invalidated_and_replaced(cache):
+    """
+    Verifica que un token dentro del margen de vencimiento ya no se entregue
+    y que get_or_login lo reemplace por uno nuevo.
+    """
+    expiring = jwt(EXPIRY_MARGIN_SECONDS - 10)
+    cache.get_or_login(BASE_URL, "admin", lambda: expiring)
+
+    assert cache.get_token(BASE_URL, "admin") is None
+
+    fresh = jwt(3600)
+    assert cache.get_or_login(BASE_URL, "admin", lambda: fresh) == fresh
+    assert cache.get_token(BASE_URL, "admin") == fresh
+
+
+def test_token_without_expiry_is_never_cached_as_valid(cache):
+    """
+    Verifica que un token que no es JWT (sin 'exp') no se reutilice.
+    """
+    cache.get_or_login(BASE_URL, "admin", lambda: "opaque-token")
+
+    assert cache.get_token(BASE_URL, "admin") is None
+
+
+# ----------------- Pruebas del pool de usuarios -----------------
+
+def test_expired_users_are_dropped_from_the_pool(cache):
+    """
+    Verifica que un usuario con token vencido no se guarde al devolverlo, y que
+    claim_user descarte los que vencieron mientras estaban en el pool.
+    """
+    assert not cache.release_user(BASE_URL, "passenger", {"id": "u1", "token": jwt(-60)})
+
+    assert cache.release_user(BASE_URL, "passenger", {"id": "u2", "token": jwt(3600)})
+    data = json.loads(cache.path.read_text(encoding="utf-8"))
+    data["users"][f"{BASE_URL}|passenger"][0]["expires_at"] = time.time() - 60
+    cache.path.write_text(json.dumps(data), encoding="utf-8")
+
+    assert cache.claim_user(BASE_URL, "passenger") is None
+
+
+def test_claimed_user_leaves_the_pool_until_released(cache):
+    """
+    Verifica que un usuario reclamado no se entregue a otro test hasta que se devuelva.
+    """
+    user = {"id": "u1", "token": jwt(3600)}
+    cache.release_user(BASE_URL, "admin", user)
+
+    claimed = cache.claim_user(BASE_URL, "admin")
+    assert claimed["id"] == "u1"
+    assert cache.claim_user(BASE_URL, "admin") is None
+
+    cache.release_user(BASE_URL, "admin", claimed)
+    assert cache.claim_user(BASE_URL, "admin")["id"] == "u1"
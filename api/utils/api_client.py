@@ -1,52 +1,224 @@
+import contextvars
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from requests.exceptions import HTTPError, JSONDecodeError, RequestException
-from requests.adapters import HTTPAdapter, Retry
+from api.utils import cassettes, metrics, resilience, settings
+from api.utils.session_pool import get_session
+
+
+class BatchResult:
+    """
+    Resultado de una petición ejecutada con APIClient.batch.
+    Contiene la respuesta o el error capturado (nunca se lanza).
+    """
+
+    def __init__(self, spec, response=None, error=None):
+        self.spec = spec
+        self.response = response
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None and self.response is not None and self.response.ok
+
+    def __repr__(self):
+        status = self.response.status_code if self.response is not None else self.error
+        return f"<BatchResult {self.spec[0].upper()} {self.spec[1]} -> {status}>"
+
 
 class APIClient:
-    def __init__(self, base_url, token=None, max_retries=5):
+    # Métodos que acepta batch() en cada spec
+    BATCH_METHODS = frozenset({"get", "post", "post_form", "put", "patch", "delete"})
+
+    # Hooks que reciben un metrics.CallRecord por cada llamada de cualquier cliente
+    hooks = []
+
+    def __init__(self, base_url, token=None, max_retries=settings.API_MAX_RETRIES):
         self.base_url = base_url
-        self.session = requests.Session()
-
-        # Configurar reintentos
-        retries = Retry(
-            total=max_retries,
-            backoff_factor=1,  # espera exponencial: 1s, 2s, 4s...
-            status_forcelist=[500, 502, 503, 504],
-            allowed_methods=["GET", "POST", "PUT", "DELETE"]
-        )
-        adapter = HTTPAdapter(max_retries=retries)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        # Intentos extra ante 5xx/errores de conexión (backoff, presupuesto y breaker en resilience)
+        self.max_retries = max_retries
+        # Sesión propia (cookies propias) sobre el pool compartido del host: reutiliza conexiones keep-alive entre clientes
+        self.session = get_session(base_url)
 
         self.headers = {}
         if token:
             self.headers["Authorization"] = f"Bearer {token}"
 
-    def get(self, endpoint, params=None):
+    @classmethod
+    def add_hook(cls, hook):
+        """Registra 'hook(record)', que se llamará tras cada petición con su CallRecord."""
+        cls.hooks.append(hook)
+
+    @classmethod
+    def remove_hook(cls, hook):
+        if hook in cls.hooks:
+            cls.hooks.remove(hook)
+
+    def _send(self, method, url, **kwargs):
+        """Envía la petición con los reintentos del motor compartido. Retorna (response, intentos)."""
+        key = f"{method} {metrics.template_endpoint(requests.utils.urlparse(url).path)}"
+        return resilience.engine.call(
+            key,
+            lambda: self.session.request(method, url, headers=self.headers, **kwargs),
+            method,
+            attempts=self.max_retries + 1,
+        )
+
+    def _request(self, method, endpoint, **kwargs):
         url = f"{self.base_url}{endpoint}"
-        return self.session.get(url, headers=self.headers, params=params)
+        if not APIClient.hooks:
+            return self._send(method, url, **kwargs)[0]
+
+        metrics.reset_connection_timings()
+        started = time.perf_counter()
+        try:
+            response, attempts = self._send(method, url, **kwargs)
+        except Exception as err:
+            self._notify(metrics.CallRecord(
+                method, url, None, 0, 0, time.perf_counter() - started,
+                error=err, scope=metrics.current_scope.get(), **metrics.pop_connection_timings()
+            ))
+            raise
+        total = time.perf_counter() - started
+
+        body = response.request.body or b""
+        self._notify(metrics.CallRecord(
+            method, url, response.status_code,
+            bytes_sent=len(body.encode() if isinstance(body, str) else body),
+            bytes_received=len(response.content),
+            total=total,
+            ttfb=response.elapsed.total_seconds(),
+            retries=attempts - 1,
+            scope=metrics.current_scope.get(),
+            response=response,
+            **metrics.pop_connection_timings(),
+        ))
+        return response
+
+    @staticmethod
+    def _notify(record):
+        for hook in list(APIClient.hooks):
+            try:
+                hook(record)
+            except Exception as err:
+                # Un hook roto no debe hacer fallar el test
+                print(f"⚠️ Hook de APIClient falló: {err}")
+
+    def get(self, endpoint, params=None):
+        return self._request("GET", endpoint, params=params)
 
     def post(self, endpoint, data):
         """Envía una petición POST con datos JSON."""
-        url = f"{self.base_url}{endpoint}"
-        return self.session.post(url, json=data, headers=self.headers)
+        return self._request("POST", endpoint, json=data)
 
     def post_form(self, endpoint, data):
         """Envía una petición POST con datos en formato x-www-form-urlencoded."""
-        url = f"{self.base_url}{endpoint}"
-        return self.session.post(url, data=data, headers=self.headers)
+        return self._request("POST", endpoint, data=data)
 
     def put(self, endpoint, json_data):
         """Envía una petición PUT con datos JSON."""
-        url = f"{self.base_url}{endpoint}"
-        return self.session.put(url, json=json_data, headers=self.headers)
+        return self._request("PUT", endpoint, json=json_data)
 
     def delete(self, endpoint):
         """Envía una petición DELETE."""
-        url = f"{self.base_url}{endpoint}"
-        return self.session.delete(url, headers=self.headers)
+        return self._request("DELETE", endpoint)
 
     def patch(self, endpoint, json_data):
         """Envía una petición PATCH."""
-        url = f"{self.base_url}{endpoint}"
-        return self.session.patch(url, json=json_data, headers=self.headers)
\ No newline at end of file
+        return self._request("PATCH", endpoint, json=json_data)
+
+    def iter_pages(self, endpoint, page_size=settings.API_PAGE_SIZE, params=None, max_items=None, prefetch=True):
+        """
+        Recorre un endpoint de lista paginado con skip/limit y entrega sus elementos
+        de a uno. La página siguiente se pide en segundo plano mientras se consume
+        la actual, así que en memoria hay como máximo dos páginas, sin importar el
+        tamaño de la colección. Termina con la primera página incompleta o al
+        entregar 'max_items' elementos. Una respuesta que no es 2xx lanza HTTPError.
+
+        'params' son los filtros del endpoint; si trae 'skip' el recorrido empieza ahí.
+        """
+        if page_size <= 0:
+            raise ValueError(f"❌ page_size tiene que ser positivo (llegó {page_size})")
+        params = dict(params or {})
+        skip = int(params.pop("skip", 0))
+        params.pop("limit", None)
+        if cassettes.active_store() is not None:
+            # Con record/replay el orden de las peticiones tiene que ser reproducible
+            prefetch = False
+
+        def fetch(offset):
+            response = self.get(endpoint, params=dict(params, skip=offset, limit=page_size))
+            response.raise_for_status()
+            return response.json()
+
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="api-pages") if prefetch else None
+
+        def start(offset):
+            if executor is None:
+                return None
+            # Cada página se pide con una copia del contexto actual (ámbito de métricas incluido)
+            return executor.submit(contextvars.copy_context().run, fetch, offset)
+
+        next_page = start(skip)
+        yielded = 0
+        try:
+            while max_items is None or yielded < max_items:
+                page = next_page.result() if executor is not None else fetch(skip)
+                skip += len(page)
+                last = len(page) < page_size
+                if not last and (max_items is None or yielded + len(page) < max_items):
+                    next_page = start(skip)
+                if max_items is not None:
+                    page = page[:max_items - yielded]
+                for item in page:
+                    yield item
+                    yielded += 1
+                if last:
+                    return
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=True, cancel_futures=True)
+
+    def batch(self, requests_spec, max_concurrency=10):
+        """
+        Ejecuta una lista de peticiones (method, endpoint, payload) en paralelo,
+        con como máximo 'max_concurrency' a la vez, y retorna una lista de
+        BatchResult en el mismo orden que la entrada.
+
+        'method' es el nombre de uno de los métodos del cliente: get, post,
+        post_form, put, patch o delete. El payload es opcional (para get son los params).
+        Los errores de cada petición se capturan en su BatchResult en vez de lanzarse;
+        un 'method' que no es uno de esos lanza ValueError antes de enviar nada.
+        """
+        requests_spec = [tuple(spec) for spec in requests_spec]
+        if not requests_spec:
+            return []
+        invalid = sorted({repr(spec[0]) for spec in requests_spec if spec[0] not in self.BATCH_METHODS})
+        if invalid:
+            raise ValueError(
+                f"❌ Método inválido en batch: {', '.join(invalid)} (opciones: {', '.join(sorted(self.BATCH_METHODS))})"
+            )
+
+        def run(spec):
+            method, endpoint = spec[0], spec[1]
+            payload = spec[2] if len(spec) > 2 else None
+            try:
+                if method == "delete":
+                    response = self.delete(endpoint)
+                elif method == "get":
+                    response = self.get(endpoint, params=payload)
+                else:
+                    response = getattr(self, method)(endpoint, payload)
+                return BatchResult(spec, response=response)
+            except Exception as err:
+                return BatchResult(spec, error=err)
+
+        if cassettes.active_store() is not None:
+            # Con record/replay el orden de las peticiones tiene que ser reproducible
+            max_concurrency = 1
+        workers = max(1, min(max_concurrency, len(requests_spec)))
+        # Cada petición corre con una copia del contexto actual (ámbito de métricas incluido)
+        contexts = [contextvars.copy_context() for _ in requests_spec]
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="api-batch") as executor:
+            return list(executor.map(lambda context, spec: context.run(run, spec), contexts, requests_spec))
@@ -0,0 +1,570 @@
+"""
+Grabación y reproducción (record/replay) de las peticiones de APIClient.
+
+Con --api-record cada par petición/respuesta se guarda en un almacén de
+cassettes; con --api-replay se responde desde ese almacén sin tocar la red.
+
+Formato en disco (directorio API_CASSETTE_DIR):
+  - blobs/ab/abcd...json.gz: peticiones y respuestas comprimidas, direccionadas
+    por el sha256 de su contenido (las respuestas repetidas se guardan una vez).
+  - index.json: {hash normalizado de la petición: [entradas]} para buscar en O(1).
+
+Reglas para que la reproducción sea determinista aunque los datos vengan de Faker:
+  - Cada interacción se graba con un ámbito (id del test, fixture de sesión o
+    recarga del almacén) y Faker se siembra por ámbito con una semilla guardada
+    en el índice.
+  - Los campos que genera Faker (MASKED_FIELDS) no entran al hash, solo su tipo.
+  - Si los ids no coinciden (otro recurso del almacén), dentro del mismo ámbito
+    se empareja por la forma de la petición (template_request).
+  - Al reproducir se aprende un alias valor_grabado <-> valor_actual a partir de
+    cada petición emparejada: se usa para normalizar las peticiones siguientes
+    y para devolver en las respuestas los valores de la corrida actual.
+
+Las cassettes se pueden compartir: antes de escribir un blob se reemplazan las
+contraseñas (SECRET_FIELDS), los tokens de acceso y los headers con credenciales
+por marcadores estables (el mismo valor siempre da el mismo marcador). Al
+reproducir, el marcador de una contraseña se empareja con el valor actual como
+cualquier otro alias, y el de un token es un JWT sin firma que no vence.
+"""
+import base64
+import gzip
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from pathlib import Path
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from faker import Faker
+from requests.adapters import BaseAdapter
+from requests.exceptions import RequestException
+
+from api.utils.fake_api import build_response
+
+RECORD = "record"
+REPLAY = "replay"
+
+# Campos que llenan los payloads con Faker o con la hora actual
+MASKED_FIELDS = frozenset({
+    "email", "username", "password", "full_name", "city", "country", "iata_code",
+    "origin", "destination", "tail_number", "model", "capacity", "base_price",
+    "departure_time", "arrival_time", "passport", "seat", "amount", "payment_method",
+})
+# Valores que nunca se escriben en las cassettes
+SECRET_FIELDS = frozenset({"password", "access_token"})
+SECRET_HEADERS = frozenset({"authorization", "set-cookie"})
+# Vencimiento de los tokens de reemplazo (2100-01-01): siguen vigentes al reproducir
+REDACTED_TOKEN_EXPIRY = 4102444800
+_ISO_DATETIME = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}")
+
+
+class CassetteMissError(RequestException):
+    """No hay ninguna interacción grabada para la petición en modo replay."""
+
+
+# ======================
+# NORMALIZACIÓN
+# ======================
+def _parse_body(body, content_type):
+    if body is None:
+        return None
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    if "application/x-www-form-urlencoded" in (content_type or ""):
+        return dict(parse_qsl(body, keep_blank_values=True))
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body
+
+
+def _placeholder(value):
+    return f"<{type(value).__name__}>"
+
+
+def _mask(value, aliases, key=None, mask=True):
+    if isinstance(value, dict):
+        return {k: _mask(v, aliases, k, mask) for k, v in sorted(value.items())}
+    if isinstance(value, list):
+        return [_mask(item, aliases, mask=mask) for item in value]
+    # Los secretos se graban reemplazados: ni el hash exacto depende de su valor
+    if key in SECRET_FIELDS or (mask and key in MASKED_FIELDS):
+        return _placeholder(value)
+    if isinstance(value, str):
+        return aliases.get(value, value)
+    return value
+
+
+def normalize_request(method, url, body, content_type, aliases=None, mask=True):
+    """
+    Retorna el hash normalizado de una petición: método, ruta (sin host),
+    params ordenados y body con los campos de Faker enmascarados.
+    'aliases' (valor_actual -> valor_grabado) se aplica a ruta, params y body.
+    Con mask=False el hash distingue también los valores de Faker.
+    """
+    aliases = aliases or {}
+    parts = urlsplit(url)
+    path = "/".join(aliases.get(segment, segment) for segment in parts.path.split("/"))
+    query = sorted((key, aliases.get(value, value)) for key, value in parse_qsl(parts.query, keep_blank_values=True))
+    canonical = json.dumps(
+        [method.upper(), path, query, _mask(_parse_body(body, content_type), aliases, mask=mask)],
+        sort_keys=True, default=str,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _shape(value):
+    """Estructura del body (claves y tipos) sin ningún valor."""
+    if isinstance(value, dict):
+        return {k: _shape(v) for k, v in sorted(value.items())}
+    if isinstance(value, list):
+        return [_shape(item) for item in value]
+    return _placeholder(value)
+
+
+def template_request(method, url, body, content_type):
+    """
+    Hash de la "forma" de una petición: segmentos de ruta con dígitos (ids) como
+    comodín, solo los nombres de los params y la estructura del body. Se usa como
+    respaldo, dentro del mismo ámbito, cuando los ids de la corrida actual no son
+    los grabados (p. ej. el almacén de recursos entregó otro vuelo al test).
+    """
+    parts = urlsplit(url)
+    path = "/".join("{id}" if re.search(r"\d", segment) else segment for segment in parts.path.split("/"))
+    query = sorted(key for key, _ in parse_qsl(parts.query, keep_blank_values=True))
+    canonical = json.dumps([method.upper(), path, query, _shape(_parse_body(body, content_type))], sort_keys=True)
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def _leaves(data, prefix=()):
+    """Recorre un body y produce (ruta, valor) de cada valor escalar."""
+    if isinstance(data, dict):
+        for key, value in data.items():
+            yield from _leaves(value, prefix + (key,))
+    elif isinstance(data, list):
+        for index, value in enumerate(data):
+            yield from _leaves(value, prefix + (index,))
+    else:
+        yield prefix, data
+
+
+def _rewrite(data, forward, fields, key=None):
+    """Reemplaza en una respuesta los valores grabados por los de la corrida actual."""
+    if isinstance(data, dict):
+        return {k: _rewrite(v, forward, fields, k) for k, v in data.items()}
+    if isinstance(data, list):
+        return [_rewrite(item, forward, fields) for item in data]
+    if isinstance(data, str):
+        return forward.get(data, data)
+    if isinstance(data, (int, float)) and not isinstance(data, bool):
+        return fields.get((key, data), data)
+    return data
+
+
+def _b64url(data):
+    return base64.urlsafe_b64encode(json.dumps(data, separators=(",", ":")).encode()).rstrip(b"=").decode()
+
+
+def redacted_token(number):
+    """JWT sin firma que reemplaza al token de acceso número 'number' de la grabación."""
+    header = _b64url({"alg": "none", "typ": "JWT"})
+    payload = _b64url({"sub": f"redacted-{number}", "exp": REDACTED_TOKEN_EXPIRY})
+    return f"{header}.{payload}.redacted"
+
+
+def _objects_with_id(data):
+    """Objetos con campo 'id' de una respuesta (el objeto mismo o los de una lista)."""
+    items = data if isinstance(data, list) else [data]
+    return [item for item in items if isinstance(item, dict) and isinstance(item.get("id"), str)]
+
+
+# ======================
+# ALMACÉN
+# ======================
+class CassetteStore:
+    """Índice + blobs comprimidos de un directorio de cassettes."""
+
+    def __init__(self, path, mode):
+        self.path = Path(path)
+        self.mode = mode
+        self.blobs_path = self.path / "blobs"
+        self.index_path = self.path / "index.json"
+        self.scope = None
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+        self._used = set()
+        # valor_actual -> valor_grabado (para normalizar) y al revés (para las respuestas)
+        self._reverse_aliases = {}
+        self._forward_aliases = {}
+        # Alias numéricos por campo ((campo, grabado) -> actual), p. ej. base_price
+        self._field_aliases = {}
+        # (campo, valor secreto) -> marcador con el que se graba
+        self._secrets = {}
+        # Objetos con id entregados en esta corrida y los que hay en las grabaciones
+        self._served_objects = {}
+        self._recorded_objects = None
+
+        if mode == RECORD:
+            self.entries = {}
+            self.seed = uuid.uuid4().hex
+        else:
+            try:
+                with open(self.index_path, encoding="utf-8") as index_file:
+                    index = json.load(index_file)
+            except FileNotFoundError:
+                raise FileNotFoundError(
+                    f"No hay cassettes en {self.path}: graba primero con --api-record"
+                ) from None
+            self.entries = index["entries"]
+            self.seed = index["seed"]
+        self._by_template = {}
+        for key, entries in self.entries.items():
+            for index, entry in enumerate(entries):
+                self._by_template.setdefault(entry["template"], []).append((key, index, entry))
+
+    # ---------- Blobs ----------
+    def _blob_file(self, digest):
+        return self.blobs_path / digest[:2] / f"{digest}.json.gz"
+
+    def _put_blob(self, data):
+        content = json.dumps(data, sort_keys=True).encode()
+        digest = hashlib.sha256(content).hexdigest()
+        blob_file = self._blob_file(digest)
+        if not blob_file.exists():
+            blob_file.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=blob_file.parent, suffix=".tmp")
+            with os.fdopen(fd, "wb") as tmp_file:
+                tmp_file.write(gzip.compress(content, mtime=0))
+            os.replace(tmp_path, blob_file)
+        return digest
+
+    def _get_blob(self, digest):
+        with gzip.open(self._blob_file(digest), "rb") as blob:
+            return json.loads(blob.read())
+
+    @staticmethod
+    def _encode_body(content):
+        if content is None:
+            return {"body": None}
+        if isinstance(content, str):
+            return {"body": content}
+        try:
+            return {"body": content.decode("utf-8")}
+        except UnicodeDecodeError:
+            return {"body_b64": base64.b64encode(content).decode()}
+
+    @staticmethod
+    def _decode_body(data):
+        if data.get("body_b64") is not None:
+            return base64.b64decode(data["body_b64"])
+        return (data.get("body") or "").encode("utf-8")
+
+    # ---------- Secretos ----------
+    def _placeholder_for(self, field, value):
+        """Marcador estable de un secreto: el mismo valor siempre da el mismo marcador."""
+        placeholder = self._secrets.get((field, value))
+        if placeholder is None:
+            number = sum(1 for secret_field, _ in self._secrets if secret_field == field) + 1
+            placeholder = redacted_token(number) if field == "access_token" else f"<redacted-{field}-{number}>"
+            self._secrets[(field, value)] = placeholder
+        return placeholder
+
+    def _redact_data(self, data, key=None):
+        if isinstance(data, dict):
+            return {k: self._redact_data(v, k) for k, v in data.items()}
+        if isinstance(data, list):
+            return [self._redact_data(item) for item in data]
+        if key in SECRET_FIELDS and isinstance(data, str):
+            return self._placeholder_for(key, data)
+        return data
+
+    def _redact_body(self, body, content_type):
+        """Body (str/bytes) con los SECRET_FIELDS reemplazados; sin cambios si no es JSON ni form."""
+        data = _parse_body(body, content_type)
+        if not isinstance(data, (dict, list)):
+            return body
+        redacted = self._redact_data(data)
+        if redacted == data:
+            return body
+        if "application/x-www-form-urlencoded" in (content_type or ""):
+            return urlencode(redacted)
+        return json.dumps(redacted)
+
+    # ---------- Grabación ----------
+    def record(self, request, response):
+        with self._lock:
+            request_body = self._redact_body(request.body, request.headers.get("Content-Type"))
+            response_body = self._redact_body(response.content, response.headers.get("Content-Type"))
+        request_blob = dict(
+            self._encode_body(request_body),
+            method=request.method,
+            url=request.url,
+            content_type=request.headers.get("Content-Type"),
+        )
+        response_blob = dict(
+            self._encode_body(response_body),
+            status=response.status_code,
+            headers={
+                name: ("<redacted>" if name.lower() in SECRET_HEADERS else value)
+                for name, value in response.headers.items()
+            },
+        )
+        content_type = request.headers.get("Content-Type")
+        key = normalize_request(request.method, request.url, request.body, content_type)
+        entry = {
+            "scope": self.scope,
+            "exact": normalize_request(request.method, request.url, request.body, content_type, mask=False),
+            "template": template_request(request.method, request.url, request.body, content_type),
+            "request": self._put_blob(request_blob),
+            "response": self._put_blob(response_blob),
+        }
+        with self._lock:
+            self.entries.setdefault(key, []).append(entry)
+            self.recorded += 1
+
+    def save(self):
+        """Escribe el índice de forma atómica y borra los blobs que ya nadie usa."""
+        if self.mode != RECORD:
+            return
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump({"version": 1, "seed": self.seed, "entries": self.entries}, tmp_file)
+        os.replace(tmp_path, self.index_path)
+
+        referenced = {
+            digest for entries in self.entries.values() for entry in entries
+            for digest in (entry["request"], entry["response"])
+        }
+        for blob_file in self.blobs_path.glob("*/*.json.gz"):
+            if blob_file.name[:-len(".json.gz")] not in referenced:
+                blob_file.unlink()
+
+    # ---------- Reproducción ----------
+    def _take(self, candidates, *preferences):
+        for matches in preferences:
+            for key, index, entry in candidates:
+                if (key, index) not in self._used and matches(entry):
+                    self._used.add((key, index))
+                    return entry
+        return None
+
+    def _pick(self, key, exact, template):
+        """
+        Elige la interacción grabada para una petición, en este orden:
+          1. mismo hash y mismo ámbito (primero la petición exacta),
+          2. misma forma (template_request) y mismo ámbito,
+          3. mismo hash en cualquier ámbito (primero la petición exacta),
+          4. si ya se usaron todas las del hash, se repite la última.
+        """
+        by_key = [(key, i, entry) for i, entry in enumerate(self.entries.get(key) or [])]
+        in_scope = lambda entry: entry["scope"] == self.scope
+        entry = (
+            self._take(by_key, lambda e: in_scope(e) and e["exact"] == exact, in_scope)
+            or self._take(self._by_template.get(template, []), in_scope)
+            or self._take(by_key, lambda e: e["exact"] == exact, lambda e: True)
+        )
+        if entry is None and by_key:
+            entry = by_key[-1][2]
+        return entry
+
+    def _learn_aliases(self, recorded_request, request):
+        """
+        Compara la petición grabada con la actual (segmentos de ruta, params y
+        valores del body en la misma posición) y aprende los alias entre ambas.
+        """
+        recorded_url, current_url = urlsplit(recorded_request["url"]), urlsplit(request.url)
+        pairs = []
+        recorded_path, current_path = recorded_url.path.split("/"), current_url.path.split("/")
+        if len(recorded_path) == len(current_path):
+            pairs.extend(zip(recorded_path, current_path))
+        recorded_query = dict(parse_qsl(recorded_url.query, keep_blank_values=True))
+        current_query = dict(parse_qsl(current_url.query, keep_blank_values=True))
+        pairs.extend((recorded_query[key], current_query[key]) for key in recorded_query.keys() & current_query.keys())
+        recorded_body = dict(_leaves(_parse_body(recorded_request.get("body"), recorded_request.get("content_type"))))
+        current_body = dict(_leaves(_parse_body(request.body, request.headers.get("Content-Type"))))
+        pairs.extend((recorded_body[path], current_body[path]) for path in recorded_body.keys() & current_body.keys())
+
+        for old, new in pairs:
+            if isinstance(old, str) and isinstance(new, str) and old != new:
+                self._add_alias(old, new)
+                if old in self._all_recorded_objects():
+                    self._alias_entities(old, new)
+
+    def _add_alias(self, old, new):
+        self._forward_aliases[old] = new
+        self._reverse_aliases[new] = old
+        if _ISO_DATETIME.match(old) and _ISO_DATETIME.match(new):
+            # Las búsquedas de vuelos filtran por la fecha (YYYY-MM-DD) del datetime
+            self._forward_aliases[old[:10]] = new[:10]
+            self._reverse_aliases[new[:10]] = old[:10]
+
+    def _all_recorded_objects(self):
+        """Índice id -> objeto de todas las respuestas grabadas (se arma una sola vez)."""
+        if self._recorded_objects is None:
+            self._recorded_objects = {}
+            for entries in self.entries.values():
+                for entry in entries:
+                    body = self._decode_body(self._get_blob(entry["response"]))
+                    try:
+                        data = json.loads(body) if body else None
+                    except ValueError:
+                        continue
+                    for item in _objects_with_id(data):
+                        self._recorded_objects.setdefault(item["id"], item)
+        return self._recorded_objects
+
+    def _alias_entities(self, recorded_id, current_id):
+        """
+        El test usa otra entidad (current_id) que la grabada (recorded_id): se
+        aprenden alias campo a campo para que las respuestas sobre la entidad
+        grabada muestren los datos de la actual.
+        """
+        recorded, current = self._recorded_objects.get(recorded_id), self._served_objects.get(current_id)
+        if not recorded or not current:
+            return
+        for key in recorded.keys() & current.keys():
+            old, new = recorded[key], current[key]
+            if old == new or key == "id":
+                continue
+            if isinstance(old, str) and isinstance(new, str):
+                self._add_alias(old, new)
+            elif isinstance(old, (int, float)) and isinstance(new, (int, float)):
+                self._field_aliases[(key, old)] = new
+
+    def replay(self, request):
+        with self._lock:
+            content_type = request.headers.get("Content-Type")
+            key = normalize_request(request.method, request.url, request.body, content_type, self._reverse_aliases)
+            exact = normalize_request(
+                request.method, request.url, request.body, content_type, self._reverse_aliases, mask=False
+            )
+            entry = self._pick(key, exact, template_request(request.method, request.url, request.body, content_type))
+            if entry is None:
+                raise CassetteMissError(
+                    f"No hay interacción grabada para {request.method} {urlsplit(request.url).path} "
+                    f"(ámbito: {self.scope}). Vuelve a grabar con --api-record.",
+                    request=request,
+                )
+            self._learn_aliases(self._get_blob(entry["request"]), request)
+            recorded_response = self._get_blob(entry["response"])
+            content = self._decode_body(recorded_response)
+            try:
+                data = json.loads(content) if content else None
+            except ValueError:
+                data = None
+            if data is not None:
+                data = _rewrite(data, self._forward_aliases, self._field_aliases)
+                content = json.dumps(data).encode()
+                for item in _objects_with_id(data):
+                    self._served_objects[item["id"]] = item
+            self.replayed += 1
+
+        headers = dict(recorded_response["headers"])
+        headers.pop("Content-Encoding", None)
+        headers.pop("Transfer-Encoding", None)
+        headers["Content-Length"] = str(len(content))
+        return recorded_response["status"], headers, content
+
+
+# ======================
+# ADAPTADORES
+# ======================
+class RecordingAdapter(BaseAdapter):
+    """Envía con el adaptador real y guarda el par petición/respuesta."""
+
+    def __init__(self, inner, store):
+        super().__init__()
+        self.inner = inner
+        self.store = store
+
+    @property
+    def poolmanager(self):
+        # session_pool.pool_stats lee los pools de urllib3 del adaptador real
+        return getattr(self.inner, "poolmanager", None)
+
+    def send(self, request, **kwargs):
+        response = self.inner.send(request, **kwargs)
+        self.store.record(request, response)
+        return response
+
+    def close(self):
+        self.inner.close()
+
+
+class ReplayAdapter(BaseAdapter):
+    """Responde desde el almacén de cassettes sin abrir conexiones."""
+
+    def __init__(self, store):
+        super().__init__()
+        self.store = store
+
+    def send(self, request, **kwargs):
+        status, headers, content = self.store.replay(request)
+        return build_response(request, status, headers, content, connection=self)
+
+    def close(self):
+        pass
+
+
+_active_store = None
+
+
+def activate(mode, path):
+    """Activa el modo record o replay para todas las sesiones que se creen desde ahora."""
+    global _active_store
+    _active_store = CassetteStore(path, mode)
+    return _active_store
+
+
+def active_store():
+    return _active_store
+
+
+def deactivate():
+    """Desactiva el modo actual, guarda el índice si se estaba grabando y retorna el almacén."""
+    global _active_store
+    store, _active_store = _active_store, None
+    if store is not None:
+        store.save()
+    return store
+
+
+@contextmanager
+def scoped(scope, seed_key=None):
+    """
+    Ejecuta el bloque dentro de un ámbito de grabación ('scope', p. ej. el id del
+    test o el nombre de un fixture de sesión) y siembra Faker con la semilla del
+    almacén + 'seed_key', para que el bloque genere los mismos datos en cada corrida.
+    Sin modo record/replay activo no hace nada.
+    """
+    store = _active_store
+    if store is None:
+        yield
+        return
+    previous = store.scope
+    store.scope = scope
+    Faker.seed(f"{store.seed}:{seed_key or scope}")
+    try:
+        yield
+    finally:
+        store.scope = previous
+
+
+def install(session):
+    """Reemplaza los adaptadores de la sesión según el modo activo (si hay uno)."""
+    store = _active_store
+    if store is None:
+        return session
+    if store.mode == REPLAY:
+        for prefix in list(session.adapters):
+            session.mount(prefix, ReplayAdapter(store))
+    else:
+        for prefix, adapter in list(session.adapters.items()):
+            session.mount(prefix, RecordingAdapter(adapter, store))
+    return session
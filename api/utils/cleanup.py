@@ -0,0 +1,423 @@
+"""
+Limpieza de los recursos que la suite crea en la API.
+
+TeardownRegistry es un hook de APIClient: cada POST que crea un recurso
+(signup, /users, /airports, /aircrafts, /flights, /bookings, /payments) queda
+anotado con su tipo e id, y cada DELETE que lo borra (o que responde 404) lo
+saca. Un PUT que cambia el código IATA de un aeropuerto propio mueve la anotación
+al código nuevo. Las anotaciones se agregan a un ledger en disco (un JSONL por proceso en
+API_CLEANUP_DIR), así lo que deja una corrida que se cayó se puede borrar después.
+
+Al terminar la sesión se borra todo por niveles de dependencia
+(payments -> bookings -> flights -> aircrafts/airports -> users): los DELETE de
+un nivel van en paralelo con APIClient.batch y el nivel siguiente empieza
+cuando terminó el anterior. Lo que no se pudo borrar queda en el ledger. La
+purga tiene que correr cuando ya nada crea recursos (el almacén de recursos
+cerrado): lo que se cree después de quitar el hook no queda anotado.
+
+Los códigos IATA son de 3 letras y se repiten entre corridas: cada aeropuerto se
+anota con su ciudad y país, y antes de borrarlo se verifica con un GET que siga
+siendo el mismo. Si no, otra corrida reutilizó el código y no se toca.
+
+Mientras la sesión corre, su ledger tiene tomado el file lock; el recolector
+offline solo toca los ledgers sin lock (su proceso ya terminó o se cayó):
+
+    python -m api.utils.cleanup            # borra lo que quedó de corridas anteriores
+    python -m api.utils.cleanup --dry-run  # solo lista lo que borraría
+"""
+import argparse
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from filelock import FileLock, Timeout
+
+from api.utils import settings, unique_keys, workers
+from api.utils.api_client import APIClient
+
+# Endpoint de creación -> (tipo de recurso, campo de la respuesta con su id)
+CREATE_ENDPOINTS = {
+    "/auth/signup": ("users", "id"),
+    "/users": ("users", "id"),
+    "/airports": ("airports", "iata_code"),
+    "/aircrafts": ("aircrafts", "id"),
+    "/flights": ("flights", "id"),
+    "/bookings": ("bookings", "id"),
+    "/payments": ("payments", "id"),
+}
+
+ID_FIELDS = {kind: field for kind, field in CREATE_ENDPOINTS.values()}
+
+# Recursos cuyo id se reutiliza entre corridas: campos que se comparan antes de borrarlos
+IDENTITY_FIELDS = {"airports": ("city", "country")}
+
+# Niveles de borrado: cada recurso se borra antes que aquellos de los que depende
+PURGE_ORDER = [("payments",), ("bookings",), ("flights",), ("aircrafts", "airports"), ("users",)]
+KINDS = frozenset(kind for level in PURGE_ORDER for kind in level)
+
+# 404: ya no existe. 405: la API no permite borrarlo (p. ej. los pagos), no tiene sentido reintentar
+GONE_STATUS = 404
+UNSUPPORTED_STATUS = 405
+
+
+def delete_endpoint(kind, resource_id):
+    return f"/{kind}/{resource_id}"
+
+
+# ---------- Ledger en disco ----------
+class Ledger:
+    """
+    JSONL con los recursos de un proceso. La primera línea ({"op": "open"})
+    guarda la base_url; después cada línea es un evento: "add" al crearse un
+    recurso (con su "identity" si es de IDENTITY_FIELDS), "done" al borrarse y
+    "keep" si tiene que sobrevivir a la corrida (usuarios que vuelven al pool del
+    caché de tokens).
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.lock = FileLock(f"{self.path}.lock")
+
+    def append(self, event):
+        with open(self.path, "a", encoding="utf-8") as ledger_file:
+            ledger_file.write(json.dumps(event) + "\n")
+
+    def pending(self):
+        """
+        (base_url, {(kind, id): identity}) con los recursos agregados y aún no
+        borrados ni conservados (identity es None si no aplica).
+        """
+        base_url, items = None, {}
+        try:
+            with open(self.path, encoding="utf-8") as ledger_file:
+                lines = ledger_file.readlines()
+        except FileNotFoundError:
+            return None, {}
+        for line in lines:
+            try:
+                event = json.loads(line)
+            except ValueError:
+                # Última línea a medio escribir de un proceso que se cayó
+                continue
+            if event["op"] == "open":
+                base_url = event["base_url"]
+            elif event["op"] == "add":
+                items[(event["kind"], str(event["id"]))] = event.get("identity")
+            else:
+                items.pop((event["kind"], str(event["id"])), None)
+        return base_url, items
+
+    def rewrite(self, base_url, items):
+        """Deja en el ledger solo 'items' ({(kind, id): identity}) o lo elimina si no queda nada."""
+        if not items:
+            self.path.unlink(missing_ok=True)
+            return
+        tmp_path = self.path.with_suffix(".tmp")
+        with open(tmp_path, "w", encoding="utf-8") as tmp_file:
+            tmp_file.write(json.dumps({"op": "open", "base_url": base_url}) + "\n")
+            for (kind, resource_id), identity in items.items():
+                tmp_file.write(json.dumps(_add_event(kind, resource_id, identity)) + "\n")
+        os.replace(tmp_path, self.path)
+
+    def release(self):
+        self.lock.release()
+        if not self.path.exists():
+            Path(self.lock.lock_file).unlink(missing_ok=True)
+
+
+def _add_event(kind, resource_id, identity=None):
+    event = {"op": "add", "kind": kind, "id": resource_id}
+    if identity:
+        event["identity"] = identity
+    return event
+
+
+def find_ledgers(directory, prefix=""):
+    return [Ledger(path) for path in sorted(Path(directory).glob(f"{prefix}*.jsonl"))]
+
+
+# ---------- Registro de la sesión ----------
+class TeardownRegistry:
+    """
+    Hook de APIClient que anota en el ledger de este proceso cada recurso creado
+    y borrado contra 'base_url'. Se abre al iniciar la sesión y se purga (o solo
+    se cierra, en los workers de xdist) al terminarla.
+    """
+
+    def __init__(self, base_url, directory=None):
+        self.base_url = base_url.rstrip("/")
+        self.directory = Path(directory or settings.API_CLEANUP_DIR)
+        # El pid evita que dos corridas con el mismo API_RUN_ID compartan ledger
+        name = f"{unique_keys.RUN_ID}.{workers.WORKER_ID or 'main'}.{os.getpid()}"
+        self.ledger = Ledger(self.directory / f"{name}.jsonl")
+        self.registered = {}
+        # Recursos anotados y aún no borrados: {(kind, id): identity}
+        self._pending = {}
+        self._lock = threading.Lock()
+
+    def open(self):
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.ledger.lock.acquire()
+        self.ledger.append({"op": "open", "base_url": self.base_url})
+        APIClient.add_hook(self)
+        return self
+
+    def close(self):
+        APIClient.remove_hook(self)
+        self.ledger.release()
+
+    def _event(self, op, kind, resource_id, identity=None):
+        # Los ids de la URL de un DELETE son strings: todos se anotan como string
+        key = (kind, str(resource_id))
+        event = _add_event(*key, identity) if op == "add" else {"op": op, "kind": kind, "id": key[1]}
+        with self._lock:
+            self.ledger.append(event)
+            if op != "add":
+                self._pending.pop(key, None)
+                return
+            if key not in self._pending:
+                self.registered[kind] = self.registered.get(kind, 0) + 1
+            self._pending[key] = identity
+
+    def add(self, kind, resource_id, identity=None):
+        self._event("add", kind, resource_id, identity)
+
+    def done(self, kind, resource_id):
+        self._event("done", kind, resource_id)
+
+    def keep(self, kind, resource_id):
+        """El recurso no se borra al terminar (p. ej. un usuario que vuelve al pool del caché)."""
+        self._event("keep", kind, resource_id)
+
+    def __call__(self, record):
+        if record.response is None or not record.url.startswith(self.base_url):
+            return
+        path = urlsplit(record.url[len(self.base_url):]).path.rstrip("/")
+        segments = path.strip("/").split("/")
+        if record.method == "POST" and record.status in (200, 201) and path in CREATE_ENDPOINTS:
+            kind, _ = CREATE_ENDPOINTS[path]
+            created = self._identify(kind, record.response)
+            if created is not None:
+                self.add(kind, *created)
+        elif record.method == "DELETE" and (record.response.ok or record.status == GONE_STATUS):
+            if len(segments) == 2 and segments[0] in KINDS:
+                self.done(segments[0], segments[1])
+        elif record.method == "PUT" and record.response.ok and len(segments) == 2:
+            kind, resource_id = segments
+            with self._lock:
+                own = (kind, resource_id) in self._pending
+            updated = self._identify(kind, record.response) if own and kind in IDENTITY_FIELDS else None
+            if updated is None:
+                return
+            # Un aeropuerto propio que cambió de código (o de ciudad/país) se anota con sus datos nuevos
+            if str(updated[0]) != resource_id:
+                self.done(kind, resource_id)
+            self.add(kind, *updated)
+
+    @staticmethod
+    def _identify(kind, response):
+        """(id, identity) del recurso que devolvió la API, o None si la respuesta no lo trae."""
+        try:
+            body = response.json()
+            identity = {name: body[name] for name in IDENTITY_FIELDS.get(kind, ())}
+            return body[ID_FIELDS[kind]], identity or None
+        except (ValueError, KeyError, TypeError):
+            return None
+
+    def purge_run(self, client_factory, timeout=30):
+        """
+        Cierra el registro y purga los ledgers de toda la corrida (los de cada
+        worker de xdist incluidos, que ya terminaron). 'client_factory()' retorna
+        el APIClient de admin; solo se llama si hay algo para borrar.
+        Llamarlo cuando ya nada crea recursos (el almacén de recursos cerrado).
+        """
+        APIClient.remove_hook(self)
+        ledgers = [self.ledger]
+        for ledger in find_ledgers(self.directory, prefix=f"{unique_keys.RUN_ID}."):
+            if ledger.path == self.ledger.path:
+                continue
+            try:
+                ledger.lock.acquire(timeout=timeout)
+            except Timeout:
+                print(f"⚠️ {ledger.path.name} sigue en uso; queda para python -m api.utils.cleanup")
+                continue
+            ledgers.append(ledger)
+        try:
+            return collect(ledgers, client_factory)
+        finally:
+            for ledger in ledgers:
+                ledger.release()
+
+
+# ---------- Borrado ----------
+def _empty_report():
+    return {"deleted": {}, "gone": 0, "unsupported": 0, "reused": 0, "failed": [], "seconds": 0.0}
+
+
+def _still_ours(client, batch, identities, concurrency, report):
+    """
+    Filtra 'batch' a los recursos que siguen siendo los que se crearon: los que tienen
+    identity se piden con GET y se comparan. Los que ya no existen, los que reutilizó
+    otra corrida y los que no se pudieron verificar quedan fuera (y en el reporte).
+    """
+    checked = [item for item in batch if identities.get(item)]
+    if not checked:
+        return batch
+    results = client.batch(
+        [("get", delete_endpoint(kind, resource_id)) for kind, resource_id in checked],
+        max_concurrency=concurrency,
+    )
+    skipped = set()
+    for item, result in zip(checked, results):
+        status = result.response.status_code if result.response is not None else None
+        if status == GONE_STATUS:
+            report["gone"] += 1
+        elif not result.ok:
+            report["failed"].append((*item, str(result.error or f"status {status}")))
+        else:
+            try:
+                current = result.response.json()
+            except ValueError:
+                current = {}
+            if all(current.get(name) == value for name, value in identities[item].items()):
+                continue
+            report["reused"] += 1
+        skipped.add(item)
+    return [item for item in batch if item not in skipped]
+
+
+def purge(client, entries, identities=None, concurrency=None):
+    """
+    Borra 'entries' ([(kind, id)...]) por niveles de PURGE_ORDER con DELETE concurrentes.
+    'identities' ({(kind, id): {campo: valor}}) son los datos que se verifican antes de
+    borrar los recursos de IDENTITY_FIELDS.
+    Retorna {"deleted": {kind: n}, "gone", "unsupported", "reused", "failed": [(kind, id, error)], "seconds"}.
+    """
+    concurrency = concurrency or settings.API_CLEANUP_CONCURRENCY
+    report = _empty_report()
+    started = time.perf_counter()
+    for level in PURGE_ORDER:
+        batch = [(kind, resource_id) for kind, resource_id in entries if kind in level]
+        batch = _still_ours(client, batch, identities or {}, concurrency, report)
+        if not batch:
+            continue
+        results = client.batch(
+            [("delete", delete_endpoint(kind, resource_id)) for kind, resource_id in batch],
+            max_concurrency=concurrency,
+        )
+        for (kind, resource_id), result in zip(batch, results):
+            status = result.response.status_code if result.response is not None else None
+            if result.ok:
+                report["deleted"][kind] = report["deleted"].get(kind, 0) + 1
+            elif status == GONE_STATUS:
+                report["gone"] += 1
+            elif status == UNSUPPORTED_STATUS:
+                report["unsupported"] += 1
+            else:
+                report["failed"].append((kind, resource_id, str(result.error or f"status {status}")))
+    report["seconds"] = round(time.perf_counter() - started, 3)
+    return report
+
+
+def collect(ledgers, client_factory, dry_run=False):
+    """
+    Purga los pendientes de 'ledgers' (con su lock ya tomado) y deja en cada uno
+    solo lo que no se pudo borrar. Con dry_run solo retorna los pendientes.
+    """
+    pending = {}
+    identities = {}
+    for ledger in ledgers:
+        pending[ledger] = ledger.pending()
+        identities.update(pending[ledger][1])
+    entries = list(identities)
+    if dry_run:
+        return {"pending": entries}
+    if entries:
+        report = purge(client_factory(), entries, identities)
+    else:
+        report = _empty_report()
+    failed = {(kind, resource_id) for kind, resource_id, _ in report["failed"]}
+    for ledger, (base_url, items) in pending.items():
+        ledger.rewrite(base_url, {item: identity for item, identity in items.items() if item in failed})
+    report["pending"] = len(entries)
+    return report
+
+
+def admin_client(base_url, token_cache=None):
+    """APIClient con el token del admin de settings (del caché de tokens si hay uno vigente)."""
+    def login():
+        response = APIClient(base_url).post_form(
+            endpoint="/auth/login",
+            data={"username": settings.ADMIN_EMAIL, "password": settings.ADMIN_PASSWORD},
+        )
+        response.raise_for_status()
+        return response.json()["access_token"]
+
+    token = token_cache.get_or_login(base_url, settings.ADMIN_EMAIL, login) if token_cache else login()
+    return APIClient(base_url, token=token)
+
+
+def format_report(report):
+    """Líneas de resumen de un purge para la terminal."""
+    deleted = report["deleted"]
+    detail = ", ".join(f"{kind}: {count}" for kind, count in deleted.items())
+    lines = [
+        f"🧹 {sum(deleted.values())} recursos borrados" + (f" ({detail})" if detail else "")
+        + f" en {report['seconds']}s; {report['gone']} ya no existían"
+        + (f", {report['unsupported']} sin DELETE en la API" if report["unsupported"] else "")
+        + (f", {report['reused']} reutilizados por otra corrida (no se borraron)" if report["reused"] else "")
+    ]
+    if report["failed"]:
+        lines.append(
+            f"❌ {len(report['failed'])} no se pudieron borrar (quedan para python -m api.utils.cleanup): "
+            + ", ".join(f"{kind}/{resource_id} ({error})" for kind, resource_id, error in report["failed"][:5])
+        )
+    return lines
+
+
+# ---------- Recolector offline ----------
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Borra los recursos que dejaron en la API las corridas de la suite que no terminaron"
+    )
+    parser.add_argument("--dir", default=settings.API_CLEANUP_DIR, help="Directorio de ledgers (API_CLEANUP_DIR)")
+    parser.add_argument("--base-url", default=settings.API_BASE_URL, help="API de la que se borra (API_BASE_URL)")
+    parser.add_argument("--dry-run", action="store_true", help="Solo lista los recursos pendientes")
+    args = parser.parse_args(argv)
+    base_url = (args.base_url or "").rstrip("/")
+    if not base_url:
+        parser.error("falta la URL de la API (--base-url o API_BASE_URL)")
+
+    ledgers = []
+    for ledger in find_ledgers(args.dir):
+        try:
+            ledger.lock.acquire(timeout=0)
+        except Timeout:
+            print(f"⏳ {ledger.path.name}: la corrida sigue en curso, se omite")
+            continue
+        if ledger.pending()[0] != base_url:
+            ledger.release()
+            continue
+        ledgers.append(ledger)
+
+    try:
+        report = collect(ledgers, lambda: admin_client(base_url), dry_run=args.dry_run)
+    finally:
+        for ledger in ledgers:
+            ledger.release()
+
+    if args.dry_run:
+        for kind, resource_id in report["pending"]:
+            print(f"🧪 {delete_endpoint(kind, resource_id)}")
+        print(f"{len(report['pending'])} recursos pendientes en {len(ledgers)} ledgers")
+        return 0
+    for line in format_report(report):
+        print(line)
+    return 1 if report["failed"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
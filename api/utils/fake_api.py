@@ -0,0 +1,794 @@
+"""
+Doble en memoria de la Airline API para correr la suite sin red.
+
+Cubre los endpoints que usan los tests (/auth, /users, /airports, /aircrafts,
+/flights, /bookings, /payments) y reproduce las reglas de validación que ellos
+verifican: mensajes de error estilo FastAPI/pydantic (422), detalles de 401/403,
+reglas de estado de las reservas y los bugs conocidos de la API real
+(login de admin tras cambiar su password -> 500, PATCH draft -> ready -> 500).
+
+Formas de usarlo:
+  - API_BASE_URL=fake: APIClient monta FakeAirlineAdapter en la sesión
+    (ver session_pool) y ninguna petición abre un socket.
+  - python -m api.utils.fake_api --port 8000 y API_BASE_URL=http://127.0.0.1:8000:
+    el mismo backend servido por HTTP local (compartido entre workers).
+"""
+import argparse
+import base64
+import datetime
+import hashlib
+import hmac
+import io
+import json
+import re
+import threading
+import time
+import uuid
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+
+from api.utils import settings
+
+TOKEN_TTL_SECONDS = 3600
+_SECRET = b"fake-airline-api"
+_MISSING = object()
+
+
+class FakeHTTPException(Exception):
+    def __init__(self, status, detail):
+        super().__init__(detail)
+        self.status = status
+        self.detail = detail
+
+
+# ======================
+# VALIDACIÓN (mensajes estilo pydantic v2)
+# ======================
+def _error(error_type, loc, msg, value, ctx=None):
+    error = {"type": error_type, "loc": list(loc), "msg": msg, "input": value}
+    if ctx:
+        error["ctx"] = ctx
+    return error
+
+
+def _check_str(value, loc, rule):
+    if not isinstance(value, str):
+        return None, _error("string_type", loc, "Input should be a valid string", value)
+    if "min_length" in rule and len(value) < rule["min_length"]:
+        n = rule["min_length"]
+        return None, _error("string_too_short", loc, f"String should have at least {n} characters",
+                            value, {"min_length": n})
+    if "max_length" in rule and len(value) > rule["max_length"]:
+        n = rule["max_length"]
+        return None, _error("string_too_long", loc, f"String should have at most {n} characters",
+                            value, {"max_length": n})
+    if "pattern" in rule and not re.match(rule["pattern"], value):
+        pattern = rule["pattern"]
+        return None, _error("string_pattern_mismatch", loc, f"String should match pattern '{pattern}'",
+                            value, {"pattern": pattern})
+    return value, None
+
+
+def _check_email(value, loc, rule):
+    if not isinstance(value, str):
+        return None, _error("string_type", loc, "Input should be a valid string", value)
+    local, _, domain = value.partition("@")
+    if not _:
+        reason = "An email address must have an @-sign."
+    elif not local:
+        reason = "There must be something before the @-sign."
+    elif "." not in domain:
+        reason = "The part after the @-sign is not valid. It should have a period."
+    else:
+        return value, None
+    return None, _error("value_error", loc, f"value is not a valid email address: {reason}",
+                        value, {"reason": reason})
+
+
+def _check_bounds(number, value, loc, rule):
+    if "ge" in rule and number < rule["ge"]:
+        return None, _error("greater_than_equal", loc,
+                            f"Input should be greater than or equal to {rule['ge']}", value, {"ge": rule["ge"]})
+    if "gt" in rule and number <= rule["gt"]:
+        return None, _error("greater_than", loc,
+                            f"Input should be greater than {rule['gt']}", value, {"gt": rule["gt"]})
+    return number, None
+
+
+def _check_int(value, loc, rule):
+    if isinstance(value, bool):
+        number = int(value)
+    elif isinstance(value, int):
+        number = value
+    elif isinstance(value, float) and value.is_integer():
+        number = int(value)
+    elif isinstance(value, str):
+        try:
+            number = int(value.strip())
+        except ValueError:
+            return None, _error("int_parsing", loc,
+                                "Input should be a valid integer, unable to parse string as an integer", value)
+    else:
+        return None, _error("int_type", loc, "Input should be a valid integer", value)
+    return _check_bounds(number, value, loc, rule)
+
+
+def _check_number(value, loc, rule):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        number = value
+    elif isinstance(value, str):
+        try:
+            number = float(value.strip())
+        except ValueError:
+            return None, _error("float_parsing", loc,
+                                "Input should be a valid number, unable to parse string as a number", value)
+    else:
+        return None, _error("float_type", loc, "Input should be a valid number", value)
+    return _check_bounds(number, value, loc, rule)
+
+
+def _parse_datetime(value):
+    parsed = datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=datetime.timezone.utc)
+    return parsed
+
+
+def _check_datetime(value, loc, rule):
+    if isinstance(value, str):
+        try:
+            return _parse_datetime(value), None
+        except ValueError:
+            pass
+    return None, _error("datetime_from_date_parsing", loc,
+                        "Input should be a valid datetime or date, invalid character in year", value)
+
+
+def _check_date(value, loc, rule):
+    if isinstance(value, str):
+        try:
+            return datetime.date.fromisoformat(value), None
+        except ValueError:
+            pass
+    return None, _error("date_from_datetime_parsing", loc,
+                        "Input should be a valid date or datetime, invalid date separator", value)
+
+
+def _check_enum(value, loc, rule):
+    if value in rule["choices"]:
+        return value, None
+    expected = " or ".join(f"'{choice}'" for choice in rule["choices"])
+    return None, _error("enum", loc, f"Input should be {expected}", value, {"expected": expected})
+
+
+def _check_list(value, loc, rule):
+    if not isinstance(value, list):
+        return None, _error("list_type", loc, "Input should be a valid list", value)
+    items, errors = [], []
+    for index, item in enumerate(value):
+        clean, item_errors = validate(item, rule["items"], loc + (index,))
+        items.append(clean)
+        errors.extend(item_errors)
+    return (items, errors) if errors else (items, None)
+
+
+_CHECKS = {
+    "str": _check_str,
+    "email": _check_email,
+    "int": _check_int,
+    "number": _check_number,
+    "datetime": _check_datetime,
+    "date": _check_date,
+    "enum": _check_enum,
+    "list": _check_list,
+}
+
+
+def validate(data, schema, loc=("body",)):
+    """
+    Valida 'data' contra 'schema' ({campo: regla}) y retorna (datos_limpios, errores).
+    Los campos con 'default' en la regla son opcionales.
+    """
+    if not isinstance(data, dict):
+        return {}, [_error("model_attributes_type", loc, "Input should be a valid dictionary or object", data)]
+
+    clean, errors = {}, []
+    for name, rule in schema.items():
+        value = data.get(name, _MISSING)
+        field_loc = loc + (name,)
+        if value is _MISSING or (value is None and rule.get("default", _MISSING) is _MISSING):
+            if "default" in rule:
+                clean[name] = rule["default"]
+            else:
+                errors.append(_error("missing", field_loc, "Field required", data))
+            continue
+        checked, error = _CHECKS[rule["type"]](value, field_loc, rule)
+        if error:
+            errors.extend(error if isinstance(error, list) else [error])
+        else:
+            clean[name] = checked
+    return clean, errors
+
+
+def _validated(data, schema, loc=("body",)):
+    clean, errors = validate(data, schema, loc)
+    if errors:
+        raise FakeHTTPException(422, errors)
+    return clean
+
+
+IATA = {"type": "str", "pattern": r"^[A-Z]{3}$"}
+PAGINATION = {
+    "skip": {"type": "int", "ge": 0, "default": 0},
+    "limit": {"type": "int", "ge": 0, "default": 100},
+}
+SIGNUP_SCHEMA = {
+    "email": {"type": "email"},
+    "password": {"type": "str", "min_length": 6},
+    "full_name": {"type": "str"},
+}
+USER_CREATE_SCHEMA = dict(SIGNUP_SCHEMA, role={"type": "enum", "choices": ["passenger", "admin"], "default": "passenger"})
+LOGIN_SCHEMA = {"username": {"type": "str"}, "password": {"type": "str"}}
+AIRPORT_SCHEMA = {"iata_code": IATA, "city": {"type": "str"}, "country": {"type": "str"}}
+AIRCRAFT_SCHEMA = {
+    "tail_number": {"type": "str", "min_length": 5, "max_length": 10},
+    "model": {"type": "str"},
+    "capacity": {"type": "int", "ge": 0},
+}
+FLIGHT_SCHEMA = {
+    "origin": IATA,
+    "destination": IATA,
+    "departure_time": {"type": "datetime"},
+    "arrival_time": {"type": "datetime"},
+    "base_price": {"type": "number", "ge": 0},
+    "aircraft_id": {"type": "str"},
+}
+FLIGHT_SEARCH_SCHEMA = dict(
+    PAGINATION,
+    origin={"type": "str", "max_length": 3, "default": None},
+    destination={"type": "str", "max_length": 3, "default": None},
+    date={"type": "date", "default": None},
+)
+PASSENGER_SCHEMA = {"full_name": {"type": "str"}, "passport": {"type": "str"}, "seat": {"type": "str"}}
+BOOKING_SCHEMA = {"flight_id": {"type": "str"}, "passengers": {"type": "list", "items": PASSENGER_SCHEMA}}
+BOOKING_PATCH_SCHEMA = {"status": {"type": "enum", "choices": ["draft", "ready", "confirmed", "cancelled"],
+                                   "default": None}}
+PAYMENT_SCHEMA = {
+    "booking_id": {"type": "str"},
+    "amount": {"type": "number", "gt": 0},
+    "payment_method": {"type": "str"},
+}
+
+
+# ======================
+# BACKEND EN MEMORIA
+# ======================
+def _new_id(prefix):
+    return f"{prefix}-{uuid.uuid4().hex[:12]}"
+
+
+def _b64(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _unb64(text):
+    return base64.urlsafe_b64decode(text + "=" * (-len(text) % 4))
+
+
+class FakeAirlineAPI:
+    """Estado y reglas de negocio de la Airline API, en memoria y thread-safe."""
+
+    def __init__(self, seed=True):
+        self._lock = threading.RLock()
+        self.users = {}
+        self.airports = {}
+        self.aircrafts = {}
+        self.flights = {}
+        self.bookings = {}
+        self.payments = {}
+        self.routes = [
+            ("POST", r"/auth/signup", self.signup),
+            ("POST", r"/auth/login", self.login),
+            ("POST", r"/users", self.create_user),
+            ("GET", r"/users", self.list_users),
+            ("GET", r"/users/me", self.get_me),
+            ("PUT", r"/users/(?P<user_id>[^/]+)", self.update_user),
+            ("DELETE", r"/users/(?P<user_id>[^/]+)", self.delete_user),
+            ("POST", r"/airports", self.create_airport),
+            ("GET", r"/airports", self.list_airports),
+            ("GET", r"/airports/(?P<code>[^/]+)", self.get_airport),
+            ("PUT", r"/airports/(?P<code>[^/]+)", self.update_airport),
+            ("DELETE", r"/airports/(?P<code>[^/]+)", self.delete_airport),
+            ("POST", r"/aircrafts", self.create_aircraft),
+            ("GET", r"/aircrafts", self.list_aircrafts),
+            ("GET", r"/aircrafts/(?P<aircraft_id>[^/]+)", self.get_aircraft),
+            ("PUT", r"/aircrafts/(?P<aircraft_id>[^/]+)", self.update_aircraft),
+            ("DELETE", r"/aircrafts/(?P<aircraft_id>[^/]+)", self.delete_aircraft),
+            ("POST", r"/flights", self.create_flight),
+            ("GET", r"/flights", self.search_flights),
+            ("GET", r"/flights/(?P<flight_id>[^/]+)", self.get_flight),
+            ("PUT", r"/flights/(?P<flight_id>[^/]+)", self.update_flight),
+            ("DELETE", r"/flights/(?P<flight_id>[^/]+)", self.delete_flight),
+            ("POST", r"/bookings", self.create_booking),
+            ("GET", r"/bookings", self.list_bookings),
+            ("GET", r"/bookings/(?P<booking_id>[^/]+)", self.get_booking),
+            ("PATCH", r"/bookings/(?P<booking_id>[^/]+)", self.patch_booking),
+            ("DELETE", r"/bookings/(?P<booking_id>[^/]+)", self.delete_booking),
+            ("POST", r"/payments", self.create_payment),
+            ("GET", r"/payments/(?P<payment_id>[^/]+)", self.get_payment),
+        ]
+        self._compiled_routes = [(method, re.compile(f"^{path}$"), handler) for method, path, handler in self.routes]
+        if seed:
+            self._seed()
+
+    # ---------- Datos iniciales ----------
+    def _seed(self):
+        """Datos base equivalentes a un entorno ya usado (las pruebas de listados los necesitan)."""
+        admin = self._add_user(
+            settings.ADMIN_EMAIL or "admin@airline.test",
+            settings.ADMIN_PASSWORD or "admin123",
+            settings.ADMIN_FULL_NAME or "QA Admin",
+            settings.ADMIN_ROLE or "admin",
+        )
+        for index in range(3):
+            self._add_user(f"seed.passenger{index}@airline.test", "secret123", f"Seed Passenger {index}", "passenger")
+
+        for code, city, country in [("LIM", "Lima", "Peru"), ("BOG", "Bogota", "Colombia"), ("MEX", "Mexico City", "Mexico")]:
+            self.airports[code] = {"iata_code": code, "city": city, "country": country}
+
+        now = datetime.datetime.now(datetime.timezone.utc).replace(microsecond=0)
+        for index in range(3):
+            aircraft = {"id": _new_id("acf"), "tail_number": f"SEED{index:03d}", "model": "A320", "capacity": 180}
+            self.aircrafts[aircraft["id"]] = aircraft
+            flight = {
+                "id": _new_id("flt"),
+                "origin": "LIM",
+                "destination": "BOG",
+                "departure_time": (now + datetime.timedelta(days=index + 1)).isoformat(),
+                "arrival_time": (now + datetime.timedelta(days=index + 1, hours=3)).isoformat(),
+                "base_price": 100 + index,
+                "aircraft_id": aircraft["id"],
+                "available_seats": aircraft["capacity"],
+            }
+            self.flights[flight["id"]] = flight
+            booking = {
+                "id": _new_id("bkg"),
+                "flight_id": flight["id"],
+                "user_id": admin["id"],
+                "status": "draft",
+                "passengers": [{"full_name": "Seed Passenger", "passport": "P0000000", "seat": "1A"}],
+            }
+            self.bookings[booking["id"]] = booking
+
+    def _add_user(self, email, password, full_name, role):
+        user = {"id": _new_id("usr"), "email": email, "full_name": full_name, "role": role,
+                "password": password, "password_changed": False}
+        self.users[user["id"]] = user
+        return user
+
+    # ---------- Tokens ----------
+    def issue_token(self, user):
+        header = _b64(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+        payload = _b64(json.dumps({"sub": user["id"], "exp": int(time.time()) + TOKEN_TTL_SECONDS}).encode())
+        signature = _b64(hmac.new(_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+        return f"{header}.{payload}.{signature}"
+
+    def _user_from_token(self, token):
+        try:
+            header, payload, signature = token.split(".")
+            expected = _b64(hmac.new(_SECRET, f"{header}.{payload}".encode(), hashlib.sha256).digest())
+            claims = json.loads(_unb64(payload))
+        except ValueError:
+            return None
+        if not hmac.compare_digest(signature, expected) or claims.get("exp", 0) < time.time():
+            return None
+        return self.users.get(claims.get("sub"))
+
+    # ---------- Dispatcher ----------
+    def handle(self, method, url, headers=None, body=None):
+        """
+        Procesa una petición y retorna (status, headers, body_bytes).
+        """
+        parts = urlsplit(url)
+        path = parts.path.rstrip("/") or "/"
+        request = {
+            "method": method.upper(),
+            "query": {key: values[-1] for key, values in parse_qs(parts.query, keep_blank_values=True).items()},
+            "headers": CaseInsensitiveDict(headers or {}),
+            "body": body.encode() if isinstance(body, str) else (body or b""),
+        }
+
+        allowed = False
+        with self._lock:
+            for route_method, pattern, handler in self._compiled_routes:
+                match = pattern.match(path)
+                if not match:
+                    continue
+                allowed = True
+                if route_method != request["method"]:
+                    continue
+                try:
+                    status, payload = handler(request, **match.groupdict())
+                except FakeHTTPException as exc:
+                    if exc.status == 500:
+                        return 500, {"Content-Type": "text/plain; charset=utf-8"}, b"Internal Server Error"
+                    status, payload = exc.status, {"detail": exc.detail}
+                return self._encode(status, payload)
+
+        if allowed:
+            return self._encode(405, {"detail": "Method Not Allowed"})
+        return self._encode(404, {"detail": "Not Found"})
+
+    @staticmethod
+    def _encode(status, payload):
+        if payload is None:
+            return status, {"Content-Length": "0"}, b""
+        content = json.dumps(payload, default=str).encode()
+        return status, {"Content-Type": "application/json", "Content-Length": str(len(content))}, content
+
+    # ---------- Helpers de petición ----------
+    @staticmethod
+    def _json(request):
+        try:
+            return json.loads(request["body"] or b"null")
+        except ValueError:
+            raise FakeHTTPException(422, [_error("json_invalid", ("body",), "JSON decode error", None)])
+
+    @staticmethod
+    def _form(request):
+        content_type = request["headers"].get("Content-Type", "")
+        if "application/x-www-form-urlencoded" not in content_type:
+            return {}
+        parsed = parse_qs(request["body"].decode(), keep_blank_values=True)
+        return {key: values[-1] for key, values in parsed.items()}
+
+    def _current_user(self, request):
+        authorization = request["headers"].get("Authorization", "")
+        scheme, _, token = authorization.partition(" ")
+        if scheme.lower() != "bearer" or not token:
+            raise FakeHTTPException(401, "Not authenticated")
+        user = self._user_from_token(token)
+        if user is None:
+            raise FakeHTTPException(401, "Could not validate credentials")
+        return user
+
+    def _current_admin(self, request):
+        user = self._current_user(request)
+        if user["role"] != "admin":
+            raise FakeHTTPException(403, "Admin privileges required")
+        return user
+
+    @staticmethod
+    def _page(items, request):
+        params = _validated(request["query"], PAGINATION, ("query",))
+        return list(items)[params["skip"]:params["skip"] + params["limit"]]
+
+    @staticmethod
+    def _get_or_404(collection, key):
+        if key not in collection:
+            raise FakeHTTPException(404, "Not Found")
+        return collection[key]
+
+    @staticmethod
+    def _public_user(user):
+        return {key: user[key] for key in ("id", "email", "full_name", "role")}
+
+    def _check_email_available(self, email, exclude_id=None):
+        for user in self.users.values():
+            if user["email"].lower() == email.lower() and user["id"] != exclude_id:
+                raise FakeHTTPException(400, "Email already registered")
+
+    # ---------- Auth ----------
+    def signup(self, request):
+        data = _validated(self._json(request), SIGNUP_SCHEMA)
+        self._check_email_available(data["email"])
+        user = self._add_user(data["email"], data["password"], data["full_name"], "passenger")
+        return 201, self._public_user(user)
+
+    def login(self, request):
+        data = _validated(self._form(request), LOGIN_SCHEMA)
+        user = next((u for u in self.users.values() if u["email"].lower() == data["username"].lower()), None)
+        if user is None or user["password"] != data["password"]:
+            raise FakeHTTPException(401, "Incorrect credentials")
+        if user["role"] == "admin" and user["password_changed"]:
+            # Bug conocido de la API real: el admin no puede loguearse tras cambiar su password
+            raise FakeHTTPException(500, "Internal Server Error")
+        return 200, {"access_token": self.issue_token(user), "token_type": "bearer"}
+
+    # ---------- Users ----------
+    def create_user(self, request):
+        self._current_admin(request)
+        data = _validated(self._json(request), USER_CREATE_SCHEMA)
+        self._check_email_available(data["email"])
+        user = self._add_user(data["email"], data["password"], data["full_name"], data["role"])
+        return 201, self._public_user(user)
+
+    def list_users(self, request):
+        self._current_admin(request)
+        return 200, [self._public_user(user) for user in self._page(self.users.values(), request)]
+
+    def get_me(self, request):
+        return 200, self._public_user(self._current_user(request))
+
+    def update_user(self, request, user_id):
+        current = self._current_user(request)
+        if current["id"] != user_id and current["role"] != "admin":
+            raise FakeHTTPException(403, "Forbidden")
+        data = _validated(self._json(request), SIGNUP_SCHEMA)
+        user = self._get_or_404(self.users, user_id)
+        self._check_email_available(data["email"], exclude_id=user_id)
+        if data["password"] != user["password"]:
+            user["password_changed"] = True
+        user.update(email=data["email"], password=data["password"], full_name=data["full_name"])
+        return 200, self._public_user(user)
+
+    def delete_user(self, request, user_id):
+        self._current_admin(request)
+        self._get_or_404(self.users, user_id)
+        del self.users[user_id]
+        return 204, None
+
+    # ---------- Airports ----------
+    def create_airport(self, request):
+        self._current_admin(request)
+        data = _validated(self._json(request), AIRPORT_SCHEMA)
+        if data["iata_code"] in self.airports:
+            raise FakeHTTPException(400, "Airport already exists")
+        self.airports[data["iata_code"]] = data
+        return 201, data
+
+    def list_airports(self, request):
+        return 200, self._page(self.airports.values(), request)
+
+    def get_airport(self, request, code):
+        return 200, self._get_or_404(self.airports, code)
+
+    def update_airport(self, request, code):
+        self._current_admin(request)
+        data = _validated(self._json(request), AIRPORT_SCHEMA)
+        airport = self._get_or_404(self.airports, code)
+        # El código de la ruta es la clave: el iata_code del body se valida pero no renombra
+        airport.update(city=data["city"], country=data["country"])
+        return 200, airport
+
+    def delete_airport(self, request, code):
+        self._current_admin(request)
+        self._get_or_404(self.airports, code)
+        del self.airports[code]
+        return 204, None
+
+    # ---------- Aircrafts ----------
+    def _check_tail_number_available(self, tail_number, exclude_id=None):
+        for aircraft in self.aircrafts.values():
+            if aircraft["tail_number"] == tail_number and aircraft["id"] != exclude_id:
+                raise FakeHTTPException(400, "Tail number already exists")
+
+    def create_aircraft(self, request):
+        self._current_admin(request)
+        data = _validated(self._json(request), AIRCRAFT_SCHEMA)
+        self._check_tail_number_available(data["tail_number"])
+        aircraft = dict(data, id=_new_id("acf"))
+        self.aircrafts[aircraft["id"]] = aircraft
+        return 201, aircraft
+
+    def list_aircrafts(self, request):
+        return 200, self._page(self.aircrafts.values(), request)
+
+    def get_aircraft(self, request, aircraft_id):
+        return 200, self._get_or_404(self.aircrafts, aircraft_id)
+
+    def update_aircraft(self, request, aircraft_id):
+        self._current_admin(request)
+        data = _validated(self._json(request), AIRCRAFT_SCHEMA)
+        aircraft = self._get_or_404(self.aircrafts, aircraft_id)
+        self._check_tail_number_available(data["tail_number"], exclude_id=aircraft_id)
+        aircraft.update(data)
+        return 200, aircraft
+
+    def delete_aircraft(self, request, aircraft_id):
+        self._current_admin(request)
+        self._get_or_404(self.aircrafts, aircraft_id)
+        del self.aircrafts[aircraft_id]
+        return 204, None
+
+    # ---------- Flights ----------
+    def _flight_from_payload(self, request):
+        data = _validated(self._json(request), FLIGHT_SCHEMA)
+        if data["aircraft_id"] not in self.aircrafts:
+            raise FakeHTTPException(404, "Aircraft not found")
+        if data["origin"] not in self.airports or data["destination"] not in self.airports:
+            raise FakeHTTPException(404, "Airport not found")
+        # Misma regla, status y mensaje que la API real (ver *_with_arrival_before_departure_returns_404)
+        if data["arrival_time"] <= data["departure_time"]:
+            raise FakeHTTPException(404, "Arrival time must be after departure time")
+        data["departure_time"] = data["departure_time"].isoformat()
+        data["arrival_time"] = data["arrival_time"].isoformat()
+        data["available_seats"] = self.aircrafts[data["aircraft_id"]]["capacity"]
+        return data
+
+    def create_flight(self, request):
+        self._current_admin(request)
+        flight = dict(self._flight_from_payload(request), id=_new_id("flt"))
+        self.flights[flight["id"]] = flight
+        return 201, flight
+
+    def search_flights(self, request):
+        params = _validated(request["query"], FLIGHT_SEARCH_SCHEMA, ("query",))
+        flights = [
+            flight for flight in self.flights.values()
+            if (params["origin"] is None or flight["origin"] == params["origin"])
+            and (params["destination"] is None or flight["destination"] == params["destination"])
+            and (params["date"] is None or _parse_datetime(flight["departure_time"]).date() == params["date"])
+        ]
+        return 200, flights[params["skip"]:params["skip"] + params["limit"]]
+
+    def get_flight(self, request, flight_id):
+        return 200, self._get_or_404(self.flights, flight_id)
+
+    def update_flight(self, request, flight_id):
+        self._current_admin(request)
+        flight = self._get_or_404(self.flights, flight_id)
+        flight.update(self._flight_from_payload(request))
+        return 200, flight
+
+    def delete_flight(self, request, flight_id):
+        self._current_admin(request)
+        self._get_or_404(self.flights, flight_id)
+        del self.flights[flight_id]
+        return 204, None
+
+    # ---------- Bookings ----------
+    def _owned_booking(self, request, booking_id):
+        user = self._current_user(request)
+        booking = self._get_or_404(self.bookings, booking_id)
+        if user["role"] != "admin" and booking["user_id"] != user["id"]:
+            raise FakeHTTPException(403, "Forbidden")
+        return booking
+
+    def create_booking(self, request):
+        user = self._current_user(request)
+        data = _validated(self._json(request), BOOKING_SCHEMA)
+        if data["flight_id"] not in self.flights:
+            raise FakeHTTPException(404, "Flight not found")
+        booking = dict(data, id=_new_id("bkg"), user_id=user["id"], status="draft")
+        self.bookings[booking["id"]] = booking
+        return 201, booking
+
+    def list_bookings(self, request):
+        user = self._current_user(request)
+        bookings = self.bookings.values()
+        if user["role"] != "admin":
+            # El passenger ve primero sus reservas más recientes
+            bookings = reversed([booking for booking in bookings if booking["user_id"] == user["id"]])
+        return 200, self._page(bookings, request)
+
+    def get_booking(self, request, booking_id):
+        return 200, self._owned_booking(request, booking_id)
+
+    def patch_booking(self, request, booking_id):
+        booking = self._owned_booking(request, booking_id)
+        data = _validated(self._json(request), BOOKING_PATCH_SCHEMA)
+        if booking["status"] != "draft":
+            raise FakeHTTPException(400, "Only draft bookings can be edited")
+        if data["status"] is not None:
+            booking["status"] = data["status"]
+            if data["status"] == "ready":
+                # Bug conocido de la API real: el cambio se guarda pero responde 500
+                raise FakeHTTPException(500, "Internal Server Error")
+        return 200, booking
+
+    def delete_booking(self, request, booking_id):
+        self._owned_booking(request, booking_id)
+        del self.bookings[booking_id]
+        return 204, None
+
+    # ---------- Payments ----------
+    def create_payment(self, request):
+        user = self._current_user(request)
+        data = _validated(self._json(request), PAYMENT_SCHEMA)
+        booking = self.bookings.get(data["booking_id"])
+        if booking is None:
+            raise FakeHTTPException(404, "Booking not found")
+        if user["role"] != "admin" and booking["user_id"] != user["id"]:
+            raise FakeHTTPException(403, "Forbidden")
+        payment = dict(data, id=_new_id("pym"), status="pending")
+        self.payments[payment["id"]] = payment
+        return 201, payment
+
+    def get_payment(self, request, payment_id):
+        self._current_user(request)
+        return 200, self._get_or_404(self.payments, payment_id)
+
+
+_fake_api = None
+_fake_api_lock = threading.Lock()
+
+
+def get_fake_api():
+    """Instancia única del backend falso para este proceso."""
+    global _fake_api
+    with _fake_api_lock:
+        if _fake_api is None:
+            _fake_api = FakeAirlineAPI()
+        return _fake_api
+
+
+# ======================
+# TRANSPORTES
+# ======================
+def build_response(request, status, headers, content, connection=None):
+    """Arma un requests.Response completo a partir de status, headers y body en bytes."""
+    response = Response()
+    response.status_code = status
+    response.reason = HTTPStatus(status).phrase
+    response.headers = CaseInsensitiveDict(headers)
+    response._content = content
+    response.raw = io.BytesIO(content)
+    response.encoding = "utf-8"
+    response.url = request.url
+    response.request = request
+    response.connection = connection
+    return response
+
+
+class FakeAirlineAdapter(BaseAdapter):
+    """
+    Adaptador de transporte de requests que responde desde FakeAirlineAPI
+    sin abrir ningún socket. Se monta en la sesión para settings.FAKE_API_BASE_URL.
+    """
+
+    def __init__(self, api=None):
+        super().__init__()
+        self.api = api or get_fake_api()
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        status, headers, content = self.api.handle(request.method, request.url, request.headers, request.body)
+        return build_response(request, status, headers, content, connection=self)
+
+    def close(self):
+        pass
+
+
+class _FakeAPIRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers y body salen en escrituras separadas: sin esto Nagle suma ~40ms por respuesta
+    disable_nagle_algorithm = True
+
+    def _dispatch(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, content = get_fake_api().handle(
+            self.command, f"http://fake{self.path}", dict(self.headers), body
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        if "Content-Length" not in headers:
+            self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _dispatch
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(host="127.0.0.1", port=8000):
+    """Sirve el backend falso por HTTP local (bloqueante)."""
+    server = ThreadingHTTPServer((host, port), _FakeAPIRequestHandler)
+    print(f"✈️ Fake Airline API escuchando en http://{host}:{server.server_port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Airline API falsa en memoria para correr la suite sin red")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    serve(args.host, args.port)
@@ -0,0 +1,423 @@
+"""
+Métricas de latencia de las peticiones de APIClient.
+
+Cada llamada produce un CallRecord (método, endpoint con plantilla, status,
+bytes, tiempos de DNS/connect/TLS/TTFB/total y reintentos) que se entrega a
+los hooks registrados en APIClient. MetricsRecorder es el hook por defecto:
+agrupa los tiempos por endpoint en histogramas log-lineales (estilo HDR) y
+por ámbito (test o fixture) para saber qué domina la duración de la corrida.
+
+Los tiempos de DNS, connect y TLS solo existen en las llamadas que abrieron
+una conexión nueva; los mide TimedHTTPAdapter con clases de conexión propias.
+"""
+import datetime
+import html
+import json
+import os
+import socket
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import NewConnectionError
+
+# Segmentos de ruta que son parte del endpoint y no un id
+STATIC_SEGMENTS = frozenset({"auth", "login", "signup", "me"})
+PERCENTILES = (50, 95, 99)
+
+# Test o fixture que está haciendo las peticiones (ver conftest)
+current_scope = ContextVar("api_metrics_scope", default=None)
+
+# Tiempos de la última conexión abierta por este hilo (los lee APIClient tras cada llamada)
+_connection_timings = threading.local()
+
+
+@contextmanager
+def scoped(scope):
+    """Atribuye al ámbito 'scope' las peticiones hechas dentro del bloque."""
+    token = current_scope.set(scope)
+    try:
+        yield
+    finally:
+        current_scope.reset(token)
+
+
+def template_endpoint(path):
+    """
+    Reemplaza los ids de una ruta por {id} para agrupar las métricas:
+    /bookings/bkg-123 -> /bookings/{id}, /airports/LIM -> /airports/{id}.
+    """
+    segments = path.rstrip("/").split("/")
+    templated = [
+        segment if index <= 1 or segment in STATIC_SEGMENTS else "{id}"
+        for index, segment in enumerate(segments)
+    ]
+    return "/".join(templated) or "/"
+
+
+# ======================
+# HISTOGRAMA
+# ======================
+class LogLinearHistogram:
+    """
+    Histograma log-lineal al estilo HDR: cada potencia de 2 se divide en
+    2**sub_bucket_bits sub-buckets lineales, así el error relativo de cualquier
+    percentil es menor a 1/2**sub_bucket_bits con memoria acotada. Valores enteros
+    (microsegundos); los buckets vacíos no ocupan espacio.
+    """
+
+    def __init__(self, sub_bucket_bits=5):
+        self.sub_bucket_bits = sub_bucket_bits
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    def _key(self, value):
+        shift = max(0, value.bit_length() - (self.sub_bucket_bits + 1))
+        return shift, value >> shift
+
+    @staticmethod
+    def _bucket_value(key):
+        # Punto medio del rango de valores que cubre el bucket
+        shift, top = key
+        return ((top << shift) + ((top + 1) << shift) - 1) // 2
+
+    def record(self, value):
+        value = max(0, int(value))
+        key = self._key(value)
+        self.buckets[key] = self.buckets.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def percentile(self, percentile):
+        if not self.count:
+            return None
+        target = max(1, -(-self.count * percentile // 100))
+        seen = 0
+        for key in sorted(self.buckets):
+            seen += self.buckets[key]
+            if seen >= target:
+                return min(max(self._bucket_value(key), self.min), self.max)
+        return self.max
+
+    def merge(self, other):
+        for key, count in other.buckets.items():
+            self.buckets[key] = self.buckets.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        for attr, pick in (("min", min), ("max", max)):
+            values = [v for v in (getattr(self, attr), getattr(other, attr)) if v is not None]
+            setattr(self, attr, pick(values) if values else None)
+
+    def export(self):
+        """Estado serializable (p. ej. para mandarlo de un worker de xdist al proceso principal)."""
+        return {
+            "sub_bucket_bits": self.sub_bucket_bits,
+            "buckets": [[shift, top, count] for (shift, top), count in self.buckets.items()],
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_export(cls, data):
+        histogram = cls(data["sub_bucket_bits"])
+        histogram.buckets = {(shift, top): count for shift, top, count in data["buckets"]}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
+
+    def summary_ms(self):
+        """Resumen en milisegundos: count, min, mean, max y p50/p95/p99."""
+        if not self.count:
+            return {"count": 0}
+        summary = {
+            "count": self.count,
+            "min": self.min / 1000,
+            "mean": round(self.total / self.count / 1000, 3),
+            "max": self.max / 1000,
+        }
+        for percentile in PERCENTILES:
+            summary[f"p{percentile}"] = self.percentile(percentile) / 1000
+        return summary
+
+
+# ======================
+# REGISTRO DE LLAMADAS
+# ======================
+class CallRecord:
+    """
+    Datos de una llamada de APIClient. Los tiempos están en segundos (None si no aplica).
+    'response' es la respuesta de requests (None si la llamada lanzó un error).
+    """
+
+    def __init__(self, method, url, status, bytes_sent, bytes_received, total,
+                 ttfb=None, dns=None, connect=None, tls=None, retries=0, error=None, scope=None, response=None):
+        self.method = method
+        self.url = url
+        self.endpoint = template_endpoint(urlsplit(url).path)
+        self.status = status
+        self.bytes_sent = bytes_sent
+        self.bytes_received = bytes_received
+        self.total = total
+        self.ttfb = ttfb
+        self.dns = dns
+        self.connect = connect
+        self.tls = tls
+        self.retries = retries
+        self.error = error
+        self.scope = scope
+        self.response = response
+
+    def __repr__(self):
+        return f"<CallRecord {self.method} {self.endpoint} -> {self.status or self.error} {self.total * 1000:.1f}ms>"
+
+
+def reset_connection_timings():
+    _connection_timings.value = None
+
+
+def pop_connection_timings():
+    """Retorna (y limpia) los tiempos de la conexión que abrió este hilo, si abrió una."""
+    timings = getattr(_connection_timings, "value", None)
+    _connection_timings.value = None
+    return timings or {}
+
+
+class _EndpointStats:
+    TIMINGS = ("total", "ttfb", "dns", "connect", "tls")
+
+    def __init__(self):
+        self.histograms = {name: LogLinearHistogram() for name in self.TIMINGS}
+        self.status = {}
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.retries = 0
+        self.errors = 0
+
+    def add(self, record):
+        for name in self.TIMINGS:
+            value = getattr(record, name)
+            if value is not None:
+                self.histograms[name].record(value * 1_000_000)
+        status = str(record.status) if record.status is not None else "error"
+        self.status[status] = self.status.get(status, 0) + 1
+        self.bytes_sent += record.bytes_sent or 0
+        self.bytes_received += record.bytes_received or 0
+        self.retries += record.retries or 0
+        if record.error is not None:
+            self.errors += 1
+
+    COUNTERS = ("bytes_sent", "bytes_received", "retries", "errors")
+
+    def export(self):
+        data = {name: getattr(self, name) for name in self.COUNTERS}
+        data.update(
+            histograms={name: histogram.export() for name, histogram in self.histograms.items()},
+            status=dict(self.status),
+        )
+        return data
+
+    def merge(self, data):
+        for name, histogram in data["histograms"].items():
+            self.histograms[name].merge(LogLinearHistogram.from_export(histogram))
+        for status, count in data["status"].items():
+            self.status[status] = self.status.get(status, 0) + count
+        for name in self.COUNTERS:
+            setattr(self, name, getattr(self, name) + data[name])
+
+    def to_dict(self):
+        data = {f"{name}_ms": histogram.summary_ms() for name, histogram in self.histograms.items()}
+        data.update(
+            calls=self.histograms["total"].count,
+            status=self.status,
+            bytes_sent=self.bytes_sent,
+            bytes_received=self.bytes_received,
+            retries=self.retries,
+            errors=self.errors,
+        )
+        return data
+
+
+class MetricsRecorder:
+    """Hook de APIClient que agrupa las llamadas por endpoint y por ámbito."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+        self.scopes = {}
+        self.started_at = time.time()
+
+    def __call__(self, record):
+        with self._lock:
+            key = f"{record.method} {record.endpoint}"
+            self.endpoints.setdefault(key, _EndpointStats()).add(record)
+            scope = self.scopes.setdefault(record.scope or "(sin ámbito)", {"calls": 0, "total_ms": 0.0})
+            scope["calls"] += 1
+            scope["total_ms"] += record.total * 1000
+
+    @property
+    def calls(self):
+        return sum(stats.histograms["total"].count for stats in self.endpoints.values())
+
+    def export(self):
+        """Estado serializable de todas las llamadas, para juntarlo en otro proceso con merge()."""
+        with self._lock:
+            return {
+                "endpoints": {key: stats.export() for key, stats in self.endpoints.items()},
+                "scopes": {name: dict(scope) for name, scope in self.scopes.items()},
+            }
+
+    def merge(self, data):
+        """Suma las llamadas exportadas por otro recorder (p. ej. las de un worker de xdist)."""
+        with self._lock:
+            for key, stats in data["endpoints"].items():
+                self.endpoints.setdefault(key, _EndpointStats()).merge(stats)
+            for name, scope in data["scopes"].items():
+                merged = self.scopes.setdefault(name, {"calls": 0, "total_ms": 0.0})
+                merged["calls"] += scope["calls"]
+                merged["total_ms"] += scope["total_ms"]
+
+    def to_dict(self, top_scopes=25):
+        with self._lock:
+            endpoints = {key: stats.to_dict() for key, stats in sorted(self.endpoints.items())}
+            total_us = sum(stats.histograms["total"].total for stats in self.endpoints.values())
+            scopes = sorted(self.scopes.items(), key=lambda item: item[1]["total_ms"], reverse=True)
+        return {
+            "generated_at": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+            "calls": sum(data["calls"] for data in endpoints.values()),
+            "total_ms": round(total_us / 1000, 3),
+            "endpoints": endpoints,
+            "slowest_scopes": [
+                {"scope": name, "calls": data["calls"], "total_ms": round(data["total_ms"], 3)}
+                for name, data in scopes[:top_scopes]
+            ],
+        }
+
+    def write_json(self, path, extra=None):
+        """
+        Escribe el resumen como JSON (de forma atómica) y retorna el dict escrito.
+        'extra' agrega secciones al nivel raíz (p. ej. el gasto en reintentos).
+        """
+        data = self.to_dict()
+        data.update(extra or {})
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(data, tmp_file, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+        return data
+
+    def to_html(self):
+        """Tabla HTML por endpoint (p50/p95/p99 del total) para el reporte de pytest-html."""
+        data = self.to_dict(top_scopes=10)
+        rows = "".join(
+            f"<tr><td>{html.escape(endpoint)}</td><td>{stats['calls']}</td>"
+            + "".join(f"<td>{stats['total_ms'].get(f'p{p}', '-')}</td>" for p in PERCENTILES)
+            + f"<td>{stats['ttfb_ms'].get('p95', '-')}</td><td>{stats['retries']}</td></tr>"
+            for endpoint, stats in sorted(
+                data["endpoints"].items(), key=lambda item: item[1]["total_ms"].get("p95", 0), reverse=True
+            )
+        )
+        scopes = "".join(
+            f"<tr><td>{html.escape(scope['scope'])}</td><td>{scope['calls']}</td><td>{scope['total_ms']:.0f}</td></tr>"
+            for scope in data["slowest_scopes"]
+        )
+        return (
+            f"<h2>Latencia de la API ({data['calls']} llamadas)</h2>"
+            "<table><tr><th>Endpoint</th><th>Llamadas</th><th>p50 ms</th><th>p95 ms</th>"
+            f"<th>p99 ms</th><th>TTFB p95 ms</th><th>Reintentos</th></tr>{rows}</table>"
+            "<h3>Tests y fixtures con más tiempo en la API</h3>"
+            f"<table><tr><th>Ámbito</th><th>Llamadas</th><th>Total ms</th></tr>{scopes}</table>"
+        )
+
+
+# ======================
+# CONEXIONES CRONOMETRADAS
+# ======================
+# Las conexiones cronometradas se apoyan en atributos privados de urllib3 2.x
+# (_new_conn y _dns_host). Si no existen se usan los pools normales, sin tiempos
+# de DNS/connect/TLS, en lugar de romper las peticiones.
+TIMED_CONNECTIONS_SUPPORTED = callable(getattr(HTTPConnection, "_new_conn", None))
+
+
+class TimedHTTPConnection(HTTPConnection):
+    """Conexión de urllib3 que mide DNS y connect TCP al abrirse."""
+
+    def _new_conn(self):
+        dns_host = getattr(self, "_dns_host", None)
+        if dns_host is None:
+            connect_started = time.perf_counter()
+            sock = super()._new_conn()
+            _connection_timings.value = {"dns": None, "connect": time.perf_counter() - connect_started, "tls": None}
+            return sock
+        dns = None
+        started = time.perf_counter()
+        try:
+            addresses = socket.getaddrinfo(dns_host, self.port, type=socket.SOCK_STREAM)
+            dns = time.perf_counter() - started
+        except OSError:
+            addresses = []
+        connect_started = time.perf_counter()
+        try:
+            if addresses:
+                # Conectar a la IP ya resuelta (el host sigue usándose para SNI/Host)
+                self._dns_host = addresses[0][4][0]
+            sock = super()._new_conn()
+        except NewConnectionError:
+            if not addresses or len(addresses) == 1:
+                raise
+            self._dns_host = dns_host
+            sock = super()._new_conn()
+        finally:
+            self._dns_host = dns_host
+        _connection_timings.value = {"dns": dns, "connect": time.perf_counter() - connect_started, "tls": None}
+        return sock
+
+
+class TimedHTTPSConnection(TimedHTTPConnection, HTTPSConnection):
+    """Igual que TimedHTTPConnection, y además mide el handshake TLS."""
+
+    def connect(self):
+        started = time.perf_counter()
+        super().connect()
+        timings = getattr(_connection_timings, "value", None)
+        if timings is not None:
+            tcp = (timings["dns"] or 0) + timings["connect"]
+            timings["tls"] = max(0.0, time.perf_counter() - started - tcp)
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter cuyos pools abren conexiones cronometradas (si urllib3 lo permite)."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if not TIMED_CONNECTIONS_SUPPORTED:
+            return
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
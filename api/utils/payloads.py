@@ -0,0 +1,183 @@
+"""
+Fábrica de payloads para los fixtures de api/conftest.py.
+
+En lugar de crear un Faker() por fixture (carga de providers en cada llamada)
+hay un solo generador sembrado que llena columnas (nombres, ciudades,
+pasaportes, precios, offsets de fecha...) por tandas de API_PAYLOAD_BATCH
+valores. Cada payload toma un valor de cada columna que necesita en O(1);
+cuando una columna se vacía se genera la tanda siguiente. Los campos que la
+API exige únicos (email, iata_code, tail_number) vienen de unique_keys.
+
+Las fechas se guardan como offsets en segundos y se convierten al armar el
+payload, así un vuelo generado al inicio de la sesión sigue siendo futuro.
+El tiempo de generación queda en stats() para reportarlo aparte.
+"""
+import datetime
+import string
+import threading
+import time
+from collections import deque
+
+from faker import Faker
+
+from api.utils import settings, unique_keys
+
+
+def _seat(fake, rng, count):
+    letters = rng.choices(string.ascii_uppercase, k=count)
+    digits = rng.choices(string.digits, k=count)
+    return [letter + digit for letter, digit in zip(letters, digits)]
+
+
+# Columna -> función que genera una tanda de 'count' valores con (faker, random)
+COLUMNS = {
+    "name": lambda fake, rng, count: [fake.name() for _ in range(count)],
+    "password": lambda fake, rng, count: [fake.password(length=7) for _ in range(count)],
+    "city": lambda fake, rng, count: [fake.city() for _ in range(count)],
+    "country": lambda fake, rng, count: [fake.country() for _ in range(count)],
+    "model": lambda fake, rng, count: [fake.word() for _ in range(count)],
+    "passport": lambda fake, rng, count: [fake.passport_number() for _ in range(count)],
+    "payment_method": lambda fake, rng, count: [fake.credit_card_provider() for _ in range(count)],
+    "seat": _seat,
+    "capacity": lambda fake, rng, count: [rng.randint(10, 300) for _ in range(count)],
+    "price": lambda fake, rng, count: [rng.randint(50, 500) for _ in range(count)],
+    "amount": lambda fake, rng, count: [round(rng.uniform(1, 999.99), 2) for _ in range(count)],
+    # Salida entre ahora y +1 día; llegada entre 30 minutos y 1 día después de la salida
+    "departure_offset": lambda fake, rng, count: [rng.randint(60, 86400) for _ in range(count)],
+    "flight_duration": lambda fake, rng, count: [rng.randint(1800, 86400) for _ in range(count)],
+}
+
+
+class PayloadFactory:
+    """
+    Pools columnares de datos de prueba generados por tandas desde un Faker sembrado.
+    Es thread-safe: el almacén de recursos arma payloads desde hilos de recarga.
+    """
+
+    def __init__(self, seed=None, batch_size=None):
+        self.seed = seed
+        self.batch_size = batch_size or settings.API_PAYLOAD_BATCH
+        self.fake = Faker()
+        self.fake.seed_instance(seed)
+        self.random = self.fake.random
+        self._columns = {name: deque() for name in COLUMNS}
+        self._stats = {name: {"batches": 0, "generated": 0, "taken": 0, "seconds": 0.0} for name in COLUMNS}
+        self._lock = threading.Lock()
+
+    def _generate(self, column):
+        started = time.perf_counter()
+        values = COLUMNS[column](self.fake, self.random, self.batch_size)
+        stats = self._stats[column]
+        stats["seconds"] += time.perf_counter() - started
+        stats["batches"] += 1
+        stats["generated"] += len(values)
+        self._columns[column].extend(values)
+
+    def fill(self):
+        """Genera la primera tanda de todas las columnas (al iniciar la sesión)."""
+        with self._lock:
+            for column, values in self._columns.items():
+                if not values:
+                    self._generate(column)
+        return self
+
+    def take(self, column):
+        """Siguiente valor de la columna, generando otra tanda si se vació."""
+        with self._lock:
+            values = self._columns[column]
+            if not values:
+                self._generate(column)
+            self._stats[column]["taken"] += 1
+            return values.popleft()
+
+    def stats(self):
+        """{"columns": {columna: {...}}, "generated", "taken", "ms"} para el reporte."""
+        columns = {}
+        with self._lock:
+            for name, stats in self._stats.items():
+                column = dict(stats)
+                column["ms"] = round(column.pop("seconds") * 1000, 2)
+                columns[name] = column
+        return {
+            "seed": str(self.seed),
+            "batch_size": self.batch_size,
+            "generated": sum(stats["generated"] for stats in columns.values()),
+            "taken": sum(stats["taken"] for stats in columns.values()),
+            "ms": round(sum(stats["ms"] for stats in columns.values()), 2),
+            "columns": columns,
+        }
+
+    # ---------- Payloads ----------
+    def signup(self, prefix="user"):
+        return {
+            "email": unique_keys.email(prefix),
+            "password": self.take("password"),
+            "full_name": self.take("name"),
+        }
+
+    def admin_signup(self):
+        return dict(self.signup("admin"), role="admin")
+
+    def airport(self):
+        return {
+            "iata_code": unique_keys.iata_code(),
+            "city": self.take("city"),
+            "country": self.take("country"),
+        }
+
+    def aircraft(self):
+        return {
+            "tail_number": unique_keys.tail_number(),
+            "model": self.take("model"),
+            "capacity": self.take("capacity"),
+        }
+
+    def flight(self, origin, destination, aircraft_id):
+        now = datetime.datetime.now(datetime.timezone.utc)
+        departure_time = now + datetime.timedelta(seconds=self.take("departure_offset"))
+        arrival_time = departure_time + datetime.timedelta(seconds=self.take("flight_duration"))
+        return {
+            "origin": origin,
+            "destination": destination,
+            "departure_time": departure_time.isoformat(),
+            "arrival_time": arrival_time.isoformat(),
+            "base_price": self.take("price"),
+            "aircraft_id": aircraft_id,
+        }
+
+    def passenger(self):
+        return {
+            "full_name": self.take("name"),
+            "passport": self.take("passport"),
+            "seat": self.take("seat"),
+        }
+
+    def booking(self, flight_id):
+        return {"flight_id": flight_id, "passengers": [self.passenger()]}
+
+    def payment(self, booking_id):
+        return {
+            "booking_id": booking_id,
+            "amount": self.take("amount"),
+            "payment_method": self.take("payment_method"),
+        }
+
+
+def merge_stats(all_stats):
+    """Suma varios PayloadFactory.stats() (p. ej. los de cada worker de xdist)."""
+    columns = {}
+    for stats in all_stats:
+        for name, column in stats["columns"].items():
+            totals = columns.setdefault(name, dict.fromkeys(column, 0))
+            for key, value in column.items():
+                totals[key] += value
+    for column in columns.values():
+        column["ms"] = round(column["ms"], 2)
+    return {
+        "seed": all_stats[0]["seed"],
+        "batch_size": all_stats[0]["batch_size"],
+        "generated": sum(stats["generated"] for stats in all_stats),
+        "taken": sum(stats["taken"] for stats in all_stats),
+        "ms": round(sum(stats["ms"] for stats in all_stats), 2),
+        "columns": columns,
+    }
@@ -0,0 +1,295 @@
+"""
+Reintentos centralizados para APIClient y los fixtures.
+
+- Backoff "decorrelated jitter": cada espera es aleatoria entre la base y el
+  triple de la espera anterior (con tope), así varios hilos que fallan a la
+  vez no reintentan sincronizados.
+- Presupuesto global de reintentos (RetryBudget): empieza con una reserva y
+  cada petición original deposita una fracción de reintento; si se agota, las
+  fallas se devuelven sin reintentar. Una caída del servidor no puede costar
+  más que un porcentaje de la corrida.
+- Circuit breaker por endpoint (método + ruta con plantilla): tras varias
+  fallas de servidor seguidas (5xx o errores de conexión) se abre y las
+  peticiones fallan al instante con CircuitOpenError hasta que pasa el tiempo
+  de enfriamiento y una petición de prueba sale bien.
+
+Todo lo que se gasta (reintentos, segundos de espera, presupuesto negado,
+circuitos abiertos) queda en RetryEngine.stats() para el reporte final.
+"""
+import random
+import threading
+import time
+
+from requests.exceptions import ConnectionError, Timeout
+
+from api.utils import settings
+
+# Métodos y status que APIClient reintenta (PATCH no: la API no es idempotente ahí)
+RETRY_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+RETRY_STATUSES = frozenset({500, 502, 503, 504})
+TRANSPORT_ERRORS = (ConnectionError, Timeout)
+
+
+class CircuitOpenError(ConnectionError):
+    """El circuito del endpoint está abierto: la petición no se envía."""
+
+
+class RetryExhaustedError(Exception):
+    """Una operación de reintento genérica (RetryEngine.retry) no tuvo éxito."""
+
+    def __init__(self, message, attempts, outcome=None):
+        super().__init__(message)
+        self.attempts = attempts
+        self.outcome = outcome
+
+
+class DecorrelatedJitter:
+    """Generador de esperas con decorrelated jitter (base, tope en segundos)."""
+
+    def __init__(self, base, cap):
+        self.base = base
+        self.cap = cap
+        self._previous = base
+
+    def next(self):
+        if self.cap <= 0:
+            return 0.0
+        delay = min(self.cap, random.uniform(self.base, self._previous * 3))
+        self._previous = delay
+        return delay
+
+
+class RetryBudget:
+    """
+    Presupuesto de reintentos compartido: 'reserve' reintentos disponibles al
+    inicio y cada petición original recupera 'ratio' (sin pasar de la reserva).
+    """
+
+    def __init__(self, ratio, reserve):
+        self.ratio = ratio
+        self.reserve = reserve
+        self._tokens = float(reserve)
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.reserve, self._tokens + self.ratio)
+
+    def try_spend(self):
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    @property
+    def tokens(self):
+        return self._tokens
+
+
+class CircuitBreaker:
+    """Breaker de un endpoint: closed -> open (tras 'threshold' fallas) -> half-open -> closed."""
+
+    CLOSED, OPEN, HALF_OPEN = "closed", "open", "half-open"
+
+    def __init__(self, threshold, reset_timeout):
+        self.threshold = threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.times_opened = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """Indica si se puede enviar una petición (en half-open solo pasa una de prueba)."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.reset_timeout:
+                self.state = self.HALF_OPEN
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failures >= self.threshold):
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+                self.times_opened += 1
+
+
+class RetryEngine:
+    def __init__(self, base_delay, max_delay, budget_ratio, budget_reserve,
+                 breaker_threshold, breaker_reset_timeout, sleep=time.sleep):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = RetryBudget(budget_ratio, budget_reserve)
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_timeout = breaker_reset_timeout
+        self.sleep = sleep
+        self._breakers = {}
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def configure(self, **options):
+        """Cambia parámetros en caliente (p. ej. sin esperas contra la API falsa o en replay)."""
+        for name, value in options.items():
+            if name in ("budget_ratio", "budget_reserve"):
+                setattr(self.budget, name.split("_", 1)[1], value)
+            else:
+                setattr(self, name, value)
+
+    # ---------- Estado por endpoint ----------
+    def breaker(self, key):
+        with self._lock:
+            if key not in self._breakers:
+                self._breakers[key] = CircuitBreaker(self.breaker_threshold, self.breaker_reset_timeout)
+            return self._breakers[key]
+
+    def _count(self, key, name, amount=1):
+        with self._lock:
+            stats = self._stats.setdefault(
+                key, {"calls": 0, "retries": 0, "wait_seconds": 0.0, "budget_denied": 0, "short_circuited": 0}
+            )
+            stats[name] += amount
+
+    def _wait(self, key, backoff):
+        """Consume presupuesto y espera antes de un reintento. Retorna False si no hay presupuesto."""
+        if not self.budget.try_spend():
+            self._count(key, "budget_denied")
+            print(f"⚠️ Presupuesto de reintentos agotado: {key} no se reintenta")
+            return False
+        delay = backoff.next()
+        self._count(key, "retries")
+        self._count(key, "wait_seconds", delay)
+        if delay:
+            self.sleep(delay)
+        return True
+
+    # ---------- Peticiones HTTP ----------
+    def call(self, key, send, method, attempts):
+        """
+        Envía una petición con 'send()' aplicando breaker, reintentos y presupuesto.
+        Retorna (response, intentos). Si se acaban los intentos se retorna la última
+        respuesta (o se relanza el último error de conexión), como haría requests.
+        El breaker cuenta llamadas que fallaron aun después de reintentar, no intentos
+        sueltos: un endpoint con un 500 conocido no bloquea al resto de los tests.
+        """
+        breaker = self.breaker(key)
+        if not breaker.allow():
+            self._count(key, "short_circuited")
+            raise CircuitOpenError(
+                f"Circuito abierto para {key}: {breaker.failures} llamadas seguidas fallaron"
+            )
+        backoff = DecorrelatedJitter(self.base_delay, self.max_delay)
+        retryable_method = method.upper() in RETRY_METHODS
+        self._count(key, "calls")
+        self.budget.deposit()
+
+        attempt = 0
+        while True:
+            attempt += 1
+            error = response = None
+            try:
+                response = send()
+            except TRANSPORT_ERRORS as err:
+                error = err
+            except BaseException:
+                # Cualquier otro error (CassetteMissError, InvalidURL...) también cuenta como
+                # falla: si no, un breaker en half-open esperaría su petición de prueba para siempre
+                breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRY_STATUSES:
+                    breaker.record_success()
+                    return response, attempt
+
+            # Sin reintentos si el método no es idempotente, si otro hilo ya abrió el
+            # circuito o si se acabaron los intentos o el presupuesto
+            if (
+                not retryable_method
+                or attempt >= attempts
+                or breaker.state == CircuitBreaker.OPEN
+                or not self._wait(key, backoff)
+            ):
+                breaker.record_failure()
+                if error is not None:
+                    raise error
+                return response, attempt
+            reason = type(error).__name__ if error is not None else response.status_code
+            print(f"⚠️ {key} falló ({reason}). Reintentando... ({attempt}/{attempts})")
+
+    # ---------- Operaciones genéricas ----------
+    def retry(self, key, operation, should_retry, attempts=5):
+        """
+        Ejecuta 'operation(intento)' hasta que 'should_retry(resultado)' sea falso.
+        Sirve para reintentos de aplicación (p. ej. regenerar un email que ya existe).
+        Lanza RetryExhaustedError con el último resultado si no lo logra.
+        """
+        backoff = DecorrelatedJitter(self.base_delay, self.max_delay)
+        self._count(key, "calls")
+        self.budget.deposit()
+        for attempt in range(1, attempts + 1):
+            outcome = operation(attempt)
+            if not should_retry(outcome):
+                return outcome
+            if attempt >= attempts or not self._wait(key, backoff):
+                raise RetryExhaustedError(f"{key} falló después de {attempt} intentos", attempt, outcome)
+            print(f"⚠️ {key} falló. Reintentando... ({attempt}/{attempts})")
+
+    # ---------- Reporte ----------
+    def stats(self):
+        """Resumen de lo gastado en reintentos: totales y detalle por endpoint/operación."""
+        with self._lock:
+            per_key = {key: dict(values) for key, values in self._stats.items()}
+            open_circuits = {
+                key: breaker.times_opened for key, breaker in self._breakers.items() if breaker.times_opened
+            }
+        return {
+            "retries": sum(values["retries"] for values in per_key.values()),
+            "wait_seconds": round(sum(values["wait_seconds"] for values in per_key.values()), 3),
+            "budget_denied": sum(values["budget_denied"] for values in per_key.values()),
+            "short_circuited": sum(values["short_circuited"] for values in per_key.values()),
+            "budget_tokens_left": round(self.budget.tokens, 2),
+            "circuits_opened": open_circuits,
+            "by_key": {key: values for key, values in sorted(per_key.items()) if values["retries"]
+                       or values["budget_denied"] or values["short_circuited"]},
+        }
+
+
+def merge_stats(all_stats):
+    """Suma varios RetryEngine.stats() (p. ej. el del proceso principal y el de cada worker de xdist)."""
+    merged = {
+        "retries": 0, "wait_seconds": 0.0, "budget_denied": 0, "short_circuited": 0,
+        "budget_tokens_left": 0.0, "circuits_opened": {}, "by_key": {},
+    }
+    for stats in all_stats:
+        for name in ("retries", "wait_seconds", "budget_denied", "short_circuited", "budget_tokens_left"):
+            merged[name] += stats[name]
+        for key, times in stats["circuits_opened"].items():
+            merged["circuits_opened"][key] = merged["circuits_opened"].get(key, 0) + times
+        for key, values in stats["by_key"].items():
+            totals = merged["by_key"].setdefault(key, dict.fromkeys(values, 0))
+            for name, value in values.items():
+                totals[name] = totals.get(name, 0) + value
+    merged["wait_seconds"] = round(merged["wait_seconds"], 3)
+    merged["budget_tokens_left"] = round(merged["budget_tokens_left"], 2)
+    merged["by_key"] = dict(sorted(merged["by_key"].items()))
+    return merged
+
+
+engine = RetryEngine(
+    base_delay=settings.API_RETRY_BASE_DELAY,
+    max_delay=settings.API_RETRY_MAX_DELAY,
+    budget_ratio=settings.API_RETRY_BUDGET_RATIO,
+    budget_reserve=settings.API_RETRY_BUDGET_RESERVE,
+    breaker_threshold=settings.API_BREAKER_THRESHOLD,
+    breaker_reset_timeout=settings.API_BREAKER_RESET_SECONDS,
+)
@@ -0,0 +1,127 @@
+import threading
+from collections import deque
+
+
+class ResourcePool:
+    """
+    Pool en memoria de recursos pre-creados en la API (aeropuertos, aeronaves,
+    vuelos, reservas...).
+
+    'factory(n)' debe crear n recursos (idealmente en paralelo) y retornarlos en
+    una lista. Cada checkout entrega un recurso nuevo en O(1) y nunca lo devuelve
+    al pool, así los tests pueden modificarlo o eliminarlo sin afectar a otros.
+    Cuando quedan menos de 'low_watermark' recursos se lanza una recarga en
+    segundo plano; si el pool se vacía, el checkout espera a la recarga.
+    Con background=False solo se recarga de forma síncrona al vaciarse
+    (orden de peticiones determinista, p. ej. al grabar/reproducir cassettes).
+    close() deja de lanzar recargas y espera la que esté en curso.
+    """
+
+    def __init__(self, name, factory, size=10, low_watermark=None, background=True):
+        self.name = name
+        self.factory = factory
+        self.size = size
+        self.low_watermark = low_watermark if low_watermark is not None else max(1, size // 3)
+        self.background = background
+        self.created = 0
+        self.checkouts = 0
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._refill_thread = None
+        self._closed = False
+
+    def __len__(self):
+        return len(self._items)
+
+    def refill(self, count=None):
+        """Crea 'count' recursos (por defecto 'size') y los agrega al pool."""
+        items = self.factory(count or self.size)
+        with self._lock:
+            self._items.extend(items)
+            self.created += len(items)
+
+    def _background_refill(self):
+        try:
+            self.refill()
+        except Exception as err:
+            # El checkout volverá a intentarlo de forma síncrona si el pool se vacía
+            print(f"⚠️ No se pudo recargar el pool '{self.name}' en segundo plano: {err}")
+
+    def _start_background_refill(self):
+        with self._lock:
+            if self._closed or (self._refill_thread is not None and self._refill_thread.is_alive()):
+                return
+            self._refill_thread = threading.Thread(
+                target=self._background_refill, name=f"pool-{self.name}", daemon=True
+            )
+            self._refill_thread.start()
+
+    def _pop(self):
+        with self._lock:
+            if not self._items:
+                return None, 0
+            item = self._items.popleft()
+            self.checkouts += 1
+            return item, len(self._items)
+
+    def checkout(self):
+        """Retorna un recurso nuevo del pool, recargándolo si hace falta."""
+        item, remaining = self._pop()
+        if item is None:
+            refill_thread = self._refill_thread
+            if refill_thread is not None and refill_thread.is_alive():
+                refill_thread.join()
+                item, remaining = self._pop()
+            if item is None:
+                self.refill()
+                item, remaining = self._pop()
+
+        if self.background and remaining < self.low_watermark:
+            self._start_background_refill()
+        return item
+
+    def close(self, timeout=None):
+        """No lanza más recargas en segundo plano y espera a que termine la que esté en curso."""
+        with self._lock:
+            self._closed = True
+            refill_thread = self._refill_thread
+        if refill_thread is not None:
+            refill_thread.join(timeout)
+
+
+class ResourceWarehouse:
+    """
+    Conjunto de ResourcePool por entidad. Se crea una vez por sesión y los
+    fixtures de función hacen checkout de la entidad que necesitan.
+    """
+
+    def __init__(self, background=True):
+        self.pools = {}
+        self.background = background
+
+    def add_pool(self, name, factory, size=10, low_watermark=None):
+        self.pools[name] = ResourcePool(
+            name, factory, size=size, low_watermark=low_watermark, background=self.background
+        )
+        return self.pools[name]
+
+    def checkout(self, name):
+        return self.pools[name].checkout()
+
+    def close(self, timeout=None):
+        """
+        Cierra todos los pools: primero ninguno lanza recargas nuevas (la recarga
+        de un pool puede hacer checkout de otro) y después se espera cada una.
+        """
+        for pool in self.pools.values():
+            with pool._lock:
+                pool._closed = True
+        for pool in self.pools.values():
+            pool.close(timeout)
+
+    def stats(self):
+        """Retorna cuántos recursos se crearon y cuántos se usaron por pool."""
+        return {
+            name: {"created": pool.created, "checked_out": pool.checkouts, "available": len(pool)}
+            for name, pool in self.pools.items()
+        }
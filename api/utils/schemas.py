@@ -0,0 +1,194 @@
+"""
+Schemas de las respuestas de la Airline API, compilados a validadores.
+
+Cada entidad (User, Token, Airport, Aircraft, Flight, Booking, Payment) se
+declara una vez en SCHEMAS con reglas del mismo estilo que las de fake_api
+({"type": "str", "pattern": ...}). Al importar el módulo cada schema se
+convierte en código Python especializado (un if por regla, sin recorrer el
+schema en cada llamada) y se compila dos veces: para un objeto y para una
+lista, con el loop dentro de la función generada, así una página completa se
+valida en una sola pasada.
+
+Los campos que no están en el schema se ignoran: la API puede agregar campos
+sin romper los tests.
+
+    schemas.assert_schema("User", response.json(), many=True)
+"""
+import datetime
+import re
+
+IATA = {"type": "str", "pattern": r"^[A-Z]{3}$"}
+
+SCHEMAS = {
+    "User": {
+        "id": {"type": "str", "min_length": 1},
+        "email": {"type": "email"},
+        "full_name": {"type": "str"},
+        "role": {"type": "enum", "choices": ["passenger", "admin"]},
+    },
+    "Token": {
+        "access_token": {"type": "str", "min_length": 1},
+        "token_type": {"type": "enum", "choices": ["bearer"]},
+    },
+    "Airport": {
+        "iata_code": IATA,
+        "city": {"type": "str"},
+        "country": {"type": "str"},
+    },
+    "Aircraft": {
+        "id": {"type": "str", "min_length": 1},
+        "tail_number": {"type": "str", "min_length": 5, "max_length": 10},
+        "model": {"type": "str"},
+        "capacity": {"type": "int", "ge": 0},
+    },
+    "Flight": {
+        "id": {"type": "str", "min_length": 1},
+        "origin": IATA,
+        "destination": IATA,
+        "departure_time": {"type": "datetime"},
+        "arrival_time": {"type": "datetime"},
+        "base_price": {"type": "number", "ge": 0},
+        "aircraft_id": {"type": "str"},
+        "available_seats": {"type": "int", "ge": 0, "optional": True},
+    },
+    "Passenger": {
+        "full_name": {"type": "str"},
+        "passport": {"type": "str"},
+        "seat": {"type": "str"},
+    },
+    "Booking": {
+        "id": {"type": "str", "min_length": 1},
+        "flight_id": {"type": "str"},
+        "user_id": {"type": "str"},
+        "status": {"type": "enum", "choices": ["draft", "ready", "confirmed", "cancelled"]},
+        "passengers": {"type": "list", "items": "Passenger"},
+    },
+    "Payment": {
+        "id": {"type": "str", "min_length": 1},
+        "booking_id": {"type": "str"},
+        "amount": {"type": "number", "gt": 0},
+        "payment_method": {"type": "str"},
+        "status": {"type": "str"},
+    },
+}
+
+
+def _is_datetime(value):
+    try:
+        datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return False
+    return True
+
+
+# ---------- Generación de código ----------
+def _field_checks(schema_name, name, rule, path, constants):
+    """Líneas (sin indentar) que validan el valor 'v' del campo 'name' según 'rule'."""
+    where = f"{path} + {'.' + name + ': '!r}"
+    rule_type = rule["type"]
+    checks = []  # (condición de error, mensaje)
+
+    if rule_type in ("str", "email", "datetime"):
+        checks.append(("type(v) is not str", "se esperaba string"))
+        if "min_length" in rule:
+            checks.append((f"len(v) < {rule['min_length']}", f"largo menor a {rule['min_length']}"))
+        if "max_length" in rule:
+            checks.append((f"len(v) > {rule['max_length']}", f"largo mayor a {rule['max_length']}"))
+        if "pattern" in rule:
+            constant = f"_{schema_name}_{name}_pattern"
+            constants[constant] = re.compile(rule["pattern"]).match
+            checks.append((f"{constant}(v) is None", f"no cumple el patrón {rule['pattern']}"))
+        if rule_type == "email":
+            checks.append(("'@' not in v or '.' not in v.rpartition('@')[2]", "no es un email válido"))
+        if rule_type == "datetime":
+            checks.append(("not _is_datetime(v)", "no es una fecha ISO 8601"))
+    elif rule_type in ("int", "number"):
+        allowed = "(int,)" if rule_type == "int" else "(int, float)"
+        checks.append((f"type(v) not in {allowed}", f"se esperaba {rule_type}"))
+        if "ge" in rule:
+            checks.append((f"v < {rule['ge']!r}", f"debe ser >= {rule['ge']}"))
+        if "gt" in rule:
+            checks.append((f"v <= {rule['gt']!r}", f"debe ser > {rule['gt']}"))
+    elif rule_type == "enum":
+        constant = f"_{schema_name}_{name}_choices"
+        constants[constant] = frozenset(rule["choices"])
+        checks.append((f"v not in {constant}", f"debe ser uno de {rule['choices']}"))
+    elif rule_type == "list":
+        checks.append(("type(v) is not list", "se esperaba una lista"))
+    else:
+        raise ValueError(f"❌ Tipo de regla desconocido en el schema: {rule_type}")
+
+    lines = [f"v = data.get({name!r}, _MISSING)"]
+    if rule.get("optional"):
+        lines += ["if v is _MISSING:", "    pass"]
+    else:
+        lines += ["if v is _MISSING:", f"    append({where} + 'falta el campo')"]
+    if rule.get("nullable"):
+        lines += ["elif v is None:", "    pass"]
+    for condition, message in checks:
+        lines += [f"elif {condition}:", f"    append({where} + {message + ': '!r} + repr(v))"]
+    if rule_type == "list":
+        # Cada elemento se valida con el validador compilado del schema de 'items'
+        item_path = f"{path} + {'.' + name + '['!r} + str(j) + ']'"
+        lines += ["else:", "    for j, item in enumerate(v):",
+                  f"        _check_{rule['items']}(item, errors, {item_path})"]
+    return lines
+
+
+def _object_body(schema_name, schema, path, constants):
+    lines = ["if type(data) is not dict:",
+             f"    append({path} + ': se esperaba un objeto, llegó ' + type(data).__name__)"]
+    body = []
+    for name, rule in schema.items():
+        body += _field_checks(schema_name, name, rule, path, constants)
+    return lines + ["else:"] + ["    " + line for line in body]
+
+
+def _compile(name, schema, namespace):
+    """Genera y compila _check_<name> (un objeto) y _check_<name>_list (una lista)."""
+    constants = {}
+    one = _object_body(name, schema, "path", constants)
+    many = _object_body(name, schema, "path + '[' + str(i) + ']'", constants)
+    source = "\n".join(
+        [f"def _check_{name}(data, errors, path):", "    append = errors.append"]
+        + ["    " + line for line in one]
+        + ["", "", f"def _check_{name}_list(items, errors, path):", "    append = errors.append",
+           "    if type(items) is not list:",
+           "        append(path + ': se esperaba una lista, llegó ' + type(items).__name__)",
+           "        return",
+           "    for i, data in enumerate(items):"]
+        + ["        " + line for line in many]
+    )
+    namespace.update(constants)
+    exec(compile(source, f"<schema {name}>", "exec"), namespace)
+    return source
+
+
+_MISSING = object()
+_NAMESPACE = {"_MISSING": _MISSING, "_is_datetime": _is_datetime}
+SOURCES = {name: _compile(name, schema, _NAMESPACE) for name, schema in SCHEMAS.items()}
+VALIDATORS = {
+    name: (_NAMESPACE[f"_check_{name}"], _NAMESPACE[f"_check_{name}_list"]) for name in SCHEMAS
+}
+
+
+# ---------- Uso desde los tests ----------
+def validate(name, data, many=False) -> list:
+    """
+    Valida 'data' (un objeto, o una lista de objetos con many=True) contra el
+    schema 'name' y retorna la lista de errores (vacía si cumple).
+    """
+    if name not in VALIDATORS:
+        raise KeyError(f"❌ Schema desconocido: {name} (opciones: {', '.join(SCHEMAS)})")
+    errors = []
+    VALIDATORS[name][1 if many else 0](data, errors, name)
+    return errors
+
+
+def assert_schema(name, data, many=False):
+    """Falla el test con los primeros errores si 'data' no cumple el schema 'name'."""
+    errors = validate(name, data, many=many)
+    if errors:
+        shown = "\n  ".join(errors[:10])
+        more = f"\n  ... y {len(errors) - 10} más" if len(errors) > 10 else ""
+        raise AssertionError(f"❌ La respuesta no cumple el schema {name}:\n  {shown}{more}")
@@ -0,0 +1,114 @@
+import threading
+
+import requests
+
+from api.utils import cassettes, fake_api, metrics, settings
+
+# Registro de adaptadores compartidos: un juego de adaptadores (con su pool de
+# conexiones de urllib3) por base_url. Cada APIClient tiene su propia
+# requests.Session, con su propio cookie jar, pero monta estos adaptadores: los
+# clientes que solo se diferencian por el token reutilizan las mismas conexiones
+# keep-alive en vez de pagar un handshake TCP+TLS nuevo cada vez, sin mezclar
+# las cookies de una identidad con las de otra.
+_adapters = {}
+_lock = threading.Lock()
+
+
+def _build_adapters(base_url):
+    session = requests.Session()
+
+    if base_url and base_url.startswith(settings.FAKE_API_BASE_URL):
+        # API falsa en memoria: sin red, así que tampoco hay pool
+        session.mount(settings.FAKE_API_BASE_URL, fake_api.FakeAirlineAdapter())
+    else:
+        # Adaptador con conexiones cronometradas (DNS/connect/TLS, ver api/utils/metrics.py).
+        # Sin reintentos de urllib3: los hace APIClient con api/utils/resilience.py.
+        # pool_block hace respetar API_POOL_MAXSIZE: con el pool lleno se espera una conexión libre
+        adapter = metrics.TimedHTTPAdapter(
+            max_retries=0,
+            pool_connections=settings.API_POOL_CONNECTIONS,
+            pool_maxsize=settings.API_POOL_MAXSIZE,
+            pool_block=True,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+
+    # En modo --api-record / --api-replay se envuelven los adaptadores
+    return dict(cassettes.install(session).adapters)
+
+
+def get_session(base_url):
+    """
+    Retorna una requests.Session nueva para 'base_url' que usa los adaptadores
+    (y el pool de conexiones) compartidos del host, creándolos la primera vez.
+    """
+    with _lock:
+        adapters = _adapters.get(base_url)
+        if adapters is None:
+            adapters = _adapters[base_url] = _build_adapters(base_url)
+    session = requests.Session()
+    session.adapters.clear()
+    for prefix, adapter in adapters.items():
+        session.mount(prefix, adapter)
+    return session
+
+
+def _connection_pools(adapters):
+    """Devuelve los pools de urllib3 (uno por host) abiertos por los adaptadores."""
+    pools = []
+    for adapter in set(adapters):
+        pool_manager = getattr(adapter, "poolmanager", None)
+        if pool_manager is None:
+            continue
+        for key in list(pool_manager.pools.keys()):
+            pool = pool_manager.pools.get(key)
+            if pool is not None:
+                pools.append(pool)
+    return pools
+
+
+def pool_stats():
+    """
+    Retorna las estadísticas de reutilización de conexiones de todos los hosts:
+    peticiones enviadas, conexiones abiertas y porcentaje de reutilización.
+    """
+    total_requests = 0
+    total_connections = 0
+    with _lock:
+        hosts = list(_adapters.values())
+    for adapters in hosts:
+        for pool in _connection_pools(adapters.values()):
+            total_requests += pool.num_requests
+            total_connections += pool.num_connections
+
+    return _summary(len(hosts), total_requests, total_connections)
+
+
+def merge_pool_stats(all_stats):
+    """Suma varios pool_stats() (p. ej. el del proceso principal y el de cada worker de xdist)."""
+    return _summary(
+        sum(stats["sessions"] for stats in all_stats),
+        sum(stats["requests"] for stats in all_stats),
+        sum(stats["connections"] for stats in all_stats),
+    )
+
+
+def _summary(sessions, total_requests, total_connections):
+    reused = max(total_requests - total_connections, 0)
+    reuse_rate = (reused / total_requests) if total_requests else 0.0
+    return {
+        "sessions": sessions,
+        "requests": total_requests,
+        "connections": total_connections,
+        "handshakes_saved": reused,
+        "reuse_rate": reuse_rate,
+    }
+
+
+def close_all():
+    """Cierra todos los adaptadores compartidos (y sus conexiones) y vacía el registro."""
+    with _lock:
+        hosts = list(_adapters.values())
+        _adapters.clear()
+    for adapter in {adapter for adapters in hosts for adapter in adapters.values()}:
+        adapter.close()
@@ -1,4 +1,5 @@
 from dotenv import load_dotenv, find_dotenv
+from pathlib import Path
 import os
 
 load_dotenv(find_dotenv())
@@ -7,4 +8,68 @@ API_BASE_URL = os.environ.get("API_BASE_URL")
 ADMIN_EMAIL = os.environ.get("ADMIN_EMAIL")
 ADMIN_PASSWORD = os.environ.get("ADMIN_PASSWORD")
 ADMIN_ROLE = os.environ.get("ADMIN_ROLE")
-ADMIN_FULL_NAME = os.environ.get("ADMIN_FULL_NAME")
\ No newline at end of file
+ADMIN_FULL_NAME = os.environ.get("ADMIN_FULL_NAME")
+
+# API falsa en memoria (api/utils/fake_api.py): API_BASE_URL=fake corre la suite sin red.
+# Se traduce a un host .invalid (nunca resuelve) sobre el que se monta el adaptador falso.
+# Si no hay credenciales de admin en el .env se usan las del admin sembrado.
+FAKE_API_BASE_URL = "http://fake-airline.invalid"
+if API_BASE_URL == "fake":
+    API_BASE_URL = FAKE_API_BASE_URL
+if API_BASE_URL == FAKE_API_BASE_URL:
+    ADMIN_EMAIL = ADMIN_EMAIL or "admin@airline.test"
+    ADMIN_PASSWORD = ADMIN_PASSWORD or "admin123"
+    ADMIN_ROLE = ADMIN_ROLE or "admin"
+    ADMIN_FULL_NAME = ADMIN_FULL_NAME or "QA Admin"
+
+# Pool de conexiones compartido por todos los APIClient (ver api/utils/session_pool.py)
+API_POOL_CONNECTIONS = int(os.environ.get("API_POOL_CONNECTIONS", "4"))
+API_POOL_MAXSIZE = int(os.environ.get("API_POOL_MAXSIZE", "20"))
+
+# Cantidad de vuelos y reservas que se pre-crean por tanda en el almacén de recursos
+API_WAREHOUSE_SIZE = int(os.environ.get("API_WAREHOUSE_SIZE", "10"))
+
+# Tamaño de página por defecto de APIClient.iter_pages
+API_PAGE_SIZE = int(os.environ.get("API_PAGE_SIZE", "100"))
+
+# Fábrica de payloads (ver api/utils/payloads.py): valores por tanda de cada columna y
+# semilla del generador (vacía: el id de la corrida, o la semilla de las cassettes)
+API_PAYLOAD_BATCH = int(os.environ.get("API_PAYLOAD_BATCH", "256"))
+API_PAYLOAD_SEED = os.environ.get("API_PAYLOAD_SEED", "")
+
+# Caché en disco de tokens y usuarios de prueba (vacío para desactivarlo)
+API_TOKEN_CACHE_PATH = os.environ.get(
+    "API_TOKEN_CACHE_PATH", str(Path(__file__).resolve().parents[2] / ".api_cache" / "tokens.json")
+)
+
+# Ledgers de los recursos creados por la suite y DELETE concurrentes al borrarlos (ver api/utils/cleanup.py)
+API_CLEANUP_DIR = os.environ.get(
+    "API_CLEANUP_DIR", str(Path(__file__).resolve().parents[2] / ".api_cache" / "cleanup")
+)
+API_CLEANUP_CONCURRENCY = int(os.environ.get("API_CLEANUP_CONCURRENCY", "10"))
+
+# Directorio de cassettes para --api-record / --api-replay (ver api/utils/cassettes.py)
+API_CASSETTE_DIR = os.environ.get(
+    "API_CASSETTE_DIR", str(Path(__file__).resolve().parents[2] / ".api_cassettes")
+)
+
+# Resumen de latencias por endpoint que se escribe al terminar la suite (vacío para no escribirlo)
+API_METRICS_PATH = os.environ.get(
+    "API_METRICS_PATH", str(Path(__file__).resolve().parents[2] / "reports" / "api_metrics.json")
+)
+
+# Reintentos de APIClient y de los fixtures (ver api/utils/resilience.py)
+API_MAX_RETRIES = int(os.environ.get("API_MAX_RETRIES", "5"))
+API_RETRY_BASE_DELAY = float(os.environ.get("API_RETRY_BASE_DELAY", "0" if API_BASE_URL == FAKE_API_BASE_URL else "0.5"))
+API_RETRY_MAX_DELAY = float(os.environ.get("API_RETRY_MAX_DELAY", "0" if API_BASE_URL == FAKE_API_BASE_URL else "8"))
+# Presupuesto global: reserva inicial de reintentos y fracción que recupera cada petición
+API_RETRY_BUDGET_RESERVE = int(os.environ.get("API_RETRY_BUDGET_RESERVE", "30"))
+API_RETRY_BUDGET_RATIO = float(os.environ.get("API_RETRY_BUDGET_RATIO", "0.2"))
+# Circuit breaker: llamadas fallidas seguidas (ya reintentadas) de un endpoint para abrirlo y segundos hasta volver a probar
+API_BREAKER_THRESHOLD = int(os.environ.get("API_BREAKER_THRESHOLD", "5"))
+API_BREAKER_RESET_SECONDS = float(os.environ.get("API_BREAKER_RESET_SECONDS", "30"))
+
+# Calentamiento al iniciar la sesión (ver api/utils/warmup.py): conexiones que se
+# pre-abren y segundos máximos que se espera a que el servidor despierte
+API_WARMUP_CONNECTIONS = int(os.environ.get("API_WARMUP_CONNECTIONS", "4"))
+API_WARMUP_TIMEOUT = float(os.environ.get("API_WARMUP_TIMEOUT", "120"))
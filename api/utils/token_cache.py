@@ -0,0 +1,141 @@
+import base64
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from filelock import FileLock
+
+# Margen de seguridad: un token que vence en menos de esto se considera vencido
+EXPIRY_MARGIN_SECONDS = 300
+
+
+def decode_jwt_expiry(token):
+    """
+    Retorna el 'exp' (epoch en segundos) del payload de un JWT, o None si el
+    token no es un JWT o no tiene vencimiento. No valida la firma.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return json.loads(base64.urlsafe_b64decode(payload)).get("exp")
+    except (IndexError, ValueError, AttributeError):
+        return None
+
+
+def is_token_valid(entry, now=None):
+    """Indica si una entrada del caché tiene un token que aún no vence."""
+    if not entry or not entry.get("token"):
+        return False
+    expires_at = entry.get("expires_at")
+    if expires_at is None:
+        return False
+    return expires_at - EXPIRY_MARGIN_SECONDS > (now or time.time())
+
+
+class TokenCache:
+    """
+    Caché en disco de tokens de acceso, compartido entre corridas de pytest y
+    entre workers de xdist. Cada entrada se identifica por (base_url, identidad)
+    y guarda el vencimiento leído del JWT.
+
+    También guarda un pool de usuarios de prueba (passenger/admin) ya creados
+    para reutilizarlos mientras su token siga vigente, ahorrando signup + login.
+
+    Todas las lecturas/escrituras se hacen bajo un file lock y el archivo se
+    reemplaza de forma atómica, así varios procesos pueden usarlo a la vez.
+    """
+
+    def __init__(self, path, persistent=True):
+        self.path = Path(path)
+        # False para los cachés temporales de una sola sesión: su pool muere con la corrida
+        self.persistent = persistent
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = FileLock(f"{self.path}.lock")
+
+    # ---------- Persistencia ----------
+    def _read(self):
+        try:
+            with open(self.path, encoding="utf-8") as cache_file:
+                return json.load(cache_file)
+        except (FileNotFoundError, ValueError):
+            return {"tokens": {}, "users": {}}
+
+    def _write(self, data):
+        fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=".tokens-", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+            json.dump(data, tmp_file)
+        os.replace(tmp_path, self.path)
+
+    @staticmethod
+    def _key(base_url, identity):
+        return f"{base_url}|{identity}"
+
+    # ---------- Tokens ----------
+    def get_token(self, base_url, identity):
+        """Retorna el token vigente de la identidad o None."""
+        with self._lock:
+            entry = self._read()["tokens"].get(self._key(base_url, identity))
+        return entry["token"] if is_token_valid(entry) else None
+
+    def get_or_login(self, base_url, identity, login):
+        """
+        Retorna el token cacheado de la identidad o llama a 'login()' para obtener
+        uno nuevo y guardarlo. El lock se mantiene durante el login para que varios
+        workers no hagan login a la vez con la misma identidad.
+        """
+        key = self._key(base_url, identity)
+        with self._lock:
+            data = self._read()
+            entry = data["tokens"].get(key)
+            if is_token_valid(entry):
+                return entry["token"]
+
+            token = login()
+            data = self._read()
+            data["tokens"][key] = {"token": token, "expires_at": decode_jwt_expiry(token)}
+            self._write(data)
+            return token
+
+    # ---------- Pool de usuarios ----------
+    def claim_user(self, base_url, role):
+        """
+        Saca del pool un usuario con token vigente para 'role' y lo retorna, o None.
+        Los usuarios con token vencido se descartan.
+        """
+        key = self._key(base_url, role)
+        with self._lock:
+            data = self._read()
+            users = data["users"].get(key, [])
+            claimed = None
+            while users and claimed is None:
+                candidate = users.pop(0)
+                if is_token_valid(candidate):
+                    claimed = candidate
+            data["users"][key] = users
+            self._write(data)
+        if claimed is None:
+            return None
+        claimed.pop("expires_at", None)
+        return claimed
+
+    def release_user(self, base_url, role, user_info):
+        """
+        Devuelve (o agrega) un usuario al pool para que otro test/corrida lo reutilice.
+        Retorna False si no se guardó porque su token ya venció.
+        """
+        entry = dict(user_info)
+        entry["expires_at"] = decode_jwt_expiry(entry.get("token"))
+        if not is_token_valid(entry):
+            return False
+        key = self._key(base_url, role)
+        with self._lock:
+            data = self._read()
+            data["users"].setdefault(key, []).append(entry)
+            self._write(data)
+        return True
+
+    def clear(self):
+        with self._lock:
+            self._write({"tokens": {}, "users": {}})
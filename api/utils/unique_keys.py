@@ -0,0 +1,98 @@
+"""
+Claves únicas deterministas para los campos que la API exige únicos
+(email, iata_code, tail_number), en lugar de sortearlas con Faker y
+reintentar cuando chocan.
+
+Cada clave sale de tres partes:
+  - RUN_ID: segundos desde la época en base 36 (6 caracteres). Se fija al
+    importar y se deja en el entorno (API_RUN_ID), así los workers de xdist
+    que lanza esta corrida heredan el mismo.
+  - El índice del worker de xdist (0 fuera de xdist).
+  - Un contador monótono por campo.
+
+Los emails y tail numbers incluyen las tres partes: no se repiten dentro de
+la corrida, entre workers ni entre corridas. El iata_code tiene solo 3 letras
+(17.576 códigos): ahí el contador recorre una permutación de todo el espacio
+que arranca en un punto distinto según RUN_ID, con los workers intercalados,
+así una corrida no repite códigos hasta agotar el espacio (lo que sí puede
+pasar es que el código ya exista de corridas anteriores).
+"""
+import itertools
+import os
+import string
+import threading
+import time
+
+from api.utils import workers
+
+DIGITS = string.digits + string.ascii_uppercase
+
+# Restricciones de cada campo en la API: alfabeto y largo
+FIELDS = {
+    "iata_code": {"alphabet": string.ascii_uppercase, "min_length": 3, "max_length": 3},
+    "tail_number": {"alphabet": DIGITS, "min_length": 5, "max_length": 10},
+}
+EMAIL_DOMAIN = "example.com"
+
+
+def to_base(number, alphabet, length):
+    """'number' escrito con 'alphabet' en exactamente 'length' caracteres."""
+    base = len(alphabet)
+    if number < 0 or number >= base ** length:
+        raise ValueError(f"❌ {number} no entra en {length} caracteres de base {base}")
+    digits = []
+    for _ in range(length):
+        number, digit = divmod(number, base)
+        digits.append(alphabet[digit])
+    return "".join(reversed(digits))
+
+
+RUN_ID = os.environ.setdefault("API_RUN_ID", to_base(int(time.time()), DIGITS, 6))
+WORKER_INDEX = int(workers.WORKER_ID[2:]) if workers.is_worker() else 0
+if WORKER_INDEX >= len(DIGITS):
+    raise RuntimeError(f"❌ unique_keys soporta hasta {len(DIGITS)} workers de xdist")
+
+# Contador por campo: la secuencia de un campo no gasta claves de otro
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def next_index(field):
+    with _counters_lock:
+        counter = _counters.setdefault(field, itertools.count())
+    return next(counter)
+
+
+def run_key(field, length):
+    """RUN_ID + worker + contador del campo, en base 36 y con 'length' caracteres (mínimo 8)."""
+    counter_length = length - len(RUN_ID) - 1
+    index = next_index(field)
+    if counter_length < 1 or index >= len(DIGITS) ** counter_length:
+        raise RuntimeError(f"❌ Se agotaron las claves de {field} para esta corrida ({index} generadas)")
+    return RUN_ID + DIGITS[WORKER_INDEX] + to_base(index, DIGITS, counter_length)
+
+
+def email(prefix="qa"):
+    """Email único: <prefix>.<run><worker><contador>@example.com."""
+    return f"{prefix}.{run_key('email', 12).lower()}@{EMAIL_DOMAIN}"
+
+
+def tail_number():
+    """tail_number único con el largo máximo permitido (10 caracteres)."""
+    return run_key("tail_number", FIELDS["tail_number"]["max_length"])
+
+
+def iata_code():
+    """
+    Código IATA de la permutación de esta corrida: el contador se intercala entre
+    workers (worker + n * workers) y se desordena multiplicando por un número
+    coprimo con el tamaño del espacio, que es una biyección.
+    """
+    rule = FIELDS["iata_code"]
+    space = len(rule["alphabet"]) ** rule["max_length"]
+    position = WORKER_INDEX + next_index("iata_code") * workers.WORKER_COUNT
+    if position >= space:
+        raise RuntimeError(f"❌ Se agotaron los {space} códigos IATA en esta corrida")
+    offset = int(RUN_ID, 36) % space
+    # 7919 es primo y no divide a 26**3 = 2**3 * 13**3
+    return to_base((offset + position) * 7919 % space, rule["alphabet"], rule["max_length"])
@@ -0,0 +1,158 @@
+"""
+Calentamiento de la API al iniciar la sesión de pytest.
+
+La API vive en un host gratuito que se duerme: la primera petición de la corrida
+puede tardar decenas de segundos mientras el servidor arranca, y los reintentos de
+los fixtures se gastan esperándolo. Mientras pytest recolecta los tests:
+
+- un probe barato (GET /airports?limit=1) se repite hasta que el servidor
+  responde sin 5xx; lo que tarda es la latencia de arranque en frío;
+- después se resuelve el DNS y se lanzan varios probes a la vez, que dejan
+  abiertas otras tantas conexiones TCP+TLS en el pool compartido (session_pool)
+  para los primeros fixtures.
+
+Las peticiones van por una requests.Session sobre el mismo adaptador que usa
+APIClient, pero no pasan por APIClient (no gastan reintentos) ni por el
+adaptador de cassettes (no quedan grabadas).
+"""
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+import requests
+
+from api.utils import metrics, settings
+from api.utils.session_pool import get_session
+
+PROBE_PATH = "/airports?limit=1"
+
+
+class WarmUp:
+    """
+    Con probe=False solo se pre-abren las conexiones (p. ej. en los workers de
+    xdist, cuando el proceso principal ya despertó la API).
+    """
+
+    def __init__(self, base_url, connections=settings.API_WARMUP_CONNECTIONS,
+                 timeout=settings.API_WARMUP_TIMEOUT, probe=True):
+        self.base_url = base_url.rstrip("/")
+        self.connections = connections
+        self.timeout = timeout
+        self.probe = probe
+        self.report = {}
+        self._thread = None
+
+    def start(self):
+        """Lanza el calentamiento en segundo plano y retorna self."""
+        self._thread = threading.Thread(target=self.run, name="api-warmup", daemon=True)
+        self._thread.start()
+        return self
+
+    def wait(self):
+        """Espera a que termine el calentamiento y retorna el reporte."""
+        if self._thread is not None:
+            self._thread.join()
+        return self.report
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            session = self._session()
+            if self.probe:
+                self.report.update(self._probe(session))
+            if not self.probe or self.report["ready"]:
+                self.report.update(self._preconnect(session))
+        except Exception as err:
+            # El calentamiento es una optimización: si falla, los tests siguen como siempre
+            self.report["error"] = f"{type(err).__name__}: {err}"
+            print(f"⚠️ Warm-up de la API falló: {err}")
+        self.report["total_ms"] = round((time.perf_counter() - started) * 1000, 1)
+        return self.report
+
+    def _session(self):
+        """Sesión sobre el adaptador (y el pool) que usará APIClient para base_url."""
+        session = get_session(self.base_url)
+        adapter = session.get_adapter(self.base_url)
+        # En modo --api-record el adaptador envuelve al real: el warm-up no se graba
+        session.mount(self.base_url, getattr(adapter, "inner", adapter))
+        return session
+
+    def _get(self, session, timeout):
+        return session.get(
+            self.base_url + PROBE_PATH, timeout=timeout, allow_redirects=False,
+            headers={"Accept": "application/json"},
+        )
+
+    def _probe(self, session):
+        """Repite el probe hasta que el servidor responda sin 5xx (o se acabe el tiempo)."""
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        attempts = 0
+        status = None
+        while True:
+            attempts += 1
+            remaining = max(deadline - time.perf_counter(), 1)
+            try:
+                status = self._get(session, timeout=(min(10, remaining), remaining)).status_code
+            except requests.RequestException as err:
+                status = type(err).__name__
+            if isinstance(status, int) and status < 500:
+                break
+            if time.perf_counter() >= deadline:
+                print(f"⚠️ La API no respondió al warm-up en {self.timeout:.0f}s (último resultado: {status})")
+                break
+            time.sleep(1)
+        return {
+            "ready": isinstance(status, int) and status < 500,
+            "probe_status": status,
+            "probe_attempts": attempts,
+            "cold_start_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+
+    def _preconnect(self, session):
+        """
+        Resuelve el DNS y lanza 'connections' probes a la vez: como ninguno
+        encuentra una conexión libre, cada uno abre la suya y al terminar queda
+        en el pool.
+        """
+        url = urlsplit(self.base_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        started = time.perf_counter()
+        socket.getaddrinfo(url.hostname, port, type=socket.SOCK_STREAM)
+        dns_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        count = max(0, min(self.connections, settings.API_POOL_MAXSIZE))
+        if not count:
+            return {"dns_ms": dns_ms, "preconnected": 0}
+        barrier = threading.Barrier(count)
+        timings = [None] * count
+
+        def open_connection(index):
+            metrics.reset_connection_timings()
+            try:
+                # Todos salen juntos para que ninguno reutilice la conexión de otro
+                barrier.wait(timeout=self.timeout)
+                self._get(session, timeout=(10, self.timeout))
+            except (requests.RequestException, threading.BrokenBarrierError) as err:
+                print(f"⚠️ Warm-up: no se pudo pre-abrir una conexión: {err}")
+                return
+            # Vacío si el probe reutilizó la conexión que dejó abierta el probe de arranque
+            timings[index] = metrics.pop_connection_timings()
+
+        threads = [
+            threading.Thread(target=open_connection, args=(index,), name=f"api-preconnect-{index}")
+            for index in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        opened = [timing for timing in timings if timing is not None]
+        handshakes = [timing["connect"] + (timing["tls"] or 0) for timing in opened if timing]
+        return {
+            "dns_ms": dns_ms,
+            "preconnected": len(opened),
+            "handshake_ms": round(max(handshakes) * 1000, 1) if handshakes else None,
+        }
@@ -0,0 +1,78 @@
+"""
+Soporte para correr la suite en paralelo con pytest-xdist (pytest -n auto).
+
+- Recursos de sesión compartidos: el primer worker que pide un recurso lo crea
+  bajo un file lock y lo deja en disco; el resto lo lee en vez de crearlo otra vez.
+- Grupos de scheduling (--dist loadgroup) según la cadena de fixtures del test.
+"""
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from filelock import FileLock
+
+# xdist define estas variables en cada worker ("gw0", "gw1"...); fuera de xdist no existen
+WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER")
+WORKER_COUNT = int(os.environ.get("PYTEST_XDIST_WORKER_COUNT", "1"))
+
+# Cadenas de fixtures caras cuyo estado caliente vive dentro del worker, de la más
+# específica a la más general. Todos los tests de una cadena van a un mismo worker
+# (un xdist_group por cadena), que la calienta una sola vez. El costo es que una
+# cadena no se reparte entre workers. El token de admin, el aeropuerto, la aeronave
+# y el pool de usuarios no están acá: ya se comparten entre workers por disco
+# (SharedResources y el caché de tokens), así que agruparlos solo los serializaría.
+FIXTURE_CHAINS = [
+    ("warehouse", {"resource_warehouse"}),
+]
+
+
+def is_worker() -> bool:
+    return WORKER_ID is not None
+
+
+def fixture_chain(fixturenames):
+    """Nombre de la primera cadena de FIXTURE_CHAINS que usa el test (o None)."""
+    names = set(fixturenames)
+    for chain, fixtures in FIXTURE_CHAINS:
+        if names & fixtures:
+            return chain
+    return None
+
+
+def scheduling_group(fixturenames):
+    """Grupo xdist_group del test: el nombre de su cadena, o None si no usa ninguna."""
+    return fixture_chain(fixturenames)
+
+
+# ---------- Recursos de sesión compartidos ----------
+class SharedResources:
+    """
+    Recursos de sesión que se crean una sola vez para todos los workers.
+
+    Cada recurso es un JSON en 'root' (un directorio propio de la corrida). El primer
+    worker que llega toma el lock, llama a factory() y escribe el resultado; los
+    demás esperan el lock y leen lo escrito. Si factory() falla no se escribe nada
+    y el siguiente worker vuelve a intentarlo.
+    """
+
+    def __init__(self, root):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.created = []
+
+    def get_or_create(self, name, factory):
+        path = self.root / f"{name}.json"
+        with FileLock(f"{path}.lock"):
+            try:
+                with open(path, encoding="utf-8") as shared_file:
+                    return json.load(shared_file)
+            except FileNotFoundError:
+                pass
+            value = factory()
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, prefix=f".{name}-", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as tmp_file:
+                json.dump(value, tmp_file)
+            os.replace(tmp_path, path)
+            self.created.append(name)
+            return value